@@ -0,0 +1,47 @@
+"""Compare upload size and deploy time with and without request body compression.
+
+Run with:
+    python -m benchmarks.bench_compression [--bandwidth-mbit 20]
+"""
+
+import argparse
+import time
+
+from tadata_sdk.http.client import ApiClient
+from tadata_sdk.http.compression import is_available
+from tadata_sdk.http.schemas import UpsertDeploymentRequest
+from tadata_sdk.openapi.source import OpenAPISpec
+
+from benchmarks.common import stand_in_server, synthetic_spec
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bandwidth-mbit", type=float, default=20.0, help="Simulated upload bandwidth in Mbit/s")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    modes = ["none", "gzip"] + [m for m in ("zstd", "br") if is_available(m)]
+    bytes_per_second = args.bandwidth_mbit * 1_000_000 / 8
+
+    print(f"{'operations':>10} {'mode':>5} {'sent bytes':>12} {'ratio':>6} {'seconds':>8}")
+    for operations in (200, 2_000, 20_000):
+        spec = OpenAPISpec.from_dict(synthetic_spec(operations, schemas=50))
+        request = UpsertDeploymentRequest(openApiSpec=spec, name=None, baseUrl=None)
+        with stand_in_server(upload_bytes_per_second=bytes_per_second) as server:
+            baseline = None
+            for mode in modes:
+                client = ApiClient(api_key="benchmark", base_url=server.url, compression=mode)  # type: ignore[arg-type]
+                timings = []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    client.deploy_from_openapi(request)
+                    timings.append(time.perf_counter() - started)
+                client.close()
+                sent = server.received[-1]["bytes"]
+                baseline = baseline or sent
+                print(f"{operations:>10} {mode:>5} {sent:>12} {sent / baseline:>6.2f} {min(timings):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
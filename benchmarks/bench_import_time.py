@@ -0,0 +1,46 @@
+"""Measure the cold-start cost of importing the SDK.
+
+Each statement runs in a fresh interpreter, and the time of an empty interpreter start is
+subtracted, so the numbers are what the SDK adds to a serverless function or CLI start.
+tests/test_imports.py guards the lazy imports; this benchmark shows what they are worth.
+
+Run with:
+    python -m benchmarks.bench_import_time
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+
+_YAML_SPEC = "{openapi: 3.0.0, info: {title: T, version: v1}, paths: {}}"
+
+STATEMENTS = [
+    "import tadata_sdk",
+    "from tadata_sdk import OpenAPISpec",
+    "from tadata_sdk import deploy",
+    "import tadata_sdk; tadata_sdk.__version__",
+    f"from tadata_sdk import OpenAPISpec; OpenAPISpec.from_yaml({_YAML_SPEC!r})",
+]
+
+
+def _median_run_time(statement: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main(repeat: int = 15) -> None:
+    baseline = _median_run_time("pass", repeat)
+    print(f"Interpreter start: {baseline * 1000:.1f} ms (subtracted below)")
+    for statement in STATEMENTS:
+        elapsed = _median_run_time(statement, repeat) - baseline
+        print(f"{elapsed * 1000:>8.1f} ms  {statement}")
+
+
+if __name__ == "__main__":
+    main()
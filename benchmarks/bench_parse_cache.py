@@ -0,0 +1,63 @@
+"""Compare OpenAPISpec.from_file with and without a ParsedSpecCache hit.
+
+Each run loads the same file. Both columns time the whole of `from_file()`, up to a
+validated OpenAPISpec: the cold column parses and validates the file every time, the hit
+column loads the spec a previous run stored in the cache. The validate column is the time
+`from_dict()` takes to validate the parsed document alone, which hits skip.
+
+The cache pays off for YAML. JSON files only use it with the json module backend; with
+orjson or msgspec they bypass it, and their hit column is empty. Compare the backends with:
+    TADATA_JSON_BACKEND=json python -m benchmarks.bench_parse_cache
+
+Run with:
+    python -m benchmarks.bench_parse_cache
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+import yaml
+
+from tadata_sdk.json_backend import BACKEND_NAME
+from tadata_sdk.openapi.parse_cache import ParsedSpecCache
+from tadata_sdk.openapi.source import YAML_LOADER_NAME, OpenAPISpec
+
+from benchmarks.common import synthetic_spec
+
+
+def _best_of(runs: int, load: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        load()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    print(f"JSON backend: {BACKEND_NAME}, YAML loader: {YAML_LOADER_NAME}")
+    print(f"{'file':>16} {'MiB':>6} {'cold ms':>10} {'hit ms':>8} {'validate ms':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ParsedSpecCache(Path(directory) / "cache")
+        for operations in (2_000, 20_000):
+            spec = synthetic_spec(operations, schemas=operations // 10)
+            for suffix in (".json", ".yaml"):
+                path = Path(directory) / f"spec-{operations}{suffix}"
+                path.write_text(json.dumps(spec) if suffix == ".json" else yaml.safe_dump(spec))
+                runs = 3 if suffix == ".yaml" else 10
+                cold = _best_of(runs, lambda: OpenAPISpec.from_file(path))
+                OpenAPISpec.from_file(path, cache=cache)
+                validate = _best_of(runs, lambda: OpenAPISpec.from_dict(spec))
+                size = path.stat().st_size / 1024 / 1024
+                if suffix == ".json" and BACKEND_NAME != "json":
+                    hit_column = f"{'-':>8}"
+                else:
+                    hit_column = f"{_best_of(runs, lambda: OpenAPISpec.from_file(path, cache=cache)):>8.1f}"
+                print(f"{path.name:>16} {size:>6.1f} {cold:>10.1f} {hit_column} {validate:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
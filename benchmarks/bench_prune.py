@@ -0,0 +1,65 @@
+"""Compare upload size and deploy time with and without pruning unused components.
+
+Generated specs often carry many schemas no operation uses. Each spec here has operations
+referencing a few schemas, plus many unused schemas referencing each other.
+
+Run with:
+    python -m benchmarks.bench_prune [--bandwidth-mbit 20]
+"""
+
+import argparse
+import time
+from typing import Any, Dict
+
+from tadata_sdk.http.client import ApiClient
+from tadata_sdk.http.schemas import UpsertDeploymentRequest
+from tadata_sdk.openapi.source import OpenAPISpec
+
+from benchmarks.common import stand_in_server, synthetic_spec
+
+
+def _spec_with_unused_schemas(operations: int, unused: int) -> Dict[str, Any]:
+    spec = synthetic_spec(operations, schemas=50)
+    schemas = spec["components"]["schemas"]
+    for i in range(unused):
+        schemas[f"Unused{i}"] = {
+            "type": "object",
+            "description": f"Generated model {i} that no operation returns",
+            "properties": {
+                "id": {"type": "string"},
+                "parent": {"$ref": f"#/components/schemas/Unused{(i + 1) % unused}"},
+                "model": {"$ref": f"#/components/schemas/Model{i % 50}"},
+            },
+        }
+    return spec
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bandwidth-mbit", type=float, default=20.0, help="Simulated upload bandwidth in Mbit/s")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    bytes_per_second = args.bandwidth_mbit * 1_000_000 / 8
+
+    print(f"{'operations':>10} {'unused':>7} {'pruned':>6} {'prune ms':>9} {'sent bytes':>11} {'seconds':>8}")
+    for operations, unused in ((500, 5_000), (2_000, 20_000), (2_000, 100_000)):
+        source = _spec_with_unused_schemas(operations, unused)
+        with stand_in_server(upload_bytes_per_second=bytes_per_second) as server:
+            client = ApiClient(api_key="benchmark", base_url=server.url, compression="none")
+            for prune in (False, True):
+                timings, prune_ms = [], 0.0
+                for _ in range(args.repeat):
+                    spec = OpenAPISpec.from_dict(source)
+                    started = time.perf_counter()
+                    if prune:
+                        spec.prune_unused_components()
+                        prune_ms = (time.perf_counter() - started) * 1000
+                    client.deploy_from_openapi(UpsertDeploymentRequest(openApiSpec=spec, name=None, baseUrl=None))
+                    timings.append(time.perf_counter() - started)
+                sent = server.received[-1]["bytes"]
+                print(f"{operations:>10} {unused:>7} {prune!s:>6} {prune_ms:>9.1f} {sent:>11} {min(timings):>8.3f}")
+            client.close()
+
+
+if __name__ == "__main__":
+    main()
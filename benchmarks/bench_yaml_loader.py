@@ -0,0 +1,42 @@
+"""Compare PyYAML's pure-Python SafeLoader with libyaml's CSafeLoader on synthetic specs.
+
+Run with:
+    python -m benchmarks.bench_yaml_loader
+"""
+
+import time
+from typing import Any, Callable
+
+import yaml
+
+from tadata_sdk.openapi.source import YAML_LOADER_NAME
+
+from benchmarks.common import synthetic_spec
+
+
+def _best_of(repeat: int, func: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    print(f"OpenAPISpec.from_yaml uses {YAML_LOADER_NAME}")
+    if not hasattr(yaml, "CSafeLoader"):
+        print("PyYAML was built without libyaml, only SafeLoader is available")
+        return
+
+    print(f"{'operations':>10} {'lines':>8} {'SafeLoader':>11} {'CSafeLoader':>12} {'speedup':>8}")
+    for operations in (100, 1_000, 3_000):
+        document = yaml.dump(synthetic_spec(operations, schemas=operations // 10), sort_keys=False)
+        pure = _best_of(3, lambda: yaml.load(document, Loader=yaml.SafeLoader))
+        native = _best_of(3, lambda: yaml.load(document, Loader=yaml.CSafeLoader))
+        lines = document.count("\n")
+        print(f"{operations:>10} {lines:>8} {pure:>10.3f}s {native:>11.3f}s {pure / native:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
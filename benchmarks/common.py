@@ -0,0 +1,121 @@
+"""Helpers shared by the benchmarks: synthetic specs and a local stand-in for the Tadata API."""
+
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+def synthetic_spec(operations: int, schemas: int = 0) -> Dict[str, Any]:
+    """Build an OpenAPI spec with the given number of operations and component schemas."""
+    paths: Dict[str, Any] = {}
+    for i in range(operations):
+        schema_ref = {"$ref": f"#/components/schemas/Model{i % schemas}"} if schemas else {"type": "object"}
+        paths[f"/resources-{i}/{{id}}"] = {
+            "get": {
+                "operationId": f"getResource{i}",
+                "summary": f"Get resource {i}",
+                "description": f"Returns resource {i} identified by its id. " * 3,
+                "tags": [f"tag-{i % 20}"],
+                "parameters": [{"name": "id", "in": "path", "required": True, "schema": {"type": "string"}}],
+                "responses": {
+                    "200": {"description": "OK", "content": {"application/json": {"schema": schema_ref}}},
+                    "404": {"description": "Not found"},
+                },
+            }
+        }
+    spec: Dict[str, Any] = {
+        "openapi": "3.0.3",
+        "info": {"title": "Synthetic API", "version": "1.0.0"},
+        "servers": [{"url": "https://api.example.com"}],
+        "paths": paths,
+    }
+    if schemas:
+        spec["components"] = {
+            "schemas": {
+                f"Model{i}": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string"},
+                        "name": {"type": "string", "description": f"Name of model {i}"},
+                        "count": {"type": "integer", "format": "int64"},
+                    },
+                }
+                for i in range(schemas)
+            }
+        }
+    return spec
+
+
+class StandInServer:
+    """Records what the local stand-in server received."""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.received: List[Dict[str, Any]] = []
+
+
+DEPLOYMENT_RESPONSE = {
+    "ok": True,
+    "status": 201,
+    "data": {"updated": True, "deployment": {"id": "benchmark-deployment"}},
+}
+
+
+def _decode(body: bytes, encoding: Optional[str]) -> bytes:
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "zstd":
+        import zstandard  # type: ignore[import]
+
+        return bytes(zstandard.ZstdDecompressor().decompressobj().decompress(body))
+    if encoding == "br":
+        import brotli  # type: ignore[import]
+
+        return bytes(brotli.decompress(body))
+    return body
+
+
+@contextmanager
+def stand_in_server(
+    upload_bytes_per_second: Optional[float] = None,
+    respond: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+) -> Iterator[StandInServer]:
+    """Run a local HTTP server that accepts deployments like the Tadata API.
+
+    Args:
+        upload_bytes_per_second: If set, the server sleeps as if the request body had been
+            uploaded over a link of this bandwidth, to imitate a slow CI runner.
+        respond: Optional function building the JSON response from the decoded request body.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length)
+            if upload_bytes_per_second:
+                time.sleep(len(body) / upload_bytes_per_second)
+            payload = json.loads(_decode(body, self.headers.get("Content-Encoding")))
+            server.received.append({"bytes": len(body), "encoding": self.headers.get("Content-Encoding")})
+            response = json.dumps(respond(payload) if respond else DEPLOYMENT_RESPONSE).encode()
+            self.send_response(201)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response)))
+            self.end_headers()
+            self.wfile.write(response)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server = StandInServer(f"http://127.0.0.1:{httpd.server_address[1]}")
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
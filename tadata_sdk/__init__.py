@@ -1,17 +1,102 @@
-try:
-    from importlib.metadata import version
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-    __version__ = version("tadata-sdk")
-except Exception:  # pragma: no cover
-    # Fallback for local development
-    __version__ = "0.0.0.dev0"  # pragma: no cover
+if TYPE_CHECKING:
+    from .core.bulk import DeploymentItem, deploy_many, deploy_many_async
+    from .core.client import TadataClient
+    from .core.ledger import DeploymentLedger
+    from .core.sdk import deploy, deploy_async
+    from .http.circuit import CircuitBreaker
+    from .http.hedging import HedgingPolicy
+    from .http.retry import RetryPolicy
+    from .http.schemas import AuthConfig
+    from .openapi.bundle import bundle_spec
+    from .openapi.canonical import canonical_hash, canonical_json
+    from .openapi.fetcher import AsyncSpecFetcher, SpecFetcher
+    from .openapi.filter import OperationFilter
+    from .openapi.http_cache import HTTPSpecCache
+    from .openapi.index import SpecIndex
+    from .openapi.parse_cache import ParsedSpecCache
+    from .openapi.prune import PruneReport
+    from .openapi.source import OpenAPISpec
 
-from .core.sdk import deploy
-from .http.schemas import AuthConfig
-from .openapi.source import OpenAPISpec
+    __version__: str
+
+# Public names and the modules defining them. They are imported on first access, so that
+# `import tadata_sdk` stays cheap and e.g. working with OpenAPISpec never imports httpx.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "deploy": ".core.sdk",
+    "deploy_async": ".core.sdk",
+    "deploy_many": ".core.bulk",
+    "deploy_many_async": ".core.bulk",
+    "DeploymentItem": ".core.bulk",
+    "TadataClient": ".core.client",
+    "DeploymentLedger": ".core.ledger",
+    "OpenAPISpec": ".openapi.source",
+    "HTTPSpecCache": ".openapi.http_cache",
+    "bundle_spec": ".openapi.bundle",
+    "canonical_hash": ".openapi.canonical",
+    "canonical_json": ".openapi.canonical",
+    "SpecIndex": ".openapi.index",
+    "OperationFilter": ".openapi.filter",
+    "PruneReport": ".openapi.prune",
+    "ParsedSpecCache": ".openapi.parse_cache",
+    "SpecFetcher": ".openapi.fetcher",
+    "AsyncSpecFetcher": ".openapi.fetcher",
+    "AuthConfig": ".http.schemas",
+    "RetryPolicy": ".http.retry",
+    "CircuitBreaker": ".http.circuit",
+    "HedgingPolicy": ".http.hedging",
+}
 
 __all__ = [
     "deploy",
+    "deploy_async",
+    "deploy_many",
+    "deploy_many_async",
+    "DeploymentItem",
+    "TadataClient",
+    "DeploymentLedger",
     "OpenAPISpec",
+    "HTTPSpecCache",
+    "bundle_spec",
+    "canonical_hash",
+    "canonical_json",
+    "SpecIndex",
+    "OperationFilter",
+    "PruneReport",
+    "ParsedSpecCache",
+    "SpecFetcher",
+    "AsyncSpecFetcher",
     "AuthConfig",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "HedgingPolicy",
 ]
+
+
+def _package_version() -> str:
+    # importlib.metadata scans every installed distribution, so it is only imported when asked for
+    try:
+        from importlib.metadata import version
+
+        return version("tadata-sdk")
+    except Exception:  # pragma: no cover
+        # Fallback for local development
+        return "0.0.0.dev0"
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        value: Any = _package_version()
+    elif name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache the value, so later lookups do not go through __getattr__ again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS, "__version__"})
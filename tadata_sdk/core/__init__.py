@@ -1,3 +1,45 @@
-from .sdk import deploy
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-__all__ = ["deploy"]
+if TYPE_CHECKING:
+    from .bulk import BatchDeploymentSummary, BatchItemResult, DeploymentItem, deploy_many, deploy_many_async
+    from .client import TadataClient
+    from .ledger import DeploymentLedger
+    from .sdk import deploy, deploy_async
+
+# Submodules are imported on first access, see tadata_sdk/__init__.py
+_LAZY_IMPORTS: Dict[str, str] = {
+    "deploy": ".sdk",
+    "deploy_async": ".sdk",
+    "deploy_many": ".bulk",
+    "deploy_many_async": ".bulk",
+    "TadataClient": ".client",
+    "DeploymentLedger": ".ledger",
+    "DeploymentItem": ".bulk",
+    "BatchItemResult": ".bulk",
+    "BatchDeploymentSummary": ".bulk",
+}
+
+__all__ = [
+    "deploy",
+    "deploy_async",
+    "deploy_many",
+    "deploy_many_async",
+    "TadataClient",
+    "DeploymentLedger",
+    "DeploymentItem",
+    "BatchItemResult",
+    "BatchDeploymentSummary",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -0,0 +1,446 @@
+"""Bulk deployment of many OpenAPI specifications with bounded concurrency."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Union
+from typing_extensions import Annotated, Doc
+
+import httpx
+
+from ..http.circuit import CircuitBreaker
+from ..http.client import ApiClient, AsyncApiClient
+from ..http.deadline import Deadline, TimeoutTypes
+from ..http.retry import RequestStats, RetryPolicy
+from ..http.schemas import AuthConfig
+from ..openapi.fetcher import AsyncSpecFetcher, SpecFetcher
+from ..openapi.http_cache import HTTPSpecCache
+from ..openapi.source import OpenAPISpec
+from .ledger import DeploymentLedger
+from .sdk import (
+    DeploymentResult,
+    _deployment_result,
+    _ledger_lookup,
+    _ledger_record,
+    _prepare_request,
+    _prepare_request_async,
+    _validate_spec_sources,
+)
+
+
+logger = logging.getLogger(__name__)
+
+SpecSource = Union[str, Path, Dict[str, Any], OpenAPISpec]
+
+
+class DeploymentItem:
+    """A single deployment in a bulk deploy.
+
+    Exactly one of openapi_spec_path, openapi_spec_url, or openapi_spec must be provided.
+    """
+
+    def __init__(
+        self,
+        *,
+        openapi_spec_path: Annotated[Optional[str], Doc("Path to an OpenAPI specification file (JSON or YAML)")] = None,
+        openapi_spec_url: Annotated[Optional[str], Doc("URL to an OpenAPI specification")] = None,
+        openapi_spec: Annotated[
+            Optional[Union[Dict[str, Any], OpenAPISpec]],
+            Doc("OpenAPI specification as a dictionary or OpenAPISpec object"),
+        ] = None,
+        name: Annotated[Optional[str], Doc("Optional name for the deployment")] = None,
+        base_url: Annotated[Optional[str], Doc("Base URL of the API to proxy requests to")] = None,
+        auth_config: Annotated[
+            Optional[AuthConfig], Doc("Configuration for authentication handling between the MCP and your API")
+        ] = None,
+        spec_passthrough: Annotated[
+            bool, Doc("Upload the JSON file at openapi_spec_path byte-for-byte, without parsing or validating it")
+        ] = False,
+    ) -> None:
+        _validate_spec_sources(openapi_spec_path, openapi_spec_url, openapi_spec)
+        if spec_passthrough and openapi_spec_path is None:
+            raise ValueError("spec_passthrough can only be used with openapi_spec_path")
+        self.openapi_spec_path = openapi_spec_path
+        self.openapi_spec_url = openapi_spec_url
+        self.openapi_spec = openapi_spec
+        self.name = name
+        self.base_url = base_url
+        self.auth_config = auth_config
+        self.spec_passthrough = spec_passthrough
+
+    @classmethod
+    def from_source(cls, source: Union["DeploymentItem", SpecSource]) -> "DeploymentItem":
+        """Create a DeploymentItem from a bare spec source.
+
+        Strings starting with ``http://`` or ``https://`` are treated as URLs, other strings
+        and paths as files.
+
+        Args:
+            source: A DeploymentItem, a file path, a URL, a dictionary or an OpenAPISpec.
+
+        Returns:
+            A DeploymentItem for the source.
+        """
+        if isinstance(source, DeploymentItem):
+            return source
+        if isinstance(source, Path):
+            return cls(openapi_spec_path=str(source))
+        if isinstance(source, str):
+            if source.startswith(("http://", "https://")):
+                return cls(openapi_spec_url=source)
+            return cls(openapi_spec_path=source)
+        return cls(openapi_spec=source)
+
+    @property
+    def label(self) -> str:
+        """A short human-readable description of the item, used in logs."""
+        if self.name is not None:
+            return self.name
+        if self.openapi_spec_path is not None:
+            return self.openapi_spec_path
+        if self.openapi_spec_url is not None:
+            return self.openapi_spec_url
+        return "<inline spec>"
+
+
+class BatchItemResult:
+    """Outcome of one item of a bulk deployment."""
+
+    def __init__(
+        self,
+        index: int,
+        item: DeploymentItem,
+        elapsed: float,
+        result: Optional[DeploymentResult] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Initialize a batch item result.
+
+        Args:
+            index: Position of the item in the input sequence.
+            item: The deployed item.
+            elapsed: Wall-clock seconds spent loading and deploying the item.
+            result: The deployment result, if the item succeeded.
+            error: The exception raised for the item, if it failed.
+        """
+        self.index = index
+        self.item = item
+        self.elapsed = elapsed
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was deployed successfully."""
+        return self.error is None
+
+    def __str__(self) -> str:
+        """Return a string representation of the batch item result."""
+        outcome = f"id={self.result.id}" if self.result is not None else f"error={self.error!r}"
+        return f"BatchItemResult(index={self.index}, {outcome}, elapsed={self.elapsed:.3f}s)"
+
+
+class BatchDeploymentSummary:
+    """Summary of a bulk deployment."""
+
+    def __init__(self, results: List[BatchItemResult], elapsed: float) -> None:
+        """Initialize a batch deployment summary.
+
+        Args:
+            results: Per-item results, in any order.
+            elapsed: Wall-clock seconds for the whole batch.
+        """
+        self.results = sorted(results, key=lambda r: r.index)
+        self.elapsed = elapsed
+
+    @property
+    def succeeded(self) -> List[BatchItemResult]:
+        """Items that were deployed successfully."""
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> List[BatchItemResult]:
+        """Items that failed to deploy."""
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def timings(self) -> Dict[int, float]:
+        """Seconds spent on each item, keyed by item index."""
+        return {r.index: r.elapsed for r in self.results}
+
+    def __str__(self) -> str:
+        """Return a string representation of the batch summary."""
+        return (
+            f"BatchDeploymentSummary(total={len(self.results)}, succeeded={len(self.succeeded)}, "
+            f"failed={len(self.failed)}, elapsed={self.elapsed:.3f}s)"
+        )
+
+
+def deploy_many(
+    items: Annotated[
+        Sequence[Union[DeploymentItem, SpecSource]],
+        Doc("Deployments to run: DeploymentItem objects or bare spec sources (path, URL, dict or OpenAPISpec)"),
+    ],
+    *,
+    api_key: Annotated[str, Doc("Tadata API key for authentication")],
+    api_version: Annotated[Literal["05-2025", "latest"], Doc("Tadata API version")] = "latest",
+    timeout: Annotated[
+        TimeoutTypes,
+        Doc("Request timeout in seconds, or an httpx.Timeout setting connect, read, write and pool timeouts"),
+    ] = 30,
+    concurrency: Annotated[int, Doc("Maximum number of deployments in flight at once")] = 8,
+    on_result: Annotated[
+        Optional[Callable[[BatchItemResult], None]],
+        Doc("Called in the calling thread with each item's result as soon as it finishes"),
+    ] = None,
+    ledger: Annotated[
+        Optional[DeploymentLedger],
+        Doc("Local ledger of past deployments. Items whose request was already deployed are not uploaded"),
+    ] = None,
+    force: Annotated[bool, Doc("Deploy every item even if the ledger says it is unchanged")] = False,
+    retry: Annotated[
+        Optional[RetryPolicy],
+        Doc("When to retry failed requests to the Tadata API. All items share its retry budget"),
+    ] = None,
+    circuit_breaker: Annotated[
+        Union[bool, CircuitBreaker],
+        Doc("Fail items fast while the Tadata API is degraded. True uses the circuit breaker shared by its base URL"),
+    ] = False,
+    deadline: Annotated[
+        Optional[float],
+        Doc("Total seconds for the whole batch. Items not done by then fail with DeadlineExceededError"),
+    ] = None,
+    spec_cache: Annotated[
+        Optional[HTTPSpecCache],
+        Doc("Cache of specs downloaded from URLs. Unchanged specs are neither downloaded nor parsed again"),
+    ] = None,
+    max_spec_size: Annotated[
+        Optional[int],
+        Doc("Largest spec accepted from a URL, in bytes. Larger downloads are aborted early"),
+    ] = None,
+    spec_fetcher: Annotated[
+        Optional[SpecFetcher],
+        Doc(
+            "Fetcher to download specs from URLs through, e.g. to limit connections per host. "
+            "Its own spec_cache and max_spec_size apply. By default URLs share the batch's connection pool"
+        ),
+    ] = None,
+) -> BatchDeploymentSummary:
+    """Deploy many MCP servers concurrently.
+
+    Items run on a thread pool that shares one connection pool, sized to `concurrency`, and
+    specs are downloaded from URLs through it unless a `spec_fetcher` is given. A failing
+    item never aborts the batch: its exception is captured in its BatchItemResult.
+
+    Returns:
+        A BatchDeploymentSummary with per-item results and timings.
+
+    Raises:
+        ValueError: If concurrency is lower than 1 or an item has an invalid set of spec sources.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    deployment_items = [DeploymentItem.from_source(item) for item in items]
+    logger.info(f"Deploying {len(deployment_items)} MCP servers with concurrency {concurrency}")
+    batch_deadline = Deadline(deadline) if deadline is not None else None
+
+    http_client = httpx.Client(
+        timeout=timeout,
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+    )
+    client = ApiClient(
+        api_key=api_key,
+        version=api_version,
+        timeout=timeout,
+        http_client=http_client,
+        retry=retry,
+        circuit_breaker=circuit_breaker,
+    )
+    fetcher = spec_fetcher or SpecFetcher(
+        max_connections=concurrency,
+        max_connections_per_host=concurrency,
+        timeout=timeout,
+        spec_cache=spec_cache,
+        max_spec_size=max_spec_size,
+        http_client=http_client,
+    )
+
+    def run(index: int, item: DeploymentItem) -> BatchItemResult:
+        started = time.perf_counter()
+        try:
+            openapi_spec = item.openapi_spec
+            if item.openapi_spec_url is not None:
+                openapi_spec = fetcher.fetch(item.openapi_spec_url, deadline=batch_deadline)
+            request = _prepare_request(
+                item.openapi_spec_path,
+                None,
+                openapi_spec,
+                name=item.name,
+                base_url=item.base_url,
+                auth_config=item.auth_config,
+                spec_passthrough=item.spec_passthrough,
+                timeout=timeout,
+                deadline=batch_deadline,
+            )
+            result, fingerprint = _ledger_lookup(ledger, request, api_key=api_key, force=force)
+            if result is None:
+                stats = RequestStats()
+                api_response = client.deploy_from_openapi(request, stats=stats, deadline=batch_deadline)
+                result = _deployment_result(api_response, stats)
+                _ledger_record(ledger, request, fingerprint, api_response, api_key=api_key)
+        except Exception as e:
+            logger.error(f"Deployment of {item.label} failed: {e}")
+            return BatchItemResult(index, item, time.perf_counter() - started, error=e)
+        return BatchItemResult(index, item, time.perf_counter() - started, result=result)
+
+    started = time.perf_counter()
+    results: List[BatchItemResult] = []
+    with http_client, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(run, index, item) for index, item in enumerate(deployment_items)]
+        for future in as_completed(futures):
+            item_result = future.result()
+            results.append(item_result)
+            if on_result is not None:
+                on_result(item_result)
+
+    summary = BatchDeploymentSummary(results, time.perf_counter() - started)
+    logger.info(str(summary))
+    return summary
+
+
+async def deploy_many_async(
+    items: Annotated[
+        Sequence[Union[DeploymentItem, SpecSource]],
+        Doc("Deployments to run: DeploymentItem objects or bare spec sources (path, URL, dict or OpenAPISpec)"),
+    ],
+    *,
+    api_key: Annotated[str, Doc("Tadata API key for authentication")],
+    api_version: Annotated[Literal["05-2025", "latest"], Doc("Tadata API version")] = "latest",
+    timeout: Annotated[
+        TimeoutTypes,
+        Doc("Request timeout in seconds, or an httpx.Timeout setting connect, read, write and pool timeouts"),
+    ] = 30,
+    concurrency: Annotated[int, Doc("Maximum number of deployments in flight at once")] = 8,
+    on_result: Annotated[
+        Optional[Callable[[BatchItemResult], None]],
+        Doc("Called with each item's result as soon as it finishes"),
+    ] = None,
+    ledger: Annotated[
+        Optional[DeploymentLedger],
+        Doc("Local ledger of past deployments. Items whose request was already deployed are not uploaded"),
+    ] = None,
+    force: Annotated[bool, Doc("Deploy every item even if the ledger says it is unchanged")] = False,
+    retry: Annotated[
+        Optional[RetryPolicy],
+        Doc("When to retry failed requests to the Tadata API. All items share its retry budget"),
+    ] = None,
+    circuit_breaker: Annotated[
+        Union[bool, CircuitBreaker],
+        Doc("Fail items fast while the Tadata API is degraded. True uses the circuit breaker shared by its base URL"),
+    ] = False,
+    deadline: Annotated[
+        Optional[float],
+        Doc("Total seconds for the whole batch. Items not done by then fail with DeadlineExceededError"),
+    ] = None,
+    spec_cache: Annotated[
+        Optional[HTTPSpecCache],
+        Doc("Cache of specs downloaded from URLs. Unchanged specs are neither downloaded nor parsed again"),
+    ] = None,
+    max_spec_size: Annotated[
+        Optional[int],
+        Doc("Largest spec accepted from a URL, in bytes. Larger downloads are aborted early"),
+    ] = None,
+    spec_fetcher: Annotated[
+        Optional[AsyncSpecFetcher],
+        Doc(
+            "Fetcher to download specs from URLs through, e.g. to limit connections per host. "
+            "Its own spec_cache and max_spec_size apply. By default URLs share the batch's connection pool"
+        ),
+    ] = None,
+) -> BatchDeploymentSummary:
+    """Deploy many MCP servers concurrently on the running event loop.
+
+    This is the asynchronous counterpart of `deploy_many()` and accepts the same arguments.
+
+    Returns:
+        A BatchDeploymentSummary with per-item results and timings.
+
+    Raises:
+        ValueError: If concurrency is lower than 1 or an item has an invalid set of spec sources.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    deployment_items = [DeploymentItem.from_source(item) for item in items]
+    logger.info(f"Deploying {len(deployment_items)} MCP servers with concurrency {concurrency}")
+    batch_deadline = Deadline(deadline) if deadline is not None else None
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    fetcher = spec_fetcher or AsyncSpecFetcher(
+        max_connections=concurrency,
+        max_connections_per_host=concurrency,
+        timeout=timeout,
+        spec_cache=spec_cache,
+        max_spec_size=max_spec_size,
+    )
+
+    async with contextlib.AsyncExitStack() as stack:
+        if spec_fetcher is None:
+            # Only close the fetcher if it was created here
+            await stack.enter_async_context(fetcher)
+        client = await stack.enter_async_context(
+            AsyncApiClient(
+                api_key=api_key, version=api_version, timeout=timeout, retry=retry, circuit_breaker=circuit_breaker
+            )
+        )
+
+        async def run(index: int, item: DeploymentItem) -> BatchItemResult:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    openapi_spec = item.openapi_spec
+                    if item.openapi_spec_url is not None:
+                        openapi_spec = await fetcher.fetch(item.openapi_spec_url, deadline=batch_deadline)
+                    request = await _prepare_request_async(
+                        item.openapi_spec_path,
+                        None,
+                        openapi_spec,
+                        name=item.name,
+                        base_url=item.base_url,
+                        auth_config=item.auth_config,
+                        spec_passthrough=item.spec_passthrough,
+                        timeout=timeout,
+                        deadline=batch_deadline,
+                    )
+                    result, fingerprint = await asyncio.to_thread(
+                        _ledger_lookup, ledger, request, api_key=api_key, force=force
+                    )
+                    if result is None:
+                        stats = RequestStats()
+                        api_response = await client.deploy_from_openapi(request, stats=stats, deadline=batch_deadline)
+                        result = _deployment_result(api_response, stats)
+                        await asyncio.to_thread(
+                            _ledger_record, ledger, request, fingerprint, api_response, api_key=api_key
+                        )
+                except Exception as e:
+                    logger.error(f"Deployment of {item.label} failed: {e}")
+                    return BatchItemResult(index, item, time.perf_counter() - started, error=e)
+                return BatchItemResult(index, item, time.perf_counter() - started, result=result)
+
+        started = time.perf_counter()
+        results: List[BatchItemResult] = []
+        tasks = [run(index, item) for index, item in enumerate(deployment_items)]
+        for next_result in asyncio.as_completed(tasks):
+            item_result = await next_result
+            results.append(item_result)
+            if on_result is not None:
+                on_result(item_result)
+
+    summary = BatchDeploymentSummary(results, time.perf_counter() - started)
+    logger.info(str(summary))
+    return summary
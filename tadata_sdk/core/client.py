@@ -0,0 +1,273 @@
+"""Reusable Tadata client holding a pooled HTTP connection."""
+
+import logging
+from typing import Any, Dict, Literal, Optional, Union, overload
+from typing_extensions import Annotated, Doc
+
+import httpx
+
+from ..http.circuit import CircuitBreaker
+from ..http.client import ApiClient
+from ..http.compression import Compression
+from ..http.deadline import Deadline, TimeoutTypes
+from ..http.hedging import HedgingPolicy
+from ..http.retry import RequestStats, RetryPolicy
+from ..http.schemas import AuthConfig
+from ..openapi.fetch import ProgressCallback
+from ..openapi.filter import OperationFilter
+from ..openapi.http_cache import HTTPSpecCache
+from ..openapi.source import OpenAPISpec
+from .ledger import DeploymentLedger
+from .sdk import (
+    DeploymentResult,
+    _deployment_result,
+    _ledger_lookup,
+    _ledger_record,
+    _prepare_request,
+    _validate_spec_sources,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class TadataClient:
+    """Client for the Tadata Platform that reuses one connection pool across deployments.
+
+    Create it once and call `deploy()` as often as needed; connections to the Tadata API stay
+    warm between calls. Use it as a context manager, or call `close()`, to release them.
+
+    Example:
+        >>> with TadataClient(api_key="your-tadata-api-key") as client:
+        ...     result = client.deploy(openapi_spec_path="openapi.json")
+    """
+
+    def __init__(
+        self,
+        api_key: Annotated[str, Doc("Tadata API key for authentication")],
+        *,
+        api_version: Annotated[Literal["05-2025", "latest"], Doc("Tadata API version")] = "latest",
+        timeout: Annotated[
+            TimeoutTypes,
+            Doc("Request timeout in seconds, or an httpx.Timeout setting connect, read, write and pool timeouts"),
+        ] = 30,
+        limits: Annotated[
+            Optional[httpx.Limits], Doc("Connection pool limits. Defaults to 100 connections, 20 of them kept alive")
+        ] = None,
+        keepalive_expiry: Annotated[
+            Optional[float], Doc("Seconds an idle keep-alive connection is kept. Overrides the value in `limits`")
+        ] = None,
+        http2: Annotated[bool, Doc("Enable HTTP/2. Requires the `h2` package (`pip install httpx[http2]`)")] = False,
+        transport: Annotated[
+            Optional[httpx.BaseTransport], Doc("Custom httpx transport, e.g. for proxies or testing")
+        ] = None,
+        ledger: Annotated[
+            Optional[DeploymentLedger],
+            Doc("Local ledger of past deployments. When the same request was already deployed, the upload is skipped"),
+        ] = None,
+        spec_cache: Annotated[
+            Optional[HTTPSpecCache],
+            Doc("Cache of specs downloaded from URLs. Unchanged specs are neither downloaded nor parsed again"),
+        ] = None,
+        compression: Annotated[
+            Compression,
+            Doc('Request body compression: "none" (the default), "auto" (gzip), "gzip", "zstd" or "br"'),
+        ] = "none",
+        retry: Annotated[
+            Optional[RetryPolicy],
+            Doc("When to retry failed requests. All deploys through this client share its retry budget"),
+        ] = None,
+        circuit_breaker: Annotated[
+            Union[bool, CircuitBreaker],
+            Doc("Fail fast while the Tadata API is degraded. True uses the circuit breaker shared by its base URL"),
+        ] = False,
+        hedging: Annotated[
+            Optional[HedgingPolicy],
+            Doc("Send a second copy of slow deploy requests to cut tail latency. Disabled by default"),
+        ] = None,
+    ) -> None:
+        pool_limits = limits if limits is not None else httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        if keepalive_expiry is not None:
+            pool_limits = httpx.Limits(
+                max_connections=pool_limits.max_connections,
+                max_keepalive_connections=pool_limits.max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+
+        self.api_key = api_key
+        self.api_version = api_version
+        self.timeout = timeout
+        self.ledger = ledger
+        self.spec_cache = spec_cache
+        self.http_client = httpx.Client(timeout=timeout, limits=pool_limits, http2=http2, transport=transport)
+        self._api_client = ApiClient(
+            api_key=api_key,
+            version=api_version,
+            timeout=timeout,
+            http_client=self.http_client,
+            compression=compression,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+        )
+
+    def __enter__(self) -> "TadataClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._api_client.close()
+        self.http_client.close()
+
+    @overload
+    def deploy(
+        self,
+        *,
+        openapi_spec_path: str,
+        base_url: Optional[str] = None,
+        name: Optional[str] = None,
+        auth_config: Optional[AuthConfig] = None,
+        force: bool = False,
+        deadline: Optional[float] = None,
+        bundle_refs: bool = False,
+        operation_filter: Optional[OperationFilter] = None,
+        prune_components: bool = False,
+        spec_passthrough: bool = False,
+    ) -> DeploymentResult: ...
+
+    @overload
+    def deploy(
+        self,
+        *,
+        openapi_spec_url: str,
+        base_url: Optional[str] = None,
+        name: Optional[str] = None,
+        auth_config: Optional[AuthConfig] = None,
+        force: bool = False,
+        deadline: Optional[float] = None,
+        bundle_refs: bool = False,
+        operation_filter: Optional[OperationFilter] = None,
+        prune_components: bool = False,
+        max_spec_size: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> DeploymentResult: ...
+
+    @overload
+    def deploy(
+        self,
+        *,
+        openapi_spec: Union[Dict[str, Any], OpenAPISpec],
+        base_url: Optional[str] = None,
+        name: Optional[str] = None,
+        auth_config: Optional[AuthConfig] = None,
+        force: bool = False,
+        deadline: Optional[float] = None,
+        bundle_refs: bool = False,
+        operation_filter: Optional[OperationFilter] = None,
+        prune_components: bool = False,
+    ) -> DeploymentResult: ...
+
+    def deploy(
+        self,
+        *,
+        openapi_spec_path: Annotated[Optional[str], Doc("Path to an OpenAPI specification file (JSON or YAML)")] = None,
+        openapi_spec_url: Annotated[Optional[str], Doc("URL to an OpenAPI specification")] = None,
+        openapi_spec: Annotated[
+            Optional[Union[Dict[str, Any], OpenAPISpec]],
+            Doc("OpenAPI specification as a dictionary or OpenAPISpec object"),
+        ] = None,
+        base_url: Annotated[
+            Optional[str],
+            Doc("Base URL of the API to proxy requests to. If not provided, will try to extract from the OpenAPI spec"),
+        ] = None,
+        name: Annotated[Optional[str], Doc("Optional name for the deployment")] = None,
+        auth_config: Annotated[
+            Optional[AuthConfig], Doc("Configuration for authentication handling between the MCP and your API")
+        ] = None,
+        force: Annotated[bool, Doc("Deploy even if the ledger says the request is unchanged")] = False,
+        deadline: Annotated[
+            Optional[float],
+            Doc("Total seconds for the deployment: spec download, parsing and upload, including retries"),
+        ] = None,
+        bundle_refs: Annotated[
+            bool,
+            Doc("Resolve $refs to other files and URLs, bundling them into one self-contained spec before deploying"),
+        ] = False,
+        operation_filter: Annotated[
+            Optional[OperationFilter],
+            Doc("Deploy only the operations this filter keeps, without the components they no longer use"),
+        ] = None,
+        prune_components: Annotated[
+            bool, Doc("Remove components that nothing in the spec references before deploying")
+        ] = False,
+        max_spec_size: Annotated[
+            Optional[int],
+            Doc("Largest spec accepted from openapi_spec_url, in bytes. Larger downloads are aborted early"),
+        ] = None,
+        on_progress: Annotated[
+            Optional[ProgressCallback],
+            Doc("Called as the spec downloads from openapi_spec_url with the bytes received and the total, if known"),
+        ] = None,
+        spec_passthrough: Annotated[
+            bool,
+            Doc(
+                "Upload the JSON file at openapi_spec_path byte-for-byte, without parsing or validating it. "
+                "Only use it for files already known to be valid"
+            ),
+        ] = False,
+    ) -> DeploymentResult:
+        """Deploy a Model Context Protocol (MCP) server from an OpenAPI specification.
+
+        You must provide exactly one of: openapi_spec_path, openapi_spec_url, or openapi_spec.
+        Spec downloads and API calls go through this client's connection pool.
+
+        Returns:
+            A DeploymentResult object containing details of the deployment.
+
+        Raises:
+            ValueError: If no OpenAPI specification source is provided, or if multiple sources are provided.
+            SpecInvalidError: If the OpenAPI specification is invalid or cannot be processed.
+            AuthError: If authentication with the Tadata API fails.
+            ApiError: If the Tadata API returns an error.
+            NetworkError: If a network error occurs.
+            CircuitOpenError: If the circuit breaker is open.
+            DeadlineExceededError: If the deployment takes longer than `deadline`.
+        """
+        logger.info("Deploying MCP server from OpenAPI spec")
+
+        _validate_spec_sources(openapi_spec_path, openapi_spec_url, openapi_spec)
+
+        deploy_deadline = Deadline(deadline) if deadline is not None else None
+
+        request = _prepare_request(
+            openapi_spec_path,
+            openapi_spec_url,
+            openapi_spec,
+            name=name,
+            base_url=base_url,
+            auth_config=auth_config,
+            spec_passthrough=spec_passthrough,
+            bundle_refs=bundle_refs,
+            operation_filter=operation_filter,
+            prune_components=prune_components,
+            timeout=self.timeout,
+            http_client=self.http_client,
+            deadline=deploy_deadline,
+            spec_cache=self.spec_cache,
+            max_spec_size=max_spec_size,
+            on_progress=on_progress,
+        )
+
+        cached, fingerprint = _ledger_lookup(self.ledger, request, api_key=self.api_key, force=force)
+        if cached is not None:
+            return cached
+
+        stats = RequestStats()
+        api_response = self._api_client.deploy_from_openapi(request, stats=stats, deadline=deploy_deadline)
+
+        result = _deployment_result(api_response, stats)
+        _ledger_record(self.ledger, request, fingerprint, api_response, api_key=self.api_key)
+        return result
@@ -0,0 +1,129 @@
+"""On-disk ledger of past deployments, used to skip uploading unchanged specs."""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Union
+from typing_extensions import Annotated, Doc
+
+from .. import json_backend
+from ..http.client import DeploymentRequest
+from ..http.schemas import DeploymentResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+class DeploymentLedger:
+    """Local record of the last successful deployment per deployment name.
+
+    Each entry stores the fingerprint of the request that was deployed together with the API
+    response. When the same request is deployed again under the same name and API key, the
+    stored response can be returned without contacting the Tadata API.
+
+    Entries are kept as one small JSON file each, written atomically, so several processes can
+    share a ledger directory.
+    """
+
+    def __init__(
+        self,
+        directory: Annotated[Union[str, Path], Doc("Directory where ledger entries are stored")],
+        ttl: Annotated[Optional[float], Doc("Seconds after which entries are ignored. None keeps them")] = 24 * 60 * 60,
+    ) -> None:
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    @staticmethod
+    def fingerprint(request: DeploymentRequest) -> str:
+        """Compute the fingerprint of a deployment request.
+
+        The fingerprint is the hash of the canonical form of the request, so any change to the
+        spec, base URL, name or auth configuration produces a new value, while reordering keys
+        or converting the spec between JSON and YAML does not. Requests that stream a spec file
+        are hashed byte for byte, chunk by chunk, without loading the file.
+
+        Args:
+            request: The deployment request.
+
+        Returns:
+            The hex-encoded fingerprint.
+        """
+        return request.fingerprint()
+
+    def _entry_path(self, api_key: str, name: Optional[str]) -> Path:
+        # The API key is part of the key, so a ledger shared between accounts never mixes them up
+        key = hashlib.sha256(f"{api_key}\0{name or ''}".encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.json"
+
+    def lookup(self, api_key: str, name: Optional[str], fingerprint: str) -> Optional[DeploymentResponse]:
+        """Return the recorded response for a deployment, if it is still fresh and unchanged.
+
+        Args:
+            api_key: The Tadata API key the deployment was made with.
+            name: The deployment name.
+            fingerprint: The fingerprint of the request about to be deployed.
+
+        Returns:
+            The recorded response, or None if there is no matching, unexpired entry.
+        """
+        path = self._entry_path(api_key, name)
+        try:
+            entry = json_backend.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+            return None
+        recorded_at = entry.get("recorded_at", 0)
+        if not isinstance(recorded_at, (int, float)):
+            logger.warning(f"Ignoring unreadable ledger entry {path}")
+            return None
+        if self.ttl is not None and time.time() - recorded_at > self.ttl:
+            logger.debug(f"Ledger entry for {name!r} has expired")
+            return None
+
+        try:
+            return DeploymentResponse.model_validate(entry["response"])
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable ledger entry {path}: {e}")
+            return None
+
+    def record(self, api_key: str, name: Optional[str], fingerprint: str, response: DeploymentResponse) -> None:
+        """Record a successful deployment.
+
+        Args:
+            api_key: The Tadata API key the deployment was made with.
+            name: The deployment name.
+            fingerprint: The fingerprint of the deployed request.
+            response: The response returned by the Tadata API.
+        """
+        entry = {
+            "name": name,
+            "fingerprint": fingerprint,
+            "recorded_at": time.time(),
+            "response": response.model_dump(mode="json", by_alias=True, exclude_none=True),
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(api_key, name)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_backend.dumps(entry))
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def forget(self, api_key: str, name: Optional[str]) -> None:
+        """Remove the entry for a deployment, if any."""
+        self._entry_path(api_key, name).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all entries from the ledger."""
+        if not self.directory.exists():
+            return
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
@@ -1,28 +1,59 @@
 """Core SDK functionality for the Tadata Platform."""
 
+import asyncio
+import atexit
 import logging
-import urllib.parse
+import threading
 from datetime import datetime
-from typing import Any, Dict, Literal, Optional, Union, overload
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Tuple, Union, overload
 from typing_extensions import Annotated, Doc
 
 from ..errors.exceptions import SpecInvalidError
-from ..http.client import ApiClient
+from ..http.circuit import CircuitBreaker
+from ..http.client import ApiClient, AsyncApiClient, DeploymentRequest
+from ..http.deadline import Deadline, TimeoutTypes
+from ..http.raw_request import RawUpsertDeploymentRequest
+from ..http.retry import RequestStats, RetryPolicy
 from ..http.schemas import DeploymentResponse, AuthConfig, UpsertDeploymentRequest
+from ..openapi.bundle import BUNDLE_PHASE, bundle_spec
+from ..openapi.fetch import ProgressCallback, fetch_spec, fetch_spec_async
+from ..openapi.filter import OperationFilter
+from ..openapi.index import HTTP_METHODS
+from ..openapi.http_cache import HTTPSpecCache
 from ..openapi.source import OpenAPISpec
+from .ledger import DeploymentLedger
+
+if TYPE_CHECKING:
+    import httpx
 
 
 logger = logging.getLogger(__name__)
 
+# Deadline phases before the upload, used in DeadlineExceededError messages
+PARSE_PHASE = "parsing the spec"
+FILTER_PHASE = "filtering operations"
+PRUNE_PHASE = "pruning unused components"
+
+_shared_http_client: Optional["httpx.Client"] = None
+_shared_http_client_lock = threading.Lock()
+
 
 class DeploymentResult:
     """Result of a successful MCP deployment."""
 
-    def __init__(self, response: DeploymentResponse) -> None:
+    def __init__(
+        self,
+        response: DeploymentResponse,
+        skipped_locally: bool = False,
+        stats: Optional[RequestStats] = None,
+    ) -> None:
         """Initialize a deployment result.
 
         Args:
             response: The raw API response from a successful deployment.
+            skipped_locally: Whether the response was taken from a local deployment ledger
+                instead of contacting the Tadata API.
+            stats: Attempts made to reach the Tadata API and time spent waiting between retries.
 
         Raises:
             SpecInvalidError: If the response data is missing or invalid.
@@ -35,10 +66,15 @@ class DeploymentResult:
         self.id = data.deployment.id
         self.updated = data.updated
         self.created_at = data.deployment.created_at or datetime.now()
+        self.skipped_locally = skipped_locally
+        self.stats = stats if stats is not None else RequestStats()
 
     def __str__(self) -> str:
         """Return a string representation of the deployment result."""
-        return f"DeploymentResult(id={self.id}, updated={self.updated}, created_at={self.created_at})"
+        return (
+            f"DeploymentResult(id={self.id}, updated={self.updated}, created_at={self.created_at}, "
+            f"skipped_locally={self.skipped_locally})"
+        )
 
 
 @overload
@@ -50,7 +86,16 @@ def deploy(
     name: Optional[str] = None,
     auth_config: Optional[AuthConfig] = None,
     api_version: Literal["05-2025", "latest"] = "latest",
-    timeout: int = 30,
+    timeout: TimeoutTypes = 30,
+    ledger: Optional[DeploymentLedger] = None,
+    force: bool = False,
+    retry: Optional[RetryPolicy] = None,
+    circuit_breaker: Union[bool, CircuitBreaker] = False,
+    deadline: Optional[float] = None,
+    bundle_refs: bool = False,
+    operation_filter: Optional[OperationFilter] = None,
+    prune_components: bool = False,
+    spec_passthrough: bool = False,
 ) -> DeploymentResult: ...
 
 
@@ -63,7 +108,18 @@ def deploy(
     name: Optional[str] = None,
     auth_config: Optional[AuthConfig] = None,
     api_version: Literal["05-2025", "latest"] = "latest",
-    timeout: int = 30,
+    timeout: TimeoutTypes = 30,
+    ledger: Optional[DeploymentLedger] = None,
+    force: bool = False,
+    retry: Optional[RetryPolicy] = None,
+    circuit_breaker: Union[bool, CircuitBreaker] = False,
+    deadline: Optional[float] = None,
+    bundle_refs: bool = False,
+    operation_filter: Optional[OperationFilter] = None,
+    prune_components: bool = False,
+    spec_cache: Optional[HTTPSpecCache] = None,
+    max_spec_size: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
 ) -> DeploymentResult: ...
 
 
@@ -76,7 +132,15 @@ def deploy(
     name: Optional[str] = None,
     auth_config: Optional[AuthConfig] = None,
     api_version: Literal["05-2025", "latest"] = "latest",
-    timeout: int = 30,
+    timeout: TimeoutTypes = 30,
+    ledger: Optional[DeploymentLedger] = None,
+    force: bool = False,
+    retry: Optional[RetryPolicy] = None,
+    circuit_breaker: Union[bool, CircuitBreaker] = False,
+    deadline: Optional[float] = None,
+    bundle_refs: bool = False,
+    operation_filter: Optional[OperationFilter] = None,
+    prune_components: bool = False,
 ) -> DeploymentResult: ...
 
 
@@ -97,7 +161,56 @@ def deploy(
     ] = None,
     api_key: Annotated[str, Doc("Tadata API key for authentication")],
     api_version: Annotated[Literal["05-2025", "latest"], Doc("Tadata API version")] = "latest",
-    timeout: Annotated[int, Doc("Request timeout in seconds")] = 30,
+    timeout: Annotated[
+        TimeoutTypes,
+        Doc("Request timeout in seconds, or an httpx.Timeout setting connect, read, write and pool timeouts"),
+    ] = 30,
+    ledger: Annotated[
+        Optional[DeploymentLedger],
+        Doc("Local ledger of past deployments. When the same request was already deployed, the upload is skipped"),
+    ] = None,
+    force: Annotated[bool, Doc("Deploy even if the ledger says the request is unchanged")] = False,
+    retry: Annotated[
+        Optional[RetryPolicy], Doc("When to retry failed requests to the Tadata API. Defaults to RetryPolicy()")
+    ] = None,
+    circuit_breaker: Annotated[
+        Union[bool, CircuitBreaker],
+        Doc("Fail fast while the Tadata API is degraded. True uses the circuit breaker shared by its base URL"),
+    ] = False,
+    deadline: Annotated[
+        Optional[float],
+        Doc("Total seconds for the deployment: spec download, parsing and upload, including retries"),
+    ] = None,
+    bundle_refs: Annotated[
+        bool,
+        Doc("Resolve $refs to other files and URLs, bundling them into one self-contained spec before deploying"),
+    ] = False,
+    operation_filter: Annotated[
+        Optional[OperationFilter],
+        Doc("Deploy only the operations this filter keeps, without the components they no longer use"),
+    ] = None,
+    prune_components: Annotated[
+        bool, Doc("Remove components that nothing in the spec references before deploying")
+    ] = False,
+    spec_cache: Annotated[
+        Optional[HTTPSpecCache],
+        Doc("Cache of specs downloaded from URLs. Unchanged specs are neither downloaded nor parsed again"),
+    ] = None,
+    max_spec_size: Annotated[
+        Optional[int],
+        Doc("Largest spec accepted from openapi_spec_url, in bytes. Larger downloads are aborted early"),
+    ] = None,
+    on_progress: Annotated[
+        Optional[ProgressCallback],
+        Doc("Called as the spec downloads from openapi_spec_url with the bytes received and the total, if known"),
+    ] = None,
+    spec_passthrough: Annotated[
+        bool,
+        Doc(
+            "Upload the JSON file at openapi_spec_path byte-for-byte, without parsing or validating it. "
+            "Only use it for files already known to be valid"
+        ),
+    ] = False,
 ) -> DeploymentResult:
     """Deploy a Model Context Protocol (MCP) server from an OpenAPI specification.
 
@@ -112,52 +225,352 @@ def deploy(
         AuthError: If authentication with the Tadata API fails.
         ApiError: If the Tadata API returns an error.
         NetworkError: If a network error occurs.
+        CircuitOpenError: If the circuit breaker is open.
+        DeadlineExceededError: If the deployment takes longer than `deadline`.
+    """
+    logger.info("Deploying MCP server from OpenAPI spec")
+
+    _validate_spec_sources(openapi_spec_path, openapi_spec_url, openapi_spec)
+
+    deploy_deadline = Deadline(deadline) if deadline is not None else None
+    http_client = _get_shared_http_client()
+
+    request = _prepare_request(
+        openapi_spec_path,
+        openapi_spec_url,
+        openapi_spec,
+        name=name,
+        base_url=base_url,
+        auth_config=auth_config,
+        spec_passthrough=spec_passthrough,
+        bundle_refs=bundle_refs,
+        operation_filter=operation_filter,
+        prune_components=prune_components,
+        timeout=timeout,
+        http_client=http_client,
+        deadline=deploy_deadline,
+        spec_cache=spec_cache,
+        max_spec_size=max_spec_size,
+        on_progress=on_progress,
+    )
+
+    client = ApiClient(
+        api_key=api_key,
+        version=api_version,
+        timeout=timeout,
+        http_client=http_client,
+        retry=retry,
+        circuit_breaker=circuit_breaker,
+    )
+
+    cached, fingerprint = _ledger_lookup(ledger, request, api_key=api_key, force=force)
+    if cached is not None:
+        return cached
+
+    stats = RequestStats()
+    api_response: DeploymentResponse = client.deploy_from_openapi(request, stats=stats, deadline=deploy_deadline)
+
+    result = _deployment_result(api_response, stats)
+    _ledger_record(ledger, request, fingerprint, api_response, api_key=api_key)
+    return result
+
+
+@overload
+async def deploy_async(
+    *,
+    openapi_spec_path: str,
+    api_key: str,
+    base_url: Optional[str] = None,
+    name: Optional[str] = None,
+    auth_config: Optional[AuthConfig] = None,
+    api_version: Literal["05-2025", "latest"] = "latest",
+    timeout: TimeoutTypes = 30,
+    ledger: Optional[DeploymentLedger] = None,
+    force: bool = False,
+    retry: Optional[RetryPolicy] = None,
+    circuit_breaker: Union[bool, CircuitBreaker] = False,
+    deadline: Optional[float] = None,
+    bundle_refs: bool = False,
+    operation_filter: Optional[OperationFilter] = None,
+    prune_components: bool = False,
+    spec_passthrough: bool = False,
+) -> DeploymentResult: ...
+
+
+@overload
+async def deploy_async(
+    *,
+    openapi_spec_url: str,
+    api_key: str,
+    base_url: Optional[str] = None,
+    name: Optional[str] = None,
+    auth_config: Optional[AuthConfig] = None,
+    api_version: Literal["05-2025", "latest"] = "latest",
+    timeout: TimeoutTypes = 30,
+    ledger: Optional[DeploymentLedger] = None,
+    force: bool = False,
+    retry: Optional[RetryPolicy] = None,
+    circuit_breaker: Union[bool, CircuitBreaker] = False,
+    deadline: Optional[float] = None,
+    bundle_refs: bool = False,
+    operation_filter: Optional[OperationFilter] = None,
+    prune_components: bool = False,
+    spec_cache: Optional[HTTPSpecCache] = None,
+    max_spec_size: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> DeploymentResult: ...
+
+
+@overload
+async def deploy_async(
+    *,
+    openapi_spec: Union[Dict[str, Any], OpenAPISpec],
+    api_key: str,
+    base_url: Optional[str] = None,
+    name: Optional[str] = None,
+    auth_config: Optional[AuthConfig] = None,
+    api_version: Literal["05-2025", "latest"] = "latest",
+    timeout: TimeoutTypes = 30,
+    ledger: Optional[DeploymentLedger] = None,
+    force: bool = False,
+    retry: Optional[RetryPolicy] = None,
+    circuit_breaker: Union[bool, CircuitBreaker] = False,
+    deadline: Optional[float] = None,
+    bundle_refs: bool = False,
+    operation_filter: Optional[OperationFilter] = None,
+    prune_components: bool = False,
+) -> DeploymentResult: ...
+
+
+async def deploy_async(
+    *,
+    openapi_spec_path: Annotated[Optional[str], Doc("Path to an OpenAPI specification file (JSON or YAML)")] = None,
+    openapi_spec_url: Annotated[Optional[str], Doc("URL to an OpenAPI specification")] = None,
+    openapi_spec: Annotated[
+        Optional[Union[Dict[str, Any], OpenAPISpec]], Doc("OpenAPI specification as a dictionary or OpenAPISpec object")
+    ] = None,
+    base_url: Annotated[
+        Optional[str],
+        Doc("Base URL of the API to proxy requests to. If not provided, will try to extract from the OpenAPI spec"),
+    ] = None,
+    name: Annotated[Optional[str], Doc("Optional name for the deployment")] = None,
+    auth_config: Annotated[
+        Optional[AuthConfig], Doc("Configuration for authentication handling between the MCP and your API")
+    ] = None,
+    api_key: Annotated[str, Doc("Tadata API key for authentication")],
+    api_version: Annotated[Literal["05-2025", "latest"], Doc("Tadata API version")] = "latest",
+    timeout: Annotated[
+        TimeoutTypes,
+        Doc("Request timeout in seconds, or an httpx.Timeout setting connect, read, write and pool timeouts"),
+    ] = 30,
+    ledger: Annotated[
+        Optional[DeploymentLedger],
+        Doc("Local ledger of past deployments. When the same request was already deployed, the upload is skipped"),
+    ] = None,
+    force: Annotated[bool, Doc("Deploy even if the ledger says the request is unchanged")] = False,
+    retry: Annotated[
+        Optional[RetryPolicy], Doc("When to retry failed requests to the Tadata API. Defaults to RetryPolicy()")
+    ] = None,
+    circuit_breaker: Annotated[
+        Union[bool, CircuitBreaker],
+        Doc("Fail fast while the Tadata API is degraded. True uses the circuit breaker shared by its base URL"),
+    ] = False,
+    deadline: Annotated[
+        Optional[float],
+        Doc("Total seconds for the deployment: spec download, parsing and upload, including retries"),
+    ] = None,
+    bundle_refs: Annotated[
+        bool,
+        Doc("Resolve $refs to other files and URLs, bundling them into one self-contained spec before deploying"),
+    ] = False,
+    operation_filter: Annotated[
+        Optional[OperationFilter],
+        Doc("Deploy only the operations this filter keeps, without the components they no longer use"),
+    ] = None,
+    prune_components: Annotated[
+        bool, Doc("Remove components that nothing in the spec references before deploying")
+    ] = False,
+    spec_cache: Annotated[
+        Optional[HTTPSpecCache],
+        Doc("Cache of specs downloaded from URLs. Unchanged specs are neither downloaded nor parsed again"),
+    ] = None,
+    max_spec_size: Annotated[
+        Optional[int],
+        Doc("Largest spec accepted from openapi_spec_url, in bytes. Larger downloads are aborted early"),
+    ] = None,
+    on_progress: Annotated[
+        Optional[ProgressCallback],
+        Doc("Called as the spec downloads from openapi_spec_url with the bytes received and the total, if known"),
+    ] = None,
+    spec_passthrough: Annotated[
+        bool,
+        Doc(
+            "Upload the JSON file at openapi_spec_path byte-for-byte, without parsing or validating it. "
+            "Only use it for files already known to be valid"
+        ),
+    ] = False,
+) -> DeploymentResult:
+    """Deploy a Model Context Protocol (MCP) server from an OpenAPI specification without blocking the event loop.
+
+    This is the asynchronous counterpart of `deploy()` and accepts the same arguments.
+    You must provide exactly one of: openapi_spec_path, openapi_spec_url, or openapi_spec.
+
+    Returns:
+        A DeploymentResult object containing details of the deployment.
+
+    Raises:
+        ValueError: If no OpenAPI specification source is provided, or if multiple sources are provided.
+        SpecInvalidError: If the OpenAPI specification is invalid or cannot be processed.
+        AuthError: If authentication with the Tadata API fails.
+        ApiError: If the Tadata API returns an error.
+        NetworkError: If a network error occurs.
+        CircuitOpenError: If the circuit breaker is open.
+        DeadlineExceededError: If the deployment takes longer than `deadline`.
     """
     logger.info("Deploying MCP server from OpenAPI spec")
 
-    # Validate input - must have exactly one openapi_spec source
+    _validate_spec_sources(openapi_spec_path, openapi_spec_url, openapi_spec)
+
+    deploy_deadline = Deadline(deadline) if deadline is not None else None
+    request = await _prepare_request_async(
+        openapi_spec_path,
+        openapi_spec_url,
+        openapi_spec,
+        name=name,
+        base_url=base_url,
+        auth_config=auth_config,
+        spec_passthrough=spec_passthrough,
+        bundle_refs=bundle_refs,
+        operation_filter=operation_filter,
+        prune_components=prune_components,
+        timeout=timeout,
+        deadline=deploy_deadline,
+        spec_cache=spec_cache,
+        max_spec_size=max_spec_size,
+        on_progress=on_progress,
+    )
+
+    # Hashing the spec and the ledger's file I/O run off the event loop
+    cached, fingerprint = await asyncio.to_thread(_ledger_lookup, ledger, request, api_key=api_key, force=force)
+    if cached is not None:
+        return cached
+
+    stats = RequestStats()
+    async with AsyncApiClient(
+        api_key=api_key, version=api_version, timeout=timeout, retry=retry, circuit_breaker=circuit_breaker
+    ) as client:
+        api_response = await client.deploy_from_openapi(request, stats=stats, deadline=deploy_deadline)
+
+    result = _deployment_result(api_response, stats)
+    await asyncio.to_thread(_ledger_record, ledger, request, fingerprint, api_response, api_key=api_key)
+    return result
+
+
+def _get_shared_http_client() -> "httpx.Client":
+    """Return the process-wide httpx.Client used by the module-level `deploy()`.
+
+    The client is created on first use and reused afterwards, so repeated deploys share warm
+    connections instead of paying a new TCP and TLS handshake each time.
+    """
+    global _shared_http_client
+
+    with _shared_http_client_lock:
+        if _shared_http_client is None or _shared_http_client.is_closed:
+            import httpx
+
+            _shared_http_client = httpx.Client()
+            atexit.register(_shared_http_client.close)
+        return _shared_http_client
+
+
+def _validate_spec_sources(
+    openapi_spec_path: Optional[str],
+    openapi_spec_url: Optional[str],
+    openapi_spec: Optional[Union[Dict[str, Any], OpenAPISpec]],
+) -> None:
+    """Check that exactly one OpenAPI specification source was provided.
+
+    Raises:
+        ValueError: If no source or more than one source is provided.
+    """
     source_count = sum(1 for x in [openapi_spec_path, openapi_spec_url, openapi_spec] if x is not None)
     if source_count == 0:
         raise ValueError("One of openapi_spec_path, openapi_spec_url, or openapi_spec must be provided")
     if source_count > 1:
         raise ValueError("Only one of openapi_spec_path, openapi_spec_url, or openapi_spec should be provided")
 
-    # Process OpenAPI spec from the provided source
+
+def _load_spec(
+    openapi_spec_path: Optional[str],
+    openapi_spec_url: Optional[str],
+    openapi_spec: Optional[Union[Dict[str, Any], OpenAPISpec]],
+    *,
+    timeout: TimeoutTypes,
+    http_client: Optional["httpx.Client"] = None,
+    deadline: Optional[Deadline] = None,
+    spec_cache: Optional[HTTPSpecCache] = None,
+    max_spec_size: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> OpenAPISpec:
+    """Load an OpenAPI specification from whichever source was provided.
+
+    URLs are streamed and parsed as they download, through `http_client` when given so that the fetch
+    can reuse pooled connections, and revalidated against `spec_cache` when given.
+    """
+    if openapi_spec_url is None:
+        return _load_local_spec(openapi_spec_path, openapi_spec, deadline=deadline)
+
+    return fetch_spec(
+        openapi_spec_url,
+        http_client=http_client,
+        timeout=timeout,
+        spec_cache=spec_cache,
+        max_size=max_spec_size,
+        on_progress=on_progress,
+        deadline=deadline,
+    )
+
+
+async def _load_spec_async(
+    openapi_spec_path: Optional[str],
+    openapi_spec_url: Optional[str],
+    openapi_spec: Optional[Union[Dict[str, Any], OpenAPISpec]],
+    *,
+    timeout: TimeoutTypes,
+    deadline: Optional[Deadline] = None,
+    spec_cache: Optional[HTTPSpecCache] = None,
+    max_spec_size: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> OpenAPISpec:
+    """Load an OpenAPI specification without blocking the event loop."""
+    if openapi_spec_url is None:
+        return await asyncio.to_thread(_load_local_spec, openapi_spec_path, openapi_spec, deadline=deadline)
+
+    import httpx
+
+    async with httpx.AsyncClient() as http_client:
+        return await fetch_spec_async(
+            openapi_spec_url,
+            http_client=http_client,
+            timeout=timeout,
+            spec_cache=spec_cache,
+            max_size=max_spec_size,
+            on_progress=on_progress,
+            deadline=deadline,
+        )
+
+
+def _load_local_spec(
+    openapi_spec_path: Optional[str],
+    openapi_spec: Optional[Union[Dict[str, Any], OpenAPISpec]],
+    deadline: Optional[Deadline] = None,
+) -> OpenAPISpec:
+    """Load an OpenAPI specification from a file path, a dictionary or an existing instance."""
+    _check_deadline(deadline, PARSE_PHASE)
     spec: Optional[OpenAPISpec] = None
     if openapi_spec_path is not None:
         logger.info(f"Loading OpenAPI spec from file: {openapi_spec_path}")
         spec = OpenAPISpec.from_file(openapi_spec_path)
-    elif openapi_spec_url is not None:
-        logger.info(f"Loading OpenAPI spec from URL: {openapi_spec_url}")
-        # We'll use httpx to fetch the URL
-        import httpx
-
-        try:
-            response = httpx.get(openapi_spec_url, timeout=timeout)
-            response.raise_for_status()
-
-            # Parse based on content-type or URL extension
-            content_type = response.headers.get("content-type", "")
-            if "json" in content_type:
-                spec = OpenAPISpec.from_json(response.text)
-            elif "yaml" in content_type or "yml" in content_type:
-                spec = OpenAPISpec.from_yaml(response.text)
-            else:
-                # Try to infer from URL extension
-                url_path = urllib.parse.urlparse(openapi_spec_url).path
-                if url_path.lower().endswith((".json")):
-                    spec = OpenAPISpec.from_json(response.text)
-                elif url_path.lower().endswith((".yaml", ".yml")):
-                    spec = OpenAPISpec.from_yaml(response.text)
-                else:
-                    # Default to trying JSON
-                    spec = OpenAPISpec.from_json(response.text)
-        except httpx.HTTPError as e:
-            raise SpecInvalidError(
-                f"Failed to fetch OpenAPI spec from URL: {str(e)}",
-                details={"url": openapi_spec_url},
-                cause=e,
-            )
     elif isinstance(openapi_spec, dict):
         logger.info("Using provided OpenAPI spec dictionary")
         spec = OpenAPISpec.from_dict(openapi_spec)
@@ -166,31 +579,184 @@ def deploy(
         logger.info("Using provided OpenAPISpec instance")
         spec = openapi_spec
 
-    # At this point, spec should be defined
     if spec is None:
-        # This should never happen due to our validation above, but make type checker happy
+        # This should never happen due to the source validation, but make type checker happy
         raise ValueError("Unable to obtain OpenAPI specification from provided sources")
 
-    mcp_auth_config = AuthConfig()
-    if auth_config is not None:
-        mcp_auth_config = AuthConfig.model_validate(auth_config.model_dump())
+    return spec
 
-    client = ApiClient(
-        api_key=api_key,
-        version=api_version,
+
+def _check_deadline(deadline: Optional[Deadline], phase: str) -> None:
+    """Raise DeadlineExceededError if the deadline has passed before `phase` starts."""
+    if deadline is not None:
+        deadline.check(phase)
+
+
+def _prepare_request(
+    openapi_spec_path: Optional[str],
+    openapi_spec_url: Optional[str],
+    openapi_spec: Optional[Union[Dict[str, Any], OpenAPISpec]],
+    *,
+    name: Optional[str],
+    base_url: Optional[str],
+    auth_config: Optional[AuthConfig],
+    spec_passthrough: bool,
+    timeout: TimeoutTypes,
+    bundle_refs: bool = False,
+    operation_filter: Optional[OperationFilter] = None,
+    prune_components: bool = False,
+    http_client: Optional["httpx.Client"] = None,
+    deadline: Optional[Deadline] = None,
+    spec_cache: Optional[HTTPSpecCache] = None,
+    max_spec_size: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> DeploymentRequest:
+    """Load the OpenAPI specification from its source and build the deployment request."""
+    if spec_passthrough:
+        _check_passthrough(bundle_refs, operation_filter, prune_components)
+        return _build_raw_request(openapi_spec_path, name=name, base_url=base_url, auth_config=auth_config)
+
+    spec = _load_spec(
+        openapi_spec_path,
+        openapi_spec_url,
+        openapi_spec,
         timeout=timeout,
+        http_client=http_client,
+        deadline=deadline,
+        spec_cache=spec_cache,
+        max_spec_size=max_spec_size,
+        on_progress=on_progress,
     )
+    if bundle_refs:
+        _check_deadline(deadline, BUNDLE_PHASE)
+        spec = bundle_spec(
+            spec, openapi_spec_path or openapi_spec_url, http_client=http_client, timeout=timeout, deadline=deadline
+        )
+    spec = _filter_operations(spec, operation_filter, deadline)
+    if prune_components:
+        spec = _prune_components(spec, deadline)
+    return _build_request(spec, name=name, base_url=base_url, auth_config=auth_config)
+
+
+async def _prepare_request_async(
+    openapi_spec_path: Optional[str],
+    openapi_spec_url: Optional[str],
+    openapi_spec: Optional[Union[Dict[str, Any], OpenAPISpec]],
+    *,
+    name: Optional[str],
+    base_url: Optional[str],
+    auth_config: Optional[AuthConfig],
+    spec_passthrough: bool,
+    timeout: TimeoutTypes,
+    bundle_refs: bool = False,
+    operation_filter: Optional[OperationFilter] = None,
+    prune_components: bool = False,
+    deadline: Optional[Deadline] = None,
+    spec_cache: Optional[HTTPSpecCache] = None,
+    max_spec_size: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> DeploymentRequest:
+    """Load the OpenAPI specification without blocking the event loop and build the deployment request."""
+    if spec_passthrough:
+        _check_passthrough(bundle_refs, operation_filter, prune_components)
+        return _build_raw_request(openapi_spec_path, name=name, base_url=base_url, auth_config=auth_config)
+
+    spec = await _load_spec_async(
+        openapi_spec_path,
+        openapi_spec_url,
+        openapi_spec,
+        timeout=timeout,
+        deadline=deadline,
+        spec_cache=spec_cache,
+        max_spec_size=max_spec_size,
+        on_progress=on_progress,
+    )
+    if bundle_refs:
+        _check_deadline(deadline, BUNDLE_PHASE)
+        # Referenced files and URLs are loaded with blocking I/O
+        spec = await asyncio.to_thread(
+            bundle_spec, spec, openapi_spec_path or openapi_spec_url, timeout=timeout, deadline=deadline
+        )
+    spec = _filter_operations(spec, operation_filter, deadline)
+    if prune_components:
+        spec = _prune_components(spec, deadline)
+    return _build_request(spec, name=name, base_url=base_url, auth_config=auth_config)
+
+
+def _check_passthrough(bundle_refs: bool, operation_filter: Optional[OperationFilter], prune_components: bool) -> None:
+    """Reject options that need the spec parsed when it is uploaded as-is."""
+    if bundle_refs:
+        raise ValueError("bundle_refs cannot be used with spec_passthrough")
+    if operation_filter is not None:
+        raise ValueError("operation_filter cannot be used with spec_passthrough")
+    if prune_components:
+        raise ValueError("prune_components cannot be used with spec_passthrough")
+
+
+def _filter_operations(
+    spec: OpenAPISpec, operation_filter: Optional[OperationFilter], deadline: Optional[Deadline]
+) -> OpenAPISpec:
+    """Keep only the operations `operation_filter` selects, if one is given."""
+    if operation_filter is None:
+        return spec
+    _check_deadline(deadline, FILTER_PHASE)
+    filtered = spec.filter_operations(operation_filter)
+    logger.info(f"Deploying {_count_operations(filtered)} of {_count_operations(spec)} operations")
+    return filtered
+
+
+def _prune_components(spec: OpenAPISpec, deadline: Optional[Deadline]) -> OpenAPISpec:
+    """Remove unused components from a copy of the spec, leaving the caller's spec untouched."""
+    _check_deadline(deadline, PRUNE_PHASE)
+    spec = spec.model_copy()
+    report = spec.prune_unused_components()
+    logger.info(str(report))
+    return spec
+
+
+def _count_operations(spec: OpenAPISpec) -> int:
+    path_items = (path_item for path_item in spec.paths.values() if isinstance(path_item, dict))
+    return sum(method in HTTP_METHODS for path_item in path_items for method in path_item)
+
+
+def _build_raw_request(
+    openapi_spec_path: Optional[str],
+    *,
+    name: Optional[str],
+    base_url: Optional[str],
+    auth_config: Optional[AuthConfig],
+) -> RawUpsertDeploymentRequest:
+    """Build a deployment request that streams the spec file without parsing it."""
+    if openapi_spec_path is None:
+        raise ValueError("spec_passthrough can only be used with openapi_spec_path")
+
+    logger.info(f"Uploading OpenAPI spec file as-is: {openapi_spec_path}")
+    return RawUpsertDeploymentRequest(openapi_spec_path, name=name, base_url=base_url, auth_config=auth_config)
 
-    request = UpsertDeploymentRequest(
+
+def _build_request(
+    spec: OpenAPISpec,
+    *,
+    name: Optional[str],
+    base_url: Optional[str],
+    auth_config: Optional[AuthConfig],
+) -> UpsertDeploymentRequest:
+    """Assemble the deployment request sent to the Tadata API."""
+    mcp_auth_config = AuthConfig()
+    if auth_config is not None:
+        mcp_auth_config = AuthConfig.model_validate(auth_config.model_dump())
+
+    return UpsertDeploymentRequest(
         openApiSpec=spec,
         name=name,
         baseUrl=base_url,
         authConfig=mcp_auth_config,
     )
 
-    api_response: DeploymentResponse = client.deploy_from_openapi(request)
 
-    result = DeploymentResult(api_response)
+def _deployment_result(api_response: DeploymentResponse, stats: Optional[RequestStats] = None) -> DeploymentResult:
+    """Turn an API response into a DeploymentResult and log the outcome."""
+    result = DeploymentResult(api_response, stats=stats)
 
     logger.info(f"Deployment successful - ID: {result.id}")
 
@@ -200,3 +766,51 @@ def deploy(
         logger.info("No changes in spec, deployment was skipped")
 
     return result
+
+
+def _ledger_lookup(
+    ledger: Optional[DeploymentLedger],
+    request: DeploymentRequest,
+    *,
+    api_key: str,
+    force: bool,
+) -> Tuple[Optional[DeploymentResult], Optional[str]]:
+    """Look up a request in the deployment ledger.
+
+    Returns:
+        A result built from the recorded response if the request is unchanged (and `force` is
+        not set), and the request fingerprint to record after deploying. Both are None when no
+        ledger is used.
+    """
+    if ledger is None:
+        return None, None
+
+    fingerprint = ledger.fingerprint(request)
+    if force:
+        return None, fingerprint
+
+    cached_response = ledger.lookup(api_key, request.name, fingerprint)
+    if cached_response is None:
+        return None, fingerprint
+
+    result = DeploymentResult(cached_response, skipped_locally=True)
+    logger.info(f"Spec unchanged since last deployment {result.id}, skipping upload")
+    return result, fingerprint
+
+
+def _ledger_record(
+    ledger: Optional[DeploymentLedger],
+    request: DeploymentRequest,
+    fingerprint: Optional[str],
+    api_response: DeploymentResponse,
+    *,
+    api_key: str,
+) -> None:
+    """Record a successful deployment in the ledger, if one is used."""
+    if ledger is None or fingerprint is None:
+        return
+    try:
+        ledger.record(api_key, request.name, fingerprint, api_response)
+    except OSError as e:
+        # The deployment itself succeeded; a ledger that cannot be written only costs a future upload
+        logger.warning(f"Failed to record deployment in ledger: {e}")
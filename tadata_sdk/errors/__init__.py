@@ -4,6 +4,8 @@ from .exceptions import (
     AuthError,
     ApiError,
     NetworkError,
+    DeadlineExceededError,
+    CircuitOpenError,
 )
 
 __all__ = [
@@ -12,4 +14,6 @@ __all__ = [
     "AuthError",
     "ApiError",
     "NetworkError",
+    "DeadlineExceededError",
+    "CircuitOpenError",
 ]
@@ -1,5 +1,8 @@
 from http import HTTPStatus
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from ..http.retry import RequestStats
 
 
 class TadataSDKError(Exception):
@@ -7,6 +10,9 @@ class TadataSDKError(Exception):
 
     All specific SDK errors will extend this class.
     You can use this class to catch any error thrown by the SDK.
+
+    Errors raised after a request was sent to the Tadata API carry a `stats` attribute with
+    the number of attempts made and the time spent waiting between retries; it is None otherwise.
     """
 
     def __init__(
@@ -29,6 +35,7 @@ class TadataSDKError(Exception):
         self.code = code
         self.status_code = status_code
         self.cause = cause
+        self.stats: Optional["RequestStats"] = None
 
 
 class SpecInvalidError(TadataSDKError):
@@ -110,3 +117,42 @@ class NetworkError(TadataSDKError):
             cause: Optional original error that led to this network error.
         """
         super().__init__(message, code="network_error", cause=cause)
+
+
+class DeadlineExceededError(TadataSDKError):
+    """Error thrown when a deployment runs out of the time budget given by its `deadline`.
+
+    The `phase` attribute tells which step was running or about to start: downloading,
+    reading or bundling the spec, or uploading the deployment.
+    """
+
+    def __init__(self, message: str, phase: Optional[str] = None, cause: Optional[Exception] = None) -> None:
+        """Create a new DeadlineExceededError.
+
+        Args:
+            message: A human-readable description of the error.
+            phase: The deployment step that ran out of time.
+            cause: Optional original error, e.g. the request timeout that hit the deadline.
+        """
+        super().__init__(message, code="deadline_exceeded", status_code=HTTPStatus.REQUEST_TIMEOUT, cause=cause)
+        self.phase = phase
+
+
+class CircuitOpenError(TadataSDKError):
+    """Error thrown without contacting the Tadata API because its circuit breaker is open.
+
+    The circuit opens after repeated network errors or server errors, so that callers fail fast
+    instead of waiting for timeouts while the API is degraded.
+    """
+
+    def __init__(self, message: str, base_url: Optional[str] = None, retry_in: Optional[float] = None) -> None:
+        """Create a new CircuitOpenError.
+
+        Args:
+            message: A human-readable description of the error.
+            base_url: Base URL of the API whose circuit is open.
+            retry_in: Seconds until the circuit lets a probe request through.
+        """
+        super().__init__(message, code="circuit_open", status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+        self.base_url = base_url
+        self.retry_in = retry_in
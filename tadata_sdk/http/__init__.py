@@ -1,13 +1,55 @@
-from .client import ApiClient
-from .schemas import (
-    DeploymentResponse,
-    UpsertDeploymentRequest,
-    AuthConfig,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .circuit import CircuitBreaker
+    from .client import ApiClient, AsyncApiClient
+    from .hedging import HedgingPolicy
+    from .raw_request import RawUpsertDeploymentRequest
+    from .retry import RequestStats, RetryBudget, RetryPolicy
+    from .schemas import (
+        DeploymentResponse,
+        UpsertDeploymentRequest,
+        AuthConfig,
+    )
+
+# Submodules are imported on first access, so that using the schemas does not import httpx
+_LAZY_IMPORTS: Dict[str, str] = {
+    "ApiClient": ".client",
+    "AsyncApiClient": ".client",
+    "DeploymentResponse": ".schemas",
+    "UpsertDeploymentRequest": ".schemas",
+    "RawUpsertDeploymentRequest": ".raw_request",
+    "AuthConfig": ".schemas",
+    "RetryPolicy": ".retry",
+    "RetryBudget": ".retry",
+    "RequestStats": ".retry",
+    "CircuitBreaker": ".circuit",
+    "HedgingPolicy": ".hedging",
+}
 
 __all__ = [
     "ApiClient",
+    "AsyncApiClient",
     "DeploymentResponse",
     "UpsertDeploymentRequest",
+    "RawUpsertDeploymentRequest",
     "AuthConfig",
+    "RetryPolicy",
+    "RetryBudget",
+    "RequestStats",
+    "CircuitBreaker",
+    "HedgingPolicy",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
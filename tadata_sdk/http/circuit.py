@@ -0,0 +1,185 @@
+"""Circuit breaker that fails requests fast while the Tadata API is degraded."""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Literal, Optional
+from typing_extensions import Annotated, Doc
+
+from ..errors.exceptions import CircuitOpenError
+
+
+logger = logging.getLogger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+_registry: Dict[str, "CircuitBreaker"] = {}
+_registry_lock = threading.Lock()
+
+
+class CircuitBreaker:
+    """In-process circuit breaker for one Tadata API base URL.
+
+    While closed, requests go through and their outcomes are recorded. The circuit opens after
+    `failure_threshold` consecutive failures, or when at least `failure_rate_threshold` of the
+    last `window_size` requests failed (once `minimum_calls` were made). While open, requests
+    fail immediately with CircuitOpenError. After `reset_timeout` seconds the circuit becomes
+    half-open and lets up to `half_open_max_calls` probe requests through: a successful probe
+    closes it again, a failed one reopens it.
+
+    Network errors and 5xx responses count as failures; other responses show that the API is
+    up and count as successes. The breaker is safe to use from several threads.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: Annotated[int, Doc("Consecutive failures that open the circuit")] = 5,
+        failure_rate_threshold: Annotated[float, Doc("Failure rate over the window that opens the circuit")] = 0.5,
+        window_size: Annotated[int, Doc("Number of recent requests the failure rate is computed over")] = 20,
+        minimum_calls: Annotated[int, Doc("Requests needed in the window before the rate is considered")] = 10,
+        reset_timeout: Annotated[float, Doc("Seconds the circuit stays open before probing again")] = 30.0,
+        half_open_max_calls: Annotated[int, Doc("Probe requests allowed at once while half-open")] = 1,
+        name: Annotated[Optional[str], Doc("Name used in logs and errors, usually the base URL")] = None,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._state: CircuitState = "closed"
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._times_opened = 0
+        self._rejected = 0
+
+    @classmethod
+    def for_base_url(cls, base_url: str, **settings: Any) -> "CircuitBreaker":
+        """Return the circuit breaker shared by every client of a base URL.
+
+        The breaker is created with `settings` on first use; later calls return the same
+        instance and ignore `settings`.
+
+        Args:
+            base_url: Base URL of the Tadata API.
+            **settings: Arguments for the CircuitBreaker constructor.
+
+        Returns:
+            The shared circuit breaker.
+        """
+        key = base_url.rstrip("/")
+        with _registry_lock:
+            breaker = _registry.get(key)
+            if breaker is None:
+                breaker = _registry[key] = cls(name=key, **settings)
+            return breaker
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        if self._state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = "half_open"
+            self._probes_in_flight = 0
+            logger.info(f"Circuit {self.name} is half-open, probing the API")
+        return self._state
+
+    def before_request(self) -> None:
+        """Check that a request may be sent, reserving a probe slot when half-open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all probe slots taken.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == "closed":
+                return
+            if state == "half_open" and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                return
+            self._rejected += 1
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(
+            f"Circuit for {self.name or 'the Tadata API'} is open after repeated failures, not sending the request",
+            base_url=self.name,
+            retry_in=retry_in,
+        )
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy API."""
+        with self._lock:
+            if self._state == "half_open":
+                logger.info(f"Circuit {self.name} closed, the API is healthy again")
+                self._state = "closed"
+                self._outcomes.clear()
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            self._consecutive_failures = 0
+            self._outcomes.append(True)
+
+    def release(self) -> None:
+        """Give back the probe slot of a request that ended without reaching the API."""
+        with self._lock:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def record_failure(self) -> None:
+        """Record a request that failed because the API is unreachable or degraded."""
+        with self._lock:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            self._consecutive_failures += 1
+            self._outcomes.append(False)
+            if self._state == "half_open" or (self._state == "closed" and self._should_open()):
+                self._open()
+
+    def _should_open(self) -> bool:
+        if self._consecutive_failures >= self.failure_threshold:
+            return True
+        if len(self._outcomes) < self.minimum_calls:
+            return False
+        return self._failure_rate() >= self.failure_rate_threshold
+
+    def _failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _open(self) -> None:
+        logger.warning(f"Circuit {self.name} opened, failing requests fast for {self.reset_timeout:.0f}s")
+        self._state = "open"
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+
+    def reset(self) -> None:
+        """Close the circuit and forget all recorded outcomes."""
+        with self._lock:
+            self._state = "closed"
+            self._outcomes.clear()
+            self._consecutive_failures = 0
+            self._probes_in_flight = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the breaker's state and counters, e.g. for exporting as metrics."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self._current_state(),
+                "consecutive_failures": self._consecutive_failures,
+                "failure_rate": self._failure_rate(),
+                "window_calls": len(self._outcomes),
+                "times_opened": self._times_opened,
+                "rejected_calls": self._rejected,
+            }
+
+
+def circuit_breaker_snapshots() -> Dict[str, Dict[str, Any]]:
+    """Return the snapshot of every shared circuit breaker, keyed by base URL."""
+    with _registry_lock:
+        breakers = list(_registry.items())
+    return {base_url: breaker.snapshot() for base_url, breaker in breakers}
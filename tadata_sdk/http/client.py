@@ -1,84 +1,399 @@
+import asyncio
 import logging
-from typing import Any, Dict, Literal, Optional
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Literal, NoReturn, Optional, Tuple, Union
 from typing_extensions import Annotated, Doc
 
 import httpx
 
-from ..errors.exceptions import ApiError, AuthError, NetworkError
+from .. import json_backend
+from ..errors.exceptions import ApiError, AuthError, CircuitOpenError, NetworkError
+from .circuit import CircuitBreaker
+from .compression import Compression, compress_body, compress_chunks, resolve_encoding
+from .deadline import Deadline, TimeoutTypes
+from .hedging import HedgingPolicy
+from .raw_request import RawUpsertDeploymentRequest
+from .retry import RequestStats, RetryPolicy
 from .schemas import DeploymentResponse, UpsertDeploymentRequest
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BASE_URL = "https://api.tadata.com"
 
-class ApiClient:
-    """HTTP client for the Tadata API.
+DeploymentRequest = Union[UpsertDeploymentRequest, RawUpsertDeploymentRequest]
+RequestContent = Union[bytes, RawUpsertDeploymentRequest]
+EncodedBody = Tuple[RequestContent, RequestContent, Dict[str, str]]
 
-    This client handles communication with the Tadata API, including authentication,
-    request formatting, and error handling.
+# Deadline phase of API requests, used in DeadlineExceededError messages
+UPLOAD_PHASE = "uploading the deployment"
+
+# Header telling the API that requests with the same value are the same logical operation
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+def _json_body(response: httpx.Response) -> Any:
+    """Decode a JSON response body from bytes, or wrap its text when it is not JSON."""
+    try:
+        return json_backend.loads(response.content)
+    except ValueError:
+        return {"body": response.text}
+
+
+class _BaseApiClient:
+    """Transport-independent parts of the Tadata API client.
+
+    Holds the configuration and the mapping from HTTP failures to SDK exceptions, so that
+    the synchronous and asynchronous clients behave identically.
     """
 
     def __init__(
         self,
         api_key: Annotated[str, Doc("The Tadata API key for authentication")],
         version: Annotated[Literal["05-2025", "latest"], Doc("The API version to use")] = "latest",
-        timeout: Annotated[int, Doc("Request timeout in seconds")] = 30,
+        timeout: Annotated[
+            TimeoutTypes,
+            Doc("Request timeout in seconds, or an httpx.Timeout setting connect, read, write and pool timeouts"),
+        ] = 30,
+        base_url: Annotated[str, Doc("Base URL of the Tadata API")] = DEFAULT_BASE_URL,
+        compression: Annotated[
+            Compression,
+            Doc('Request body compression: "none" (the default), "auto" (gzip), "gzip", "zstd" or "br"'),
+        ] = "none",
+        retry: Annotated[Optional[RetryPolicy], Doc("When to retry failed requests. Defaults to RetryPolicy()")] = None,
+        circuit_breaker: Annotated[
+            Union[bool, CircuitBreaker],
+            Doc("Circuit breaker to fail fast while the API is degraded. True uses the one shared by the base URL"),
+        ] = False,
+        hedging: Annotated[
+            Optional[HedgingPolicy],
+            Doc("Send a second copy of slow requests that carry an idempotency key. Disabled by default"),
+        ] = None,
     ) -> None:
         self.api_key = api_key
-        self.base_url = "https://api.tadata.com"
+        self.base_url = base_url.rstrip("/")
         self.version = version
         self.timeout = timeout
-
-        self.client = httpx.Client(
-            timeout=timeout,
-            headers={
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "x-api-version": version,
-            },
+        self.compression = compression
+        self._content_encoding = resolve_encoding(compression)
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.circuit_breaker: Optional[CircuitBreaker] = (
+            CircuitBreaker.for_base_url(self.base_url) if circuit_breaker is True else circuit_breaker or None
         )
+        self.hedging = hedging
+
+    def _default_headers(self) -> Dict[str, str]:
+        """Return the headers sent with every request.
+
+        They are sent per request rather than configured on the httpx client, so that one
+        connection pool can be shared by clients with different settings.
+        """
+        return {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "x-api-version": self.version,
+        }
+
+    def _prepare_request(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[str, Dict[str, Any], Dict[str, str]]:
+        """Build the URL, query parameters and headers for a request."""
+        url = f"{self.base_url}{path}"
+        request_params = {} if params is None else params.copy()
+        request_params["apiKey"] = self.api_key
+        request_headers = self._default_headers()
+        if headers is not None:
+            request_headers.update(headers)
+        return url, request_params, request_headers
 
-    def _handle_request_error(self, error: httpx.RequestError, message: str = "Network error occurred") -> None:
+    def _encode_body(self, data: Optional[Dict[str, Any]], content: Optional[RequestContent]) -> EncodedBody:
+        """Serialize a JSON request body, unless it is already encoded, and compress it when worthwhile.
+
+        Args:
+            data: The request body data.
+            content: The request body, already encoded as JSON. Takes precedence over `data`.
+
+        Returns:
+            The uncompressed body, the body to send, and the extra headers it needs.
+        """
+        if isinstance(content, RawUpsertDeploymentRequest):
+            compressed, encoding = compress_chunks(content, content.content_length, self._content_encoding)
+            if compressed is None:
+                return content, content, {}
+            return content, compressed, {"Content-Encoding": encoding} if encoding is not None else {}
+
+        if content is not None:
+            raw = content
+        else:
+            raw = json_backend.dumps(data)
+        body, encoding = compress_body(raw, self._content_encoding)
+        return raw, body, {"Content-Encoding": encoding} if encoding is not None else {}
+
+    @staticmethod
+    def _content_headers(content: Optional[RequestContent], headers: Dict[str, str]) -> Dict[str, str]:
+        """Add the Content-Length of a streamed body, so it is not sent with chunked encoding."""
+        if isinstance(content, RawUpsertDeploymentRequest):
+            return {**headers, "Content-Length": str(content.content_length)}
+        return headers
+
+    @staticmethod
+    def _request_content(request: DeploymentRequest) -> RequestContent:
+        """Return the body of a deployment request, encoded or streamed."""
+        if isinstance(request, RawUpsertDeploymentRequest):
+            return request
+        return request.to_json_bytes()
+
+    def _encoding_rejected(self, response: httpx.Response) -> bool:
+        """Check whether the server refused a compressed request body.
+
+        If so, compression is turned off for the rest of this client's lifetime, so that the
+        caller can resend the body uncompressed and later requests do not pay for a failed attempt.
+        """
+        # Only 415 Unsupported Media Type says the encoding was the problem. A 400 may be a
+        # genuinely malformed request, which must be reported rather than uploaded again.
+        rejected = response.status_code == 415
+        if rejected:
+            logger.warning(
+                f"Server rejected {self._content_encoding} request body ({response.status_code}), "
+                "sending uncompressed bodies from now on"
+            )
+            self._content_encoding = None
+        return rejected
+
+    def _retry_delay(
+        self,
+        stats: RequestStats,
+        *,
+        response: Optional[httpx.Response] = None,
+        error: Optional[httpx.RequestError] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[float]:
+        """Return how long to wait before retrying a failed attempt, or None to give up."""
+        delay = self.retry.next_delay(stats.attempts, response=response, error=error)
+        if delay is not None and deadline is not None and delay >= deadline.remaining():
+            logger.warning("Not retrying, the deployment deadline would pass before the next attempt")
+            return None
+        if delay is not None:
+            reason = f"status {response.status_code}" if response is not None else repr(error)
+            logger.warning(
+                f"Request failed ({reason}), retrying in {delay:.2f}s "
+                f"(attempt {stats.attempts} of {self.retry.max_attempts})"
+            )
+            stats.retry_wait += delay
+        return delay
+
+    def _attempt_timeout(
+        self, stats: RequestStats, deadline: Optional[Deadline], cause: Optional[Exception] = None
+    ) -> TimeoutTypes:
+        """Return the timeout for the next attempt, shortened to the deadline if there is one.
+
+        Raises:
+            DeadlineExceededError: If the deadline has passed, carrying `stats` and `cause`.
+        """
+        if deadline is None:
+            return self.timeout
+        if not deadline.expired:
+            return deadline.timeout(self.timeout, UPLOAD_PHASE)
+        exception = deadline.exceeded(UPLOAD_PHASE, cause=cause)
+        exception.stats = stats
+        raise exception from cause
+
+    def _check_circuit(self, stats: RequestStats) -> None:
+        """Raise CircuitOpenError, carrying `stats`, if the circuit breaker rejects the next attempt."""
+        if self.circuit_breaker is None:
+            return
+        try:
+            self.circuit_breaker.before_request()
+        except CircuitOpenError as e:
+            e.stats = stats
+            raise
+
+    def _record_outcome(self, response: Optional[httpx.Response] = None, sent: bool = True) -> None:
+        """Report an attempt to the circuit breaker.
+
+        Args:
+            response: The response, or None if the request failed with a network error.
+            sent: False if the attempt ended before reaching the API, e.g. because it was cancelled.
+        """
+        if self.circuit_breaker is None:
+            return
+        if not sent:
+            self.circuit_breaker.release()
+        elif response is None or response.status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+    def _handle_request_error(
+        self,
+        error: httpx.RequestError,
+        message: str = "Network error occurred",
+        stats: Optional[RequestStats] = None,
+    ) -> NoReturn:
         """Handle request errors by raising appropriate domain exceptions.
 
         Args:
             error: The original request error.
             message: Custom error message to include.
+            stats: Attempts made for the request, attached to the exception.
 
         Raises:
             NetworkError: For network-related errors.
         """
         logger.error(f"Request error: {error}")
-        raise NetworkError(f"{message}: {str(error)}", cause=error)
+        exception = NetworkError(f"{message}: {str(error)}", cause=error)
+        exception.stats = stats
+        raise exception
 
-    def _handle_response_error(self, response: httpx.Response) -> None:
+    def _handle_response_error(self, response: httpx.Response, stats: Optional[RequestStats] = None) -> NoReturn:
         """Handle error responses by raising appropriate domain exceptions.
 
         Args:
             response: The HTTP response object.
+            stats: Attempts made for the request, attached to the exception.
 
         Raises:
             AuthError: For authentication errors (401, 403).
             ApiError: For all other API errors.
         """
         status_code = response.status_code
+        error_data = _json_body(response)
         try:
-            error_data = response.json()
             error_msg = (
                 error_data.get("error", {}).get("message", f"API error: {status_code}")
                 if isinstance(error_data, dict)
                 else f"API error: {status_code}"
             )
-        except Exception:
-            error_data = {"body": response.text}
+        except AttributeError:
             error_msg = f"API error: {status_code}"
 
+        exception: Union[AuthError, ApiError]
         if status_code in (401, 403):
             logger.error(f"Authentication error: {status_code}")
-            raise AuthError(error_msg, cause=Exception(str(error_data)))
+            exception = AuthError(error_msg, cause=Exception(str(error_data)))
+        else:
+            logger.error(f"API error: {status_code} - {error_msg}\n{error_data}")
+            exception = ApiError(error_msg, status_code, error_data)
+        exception.stats = stats
+        raise exception
+
+    def _parse_deployment_response(
+        self, response: httpx.Response, stats: Optional[RequestStats] = None
+    ) -> DeploymentResponse:
+        """Parse a deployment response body.
+
+        Args:
+            response: The successful HTTP response.
+            stats: Attempts made for the request, attached to the exception.
+
+        Returns:
+            The parsed deployment response.
+
+        Raises:
+            ApiError: If the response body is not a valid deployment response.
+        """
+        # Decode the body once: it is reused in the error if it is not a valid deployment response
+        body = _json_body(response)
+        try:
+            return DeploymentResponse.model_validate(body)
+        except Exception as e:
+            logger.error(f"Failed to parse deployment response: {e}")
+            exception = ApiError(
+                "Failed to parse deployment response",
+                response.status_code,
+                body,
+                cause=e,
+            )
+            exception.stats = stats
+            raise exception
+
 
-        logger.error(f"API error: {status_code} - {error_msg}\n{error_data}")
-        raise ApiError(error_msg, status_code, error_data)
+class ApiClient(_BaseApiClient):
+    """HTTP client for the Tadata API.
+
+    This client handles communication with the Tadata API, including authentication,
+    request formatting, and error handling.
+    """
+
+    def __init__(
+        self,
+        api_key: Annotated[str, Doc("The Tadata API key for authentication")],
+        version: Annotated[Literal["05-2025", "latest"], Doc("The API version to use")] = "latest",
+        timeout: Annotated[
+            TimeoutTypes,
+            Doc("Request timeout in seconds, or an httpx.Timeout setting connect, read, write and pool timeouts"),
+        ] = 30,
+        http_client: Annotated[
+            Optional[httpx.Client],
+            Doc("Existing httpx.Client to send requests through. It is not closed by this client"),
+        ] = None,
+        base_url: Annotated[str, Doc("Base URL of the Tadata API")] = DEFAULT_BASE_URL,
+        compression: Annotated[
+            Compression,
+            Doc('Request body compression: "none" (the default), "auto" (gzip), "gzip", "zstd" or "br"'),
+        ] = "none",
+        retry: Annotated[Optional[RetryPolicy], Doc("When to retry failed requests. Defaults to RetryPolicy()")] = None,
+        circuit_breaker: Annotated[
+            Union[bool, CircuitBreaker],
+            Doc("Circuit breaker to fail fast while the API is degraded. True uses the one shared by the base URL"),
+        ] = False,
+        hedging: Annotated[
+            Optional[HedgingPolicy],
+            Doc("Send a second copy of slow requests that carry an idempotency key. Disabled by default"),
+        ] = None,
+    ) -> None:
+        super().__init__(
+            api_key=api_key,
+            version=version,
+            timeout=timeout,
+            base_url=base_url,
+            compression=compression,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+        )
+
+        self._owns_client = http_client is None
+        self.client = http_client if http_client is not None else httpx.Client(timeout=timeout)
+        self._hedge_executor = ThreadPoolExecutor(thread_name_prefix="tadata-hedge") if hedging is not None else None
+
+    def __enter__(self) -> "ApiClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP connections, unless the httpx.Client was provided by the caller."""
+        if self._hedge_executor is not None:
+            # Hedges that lost the race are not waited for
+            self._hedge_executor.shutdown(wait=False)
+        if self._owns_client:
+            self.client.close()
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        content: Optional[RequestContent],
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: TimeoutTypes,
+    ) -> httpx.Response:
+        """Send a single HTTP request through the underlying httpx client."""
+        return self.client.request(
+            method,
+            url,
+            content=content,
+            params=params,
+            headers=self._content_headers(content, headers),
+            timeout=timeout,
+        )
 
     def _request(
         self,
@@ -87,81 +402,428 @@ class ApiClient:
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        content: Optional[RequestContent] = None,
+        stats: Optional[RequestStats] = None,
+        deadline: Optional[Deadline] = None,
     ) -> httpx.Response:
-        """Make an HTTP request to the Tadata API.
+        """Make an HTTP request to the Tadata API, retrying transient failures according to `self.retry`.
 
         Args:
             method: HTTP method (GET, POST, etc.).
             path: API endpoint path.
             data: Optional request body data.
+            content: Optional request body already encoded as JSON (bytes or a raw spec file request),
+                used instead of `data`.
             params: Optional query parameters.
             headers: Optional additional headers.
+            stats: Optional object in which to record the attempts made.
+            deadline: Optional deadline that every attempt, and the waits between them, must end by.
 
         Returns:
             The HTTP response.
 
         Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            DeadlineExceededError: If the deadline passes.
             NetworkError: For network-related errors.
             AuthError: For authentication errors.
             ApiError: For API errors.
         """
-        url = f"{self.base_url}{path}"
-        request_params = {} if params is None else params.copy()
-        request_params["apiKey"] = self.api_key
-        request_headers = {} if headers is None else headers.copy()
+        url, request_params, request_headers = self._prepare_request(path, params, headers)
+        # The body is encoded and compressed once, and resent as-is by retries
+        encoded = self._encode_body(data, content) if data is not None or content is not None else None
+        stats = stats if stats is not None else RequestStats()
+
+        while True:
+            timeout = self._attempt_timeout(stats, deadline)
+            self._check_circuit(stats)
+            stats.attempts += 1
+            logger.debug(f"Making request: {method} {url} (attempt {stats.attempts})")
+            try:
+                response = self._send_attempt(method, url, encoded, request_params, request_headers, timeout, stats)
+            except httpx.RequestError as e:
+                self._record_outcome()
+                delay = self._retry_delay(stats, error=e, deadline=deadline)
+                if delay is None:
+                    self._attempt_timeout(stats, deadline, cause=e)
+                    self._handle_request_error(e, stats=stats)
+            except BaseException:
+                self._record_outcome(sent=False)
+                raise
+            else:
+                self._record_outcome(response)
+                if not response.is_error:
+                    self.retry.budget.record_success()
+                    return response
+                delay = self._retry_delay(stats, response=response, deadline=deadline)
+                if delay is None:
+                    self._handle_response_error(response, stats=stats)
+            time.sleep(delay)
+
+    def _send_attempt(
+        self,
+        method: str,
+        url: str,
+        encoded: Optional[EncodedBody],
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: TimeoutTypes,
+        stats: RequestStats,
+    ) -> httpx.Response:
+        """Send one attempt, hedging it if enabled and the request carries an idempotency key."""
+        if self.hedging is None or self._hedge_executor is None or IDEMPOTENCY_KEY_HEADER not in headers:
+            return self._send_encoded(method, url, encoded, params, headers, timeout)
+        hedging = self.hedging
+
+        def send() -> Tuple[httpx.Response, float]:
+            started = time.perf_counter()
+            response = self._send_encoded(method, url, encoded, params, headers, timeout)
+            return response, time.perf_counter() - started
+
+        delay = hedging.delay()
+        primary = self._hedge_executor.submit(send)
+        winner = hedge = primary
+        if delay is not None and not wait([primary], timeout=delay).done and hedging.acquire():
+            logger.debug(f"No response after {delay:.3f}s, sending a hedged request")
+            stats.hedges += 1
+            hedge = self._hedge_executor.submit(send)
+            hedge.add_done_callback(lambda _: hedging.release())
+            done, _ = wait([primary, hedge], return_when=FIRST_COMPLETED)
+            winner = primary if primary in done else hedge
+            if winner.exception() is not None:
+                # The first copy to finish failed, so the other one may still succeed
+                winner = hedge if winner is primary else primary
+
+        # A hedge that lost the race runs to completion in the background, its response is dropped
+        response, latency = winner.result()
+        if winner is not primary:
+            hedging.record_win()
+        hedging.record_latency(latency)
+        return response
+
+    def _send_encoded(
+        self,
+        method: str,
+        url: str,
+        encoded: Optional[EncodedBody],
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: TimeoutTypes,
+    ) -> httpx.Response:
+        """Send a request with an encoded body, resending it uncompressed if the server rejects the encoding."""
+        if encoded is None:
+            return self._send(method, url, None, params, headers, timeout)
+
+        raw, body, encoding_headers = encoded
+        if encoding_headers and self._content_encoding is None:
+            # Compression was turned off by an earlier attempt
+            body, encoding_headers = raw, {}
+        response = self._send(method, url, body, params, {**headers, **encoding_headers}, timeout)
+        if encoding_headers and self._encoding_rejected(response):
+            response = self._send(method, url, raw, params, headers, timeout)
+        return response
+
+    def deploy_from_openapi(
+        self,
+        request: DeploymentRequest,
+        stats: Optional[RequestStats] = None,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> DeploymentResponse:
+        """Deploy or update an MCP server from an OpenAPI specification.
 
-        logger.debug(f"Making request: {method} {url}")
+        The request is sent with an idempotency key, the same on every retry, so that the API
+        can answer a resent request with the result of the first one rather than deploying twice.
+        By default a random key is generated for each call, so that two deploys of the same
+        request are never taken for a replay of each other.
 
-        try:
-            if data is not None:
-                json_data = data
-                response = self.client.request(
-                    method,
-                    url,
-                    json=json_data,
-                    params=request_params,
-                    headers=request_headers,
-                )
-            else:
-                response = self.client.request(method, url, params=request_params, headers=request_headers)
+        Args:
+            request: The deployment request with OpenAPI spec and configuration. A
+                RawUpsertDeploymentRequest streams its spec file without parsing it.
+            stats: Optional object in which to record the attempts made. Exceptions raised
+                after a request was sent carry it as their `stats` attribute.
+            idempotency_key: Optional key to send instead of a random one, e.g. to let the API
+                deduplicate a request resent by a later call after the process restarted.
+            deadline: Optional deadline the request, including retries, must end by.
+
+        Returns:
+            The deployment response containing details about the deployed MCP server.
+
+        Raises:
+            DeadlineExceededError: If the deadline passes.
+            NetworkError: For network-related errors.
+            AuthError: For authentication errors.
+            ApiError: For API errors.
+        """
+        logger.info("Deploying MCP server from OpenAPI spec")
+
+        content = self._request_content(request)
+        # One key per call, shared by its retries and hedges only
+        headers = {IDEMPOTENCY_KEY_HEADER: idempotency_key or uuid.uuid4().hex}
+        response = self._request(
+            "POST", "/api/deployments/from-openapi", content=content, headers=headers, stats=stats, deadline=deadline
+        )
+
+        return self._parse_deployment_response(response, stats)
+
+
+class AsyncApiClient(_BaseApiClient):
+    """Asynchronous HTTP client for the Tadata API.
+
+    Mirrors `ApiClient` on top of `httpx.AsyncClient`, so deployments can run concurrently
+    on a single event loop without blocking it. Use it as an async context manager, or call
+    `aclose()` when done, to release its connections.
+    """
+
+    def __init__(
+        self,
+        api_key: Annotated[str, Doc("The Tadata API key for authentication")],
+        version: Annotated[Literal["05-2025", "latest"], Doc("The API version to use")] = "latest",
+        timeout: Annotated[
+            TimeoutTypes,
+            Doc("Request timeout in seconds, or an httpx.Timeout setting connect, read, write and pool timeouts"),
+        ] = 30,
+        http_client: Annotated[
+            Optional[httpx.AsyncClient],
+            Doc("Existing httpx.AsyncClient to send requests through. It is not closed by this client"),
+        ] = None,
+        base_url: Annotated[str, Doc("Base URL of the Tadata API")] = DEFAULT_BASE_URL,
+        compression: Annotated[
+            Compression,
+            Doc('Request body compression: "none" (the default), "auto" (gzip), "gzip", "zstd" or "br"'),
+        ] = "none",
+        retry: Annotated[Optional[RetryPolicy], Doc("When to retry failed requests. Defaults to RetryPolicy()")] = None,
+        circuit_breaker: Annotated[
+            Union[bool, CircuitBreaker],
+            Doc("Circuit breaker to fail fast while the API is degraded. True uses the one shared by the base URL"),
+        ] = False,
+        hedging: Annotated[
+            Optional[HedgingPolicy],
+            Doc("Send a second copy of slow requests that carry an idempotency key. Disabled by default"),
+        ] = None,
+    ) -> None:
+        super().__init__(
+            api_key=api_key,
+            version=version,
+            timeout=timeout,
+            base_url=base_url,
+            compression=compression,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+        )
+
+        self._owns_client = http_client is None
+        self.client = http_client if http_client is not None else httpx.AsyncClient(timeout=timeout)
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections, unless the httpx.AsyncClient was provided by the caller."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        content: Optional[RequestContent],
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: TimeoutTypes,
+    ) -> httpx.Response:
+        """Send a single HTTP request through the underlying httpx client."""
+        return await self.client.request(
+            method,
+            url,
+            content=content.async_stream() if isinstance(content, RawUpsertDeploymentRequest) else content,
+            params=params,
+            headers=self._content_headers(content, headers),
+            timeout=timeout,
+        )
 
-            if response.is_error:
-                self._handle_response_error(response)
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[RequestContent] = None,
+        stats: Optional[RequestStats] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> httpx.Response:
+        """Make an HTTP request to the Tadata API, retrying transient failures according to `self.retry`.
 
-            return response
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            path: API endpoint path.
+            data: Optional request body data.
+            content: Optional request body already encoded as JSON (bytes or a raw spec file request),
+                used instead of `data`.
+            params: Optional query parameters.
+            headers: Optional additional headers.
+            stats: Optional object in which to record the attempts made.
+            deadline: Optional deadline that every attempt, and the waits between them, must end by.
 
-        except httpx.RequestError as e:
-            self._handle_request_error(e)
-            raise  # This will never be reached, but makes type checking happy
+        Returns:
+            The HTTP response.
 
-    def deploy_from_openapi(self, request: UpsertDeploymentRequest) -> DeploymentResponse:
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            DeadlineExceededError: If the deadline passes.
+            NetworkError: For network-related errors.
+            AuthError: For authentication errors.
+            ApiError: For API errors.
+        """
+        url, request_params, request_headers = self._prepare_request(path, params, headers)
+        # The body is encoded and compressed once, off the event loop, and resent as-is by retries
+        encoded = (
+            await asyncio.to_thread(self._encode_body, data, content)
+            if data is not None or content is not None
+            else None
+        )
+        stats = stats if stats is not None else RequestStats()
+
+        while True:
+            timeout = self._attempt_timeout(stats, deadline)
+            self._check_circuit(stats)
+            stats.attempts += 1
+            logger.debug(f"Making request: {method} {url} (attempt {stats.attempts})")
+            try:
+                response = await self._send_attempt(
+                    method, url, encoded, request_params, request_headers, timeout, stats
+                )
+            except httpx.RequestError as e:
+                self._record_outcome()
+                delay = self._retry_delay(stats, error=e, deadline=deadline)
+                if delay is None:
+                    self._attempt_timeout(stats, deadline, cause=e)
+                    self._handle_request_error(e, stats=stats)
+            except BaseException:
+                self._record_outcome(sent=False)
+                raise
+            else:
+                self._record_outcome(response)
+                if not response.is_error:
+                    self.retry.budget.record_success()
+                    return response
+                delay = self._retry_delay(stats, response=response, deadline=deadline)
+                if delay is None:
+                    self._handle_response_error(response, stats=stats)
+            await asyncio.sleep(delay)
+
+    async def _send_attempt(
+        self,
+        method: str,
+        url: str,
+        encoded: Optional[EncodedBody],
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: TimeoutTypes,
+        stats: RequestStats,
+    ) -> httpx.Response:
+        """Send one attempt, hedging it if enabled and the request carries an idempotency key."""
+        if self.hedging is None or IDEMPOTENCY_KEY_HEADER not in headers:
+            return await self._send_encoded(method, url, encoded, params, headers, timeout)
+        hedging = self.hedging
+
+        async def send() -> Tuple[httpx.Response, float]:
+            started = time.perf_counter()
+            response = await self._send_encoded(method, url, encoded, params, headers, timeout)
+            return response, time.perf_counter() - started
+
+        delay = hedging.delay()
+        primary = asyncio.ensure_future(send())
+        winner = hedge = primary
+        try:
+            if delay is not None and not (await asyncio.wait([primary], timeout=delay))[0] and hedging.acquire():
+                logger.debug(f"No response after {delay:.3f}s, sending a hedged request")
+                stats.hedges += 1
+                hedge = asyncio.ensure_future(send())
+                hedge.add_done_callback(lambda _: hedging.release())
+                done, _ = await asyncio.wait([primary, hedge], return_when=asyncio.FIRST_COMPLETED)
+                winner = primary if primary in done else hedge
+                if winner.exception() is not None:
+                    # The first copy to finish failed, so the other one may still succeed
+                    winner = hedge if winner is primary else primary
+            response, latency = await winner
+        finally:
+            # Cancel the copy that lost the race, or both if this request was cancelled
+            for task in (primary, hedge):
+                if not task.done():
+                    task.cancel()
+
+        if winner is not primary:
+            hedging.record_win()
+        hedging.record_latency(latency)
+        return response
+
+    async def _send_encoded(
+        self,
+        method: str,
+        url: str,
+        encoded: Optional[EncodedBody],
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: TimeoutTypes,
+    ) -> httpx.Response:
+        """Send a request with an encoded body, resending it uncompressed if the server rejects the encoding."""
+        if encoded is None:
+            return await self._send(method, url, None, params, headers, timeout)
+
+        raw, body, encoding_headers = encoded
+        if encoding_headers and self._content_encoding is None:
+            # Compression was turned off by an earlier attempt
+            body, encoding_headers = raw, {}
+        response = await self._send(method, url, body, params, {**headers, **encoding_headers}, timeout)
+        if encoding_headers and self._encoding_rejected(response):
+            response = await self._send(method, url, raw, params, headers, timeout)
+        return response
+
+    async def deploy_from_openapi(
+        self,
+        request: DeploymentRequest,
+        stats: Optional[RequestStats] = None,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> DeploymentResponse:
         """Deploy or update an MCP server from an OpenAPI specification.
 
+        The request is sent with an idempotency key, the same on every retry, so that the API
+        can answer a resent request with the result of the first one rather than deploying twice.
+        By default a random key is generated for each call, so that two deploys of the same
+        request are never taken for a replay of each other.
+
         Args:
-            request: The deployment request with OpenAPI spec and configuration.
+            request: The deployment request with OpenAPI spec and configuration. A
+                RawUpsertDeploymentRequest streams its spec file without parsing it.
+            stats: Optional object in which to record the attempts made. Exceptions raised
+                after a request was sent carry it as their `stats` attribute.
+            idempotency_key: Optional key to send instead of a random one, e.g. to let the API
+                deduplicate a request resent by a later call after the process restarted.
+            deadline: Optional deadline the request, including retries, must end by.
 
         Returns:
             The deployment response containing details about the deployed MCP server.
 
         Raises:
+            DeadlineExceededError: If the deadline passes.
             NetworkError: For network-related errors.
             AuthError: For authentication errors.
             ApiError: For API errors.
         """
         logger.info("Deploying MCP server from OpenAPI spec")
 
-        response = self._request(
-            "POST", "/api/deployments/from-openapi", data=request.model_dump(by_alias=True, exclude_none=True)
+        content = self._request_content(request)
+        # One key per call, shared by its retries and hedges only
+        headers = {IDEMPOTENCY_KEY_HEADER: idempotency_key or uuid.uuid4().hex}
+        response = await self._request(
+            "POST", "/api/deployments/from-openapi", content=content, headers=headers, stats=stats, deadline=deadline
         )
 
-        try:
-            result = DeploymentResponse.model_validate(response.json())
-            return result
-        except Exception as e:
-            logger.error(f"Failed to parse deployment response: {e}")
-            raise ApiError(
-                "Failed to parse deployment response",
-                response.status_code,
-                response.json(),
-                cause=e,
-            )
+        return self._parse_deployment_response(response, stats)
@@ -0,0 +1,171 @@
+"""Request body compression for uploads to the Tadata API.
+
+gzip is always available. zstd and brotli are used only when requested explicitly and the
+optional `zstandard` or `brotli` package is installed.
+"""
+
+import gzip
+import logging
+import zlib
+from typing import Callable, Dict, Iterable, List, Literal, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+Compression = Literal["auto", "gzip", "zstd", "br", "none"]
+
+# Bodies smaller than this are sent as-is: the saving is a few hundred bytes at most,
+# and it is not worth the CPU time or the risk of a server not accepting encoded bodies.
+MIN_COMPRESSION_SIZE = 16 * 1024
+
+# (upper size bound in bytes, level) pairs, checked in order. Small bodies compress quickly,
+# so they get a high level; very large bodies get a cheaper level, because on large JSON the
+# ratio barely improves while CPU time grows much faster.
+_LEVELS: Dict[str, List[Tuple[float, int]]] = {
+    "gzip": [(1024 * 1024, 6), (16 * 1024 * 1024, 4), (float("inf"), 1)],
+    "zstd": [(1024 * 1024, 9), (16 * 1024 * 1024, 3), (float("inf"), 1)],
+    "br": [(1024 * 1024, 6), (16 * 1024 * 1024, 4), (float("inf"), 2)],
+}
+
+
+def _gzip(body: bytes, level: int) -> bytes:
+    # mtime=0 keeps the output deterministic for identical bodies
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def _zstd(body: bytes, level: int) -> bytes:
+    import zstandard  # type: ignore[import]
+
+    return zstandard.ZstdCompressor(level=level).compress(body)
+
+
+def _brotli(body: bytes, level: int) -> bytes:
+    import brotli  # type: ignore[import]
+
+    return brotli.compress(body, quality=level)
+
+
+_COMPRESSORS: Dict[str, Callable[[bytes, int], bytes]] = {"gzip": _gzip, "zstd": _zstd, "br": _brotli}
+
+
+def _stream_compressor(encoding: str, level: int) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+    """Return (compress, flush) functions of an incremental compressor."""
+    if encoding == "gzip":
+        # wbits=31 selects the gzip container
+        gzip_obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+        return gzip_obj.compress, gzip_obj.flush
+    if encoding == "zstd":
+        import zstandard  # type: ignore[import]
+
+        zstd_obj = zstandard.ZstdCompressor(level=level).compressobj()
+        return zstd_obj.compress, zstd_obj.flush
+    import brotli  # type: ignore[import]
+
+    brotli_obj = brotli.Compressor(quality=level)
+    return brotli_obj.process, brotli_obj.finish
+
+
+def is_available(encoding: str) -> bool:
+    """Check whether a content encoding can be produced in this environment.
+
+    Args:
+        encoding: One of "gzip", "zstd" or "br".
+
+    Returns:
+        True if the encoding can be used.
+    """
+    if encoding == "gzip":
+        return True
+    module = {"zstd": "zstandard", "br": "brotli"}.get(encoding)
+    if module is None:
+        return False
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_encoding(compression: Compression) -> Optional[str]:
+    """Resolve a compression setting to the content encoding to use.
+
+    Args:
+        compression: "auto" (gzip), an explicit encoding, or "none".
+
+    Returns:
+        The content encoding, or None if bodies should not be compressed.
+
+    Raises:
+        ValueError: If the setting is unknown or the encoding's package is not installed.
+    """
+    if compression == "none":
+        return None
+    if compression == "auto":
+        return "gzip"
+    if compression not in _COMPRESSORS:
+        raise ValueError(f"Unknown compression: {compression!r}")
+    if not is_available(compression):
+        package = {"zstd": "zstandard", "br": "brotli"}[compression]
+        raise ValueError(f"Compression {compression!r} requires the {package!r} package to be installed")
+    return compression
+
+
+def compression_level(encoding: str, size: int) -> int:
+    """Pick the compression level for a body of the given size."""
+    for max_size, level in _LEVELS[encoding]:
+        if size <= max_size:
+            return level
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def compress_body(body: bytes, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    """Compress a request body if it is large enough to benefit.
+
+    Args:
+        body: The encoded request body.
+        encoding: The content encoding to use, or None to never compress.
+
+    Returns:
+        The body to send and its content encoding, or None if it was left uncompressed.
+    """
+    if encoding is None or len(body) < MIN_COMPRESSION_SIZE:
+        return body, None
+
+    level = compression_level(encoding, len(body))
+    compressed = _COMPRESSORS[encoding](body, level)
+    if len(compressed) >= len(body):
+        return body, None
+
+    logger.debug(f"Compressed request body with {encoding} level {level}: {len(body)} -> {len(compressed)} bytes")
+    return compressed, encoding
+
+
+def compress_chunks(
+    chunks: Iterable[bytes], size: int, encoding: Optional[str]
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """Compress a request body given as a stream of chunks, if it is large enough to benefit.
+
+    Only the compressed output is held in memory, never the whole uncompressed body.
+
+    Args:
+        chunks: The encoded request body, in chunks.
+        size: Total size of the body in bytes.
+        encoding: The content encoding to use, or None to never compress.
+
+    Returns:
+        The compressed body and its content encoding, or (None, None) if the body should be
+        sent uncompressed.
+    """
+    if encoding is None or size < MIN_COMPRESSION_SIZE:
+        return None, None
+
+    level = compression_level(encoding, size)
+    compress, flush = _stream_compressor(encoding, level)
+    parts = [compress(chunk) for chunk in chunks]
+    parts.append(flush())
+    compressed = b"".join(parts)
+    if len(compressed) >= size:
+        return None, None
+
+    logger.debug(f"Compressed streamed request body with {encoding} level {level}: {size} -> {len(compressed)} bytes")
+    return compressed, encoding
@@ -0,0 +1,87 @@
+"""Time budget shared by every phase of a deployment."""
+
+import time
+from typing import Optional, Union
+
+import httpx
+
+from ..errors.exceptions import DeadlineExceededError
+
+
+# A number of seconds for every timeout, or an httpx.Timeout setting connect, read, write and pool separately
+TimeoutTypes = Union[float, httpx.Timeout]
+
+
+class Deadline:
+    """Point in time by which a whole deployment must be done.
+
+    The spec download, parsing and upload each check the deadline before starting, and network
+    requests get their timeouts shortened to the time left, so a deployment never runs much
+    longer than its budget. One deadline can be shared, e.g. by all items of a batch.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        """Start a deadline.
+
+        Args:
+            seconds: The time budget, counted from now.
+        """
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline, or 0 once it has passed."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.remaining() <= 0
+
+    def exceeded(self, phase: str, cause: Optional[Exception] = None) -> DeadlineExceededError:
+        """Build the error reporting that the deadline passed before or during `phase`."""
+        return DeadlineExceededError(
+            f"Deployment deadline of {self.seconds:g}s exceeded while {phase}", phase=phase, cause=cause
+        )
+
+    def check(self, phase: str) -> float:
+        """Return the seconds left for `phase`.
+
+        Raises:
+            DeadlineExceededError: If the deadline has already passed.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise self.exceeded(phase)
+        return remaining
+
+    def timeout(self, timeout: TimeoutTypes, phase: str) -> httpx.Timeout:
+        """Shorten each part of a request timeout to the time left.
+
+        Args:
+            timeout: The configured timeout.
+            phase: What the request is for, used in the error message.
+
+        Returns:
+            An httpx.Timeout whose connect, read, write and pool timeouts all end by the deadline.
+
+        Raises:
+            DeadlineExceededError: If the deadline has already passed.
+        """
+        remaining = self.check(phase)
+        configured = timeout if isinstance(timeout, httpx.Timeout) else httpx.Timeout(timeout)
+        return httpx.Timeout(
+            connect=_capped(configured.connect, remaining),
+            read=_capped(configured.read, remaining),
+            write=_capped(configured.write, remaining),
+            pool=_capped(configured.pool, remaining),
+        )
+
+
+def _capped(value: Optional[float], remaining: float) -> float:
+    return remaining if value is None else min(value, remaining)
+
+
+def phase_timeout(deadline: Optional[Deadline], timeout: TimeoutTypes, phase: str) -> TimeoutTypes:
+    """Return the timeout for a request made during `phase`, shortened to the deadline if there is one."""
+    return timeout if deadline is None else deadline.timeout(timeout, phase)
@@ -0,0 +1,109 @@
+"""Hedged requests: sending a second copy of a slow request to cut tail latency."""
+
+import math
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from typing_extensions import Annotated, Doc
+
+
+class HedgingPolicy:
+    """When to send a second copy of a slow idempotent request, and how many to allow.
+
+    If a request has not been answered after the `percentile`-th percentile of recent response
+    times, a hedge (a second, identical request) is sent, and whichever answers first is used.
+    Only requests sent with an idempotency key are hedged, so that the API treats both copies
+    as one operation.
+
+    Hedging adds load, so it is strictly capped: no hedge is sent until `min_samples` response
+    times have been seen, hedges are limited to `max_hedge_ratio` of requests on average (with
+    bursts of at most one hedge), and to `max_in_flight` at once.
+
+    Share one policy between clients to share its latency samples and caps. It is safe to use
+    from several threads.
+    """
+
+    def __init__(
+        self,
+        percentile: Annotated[float, Doc("Percentile of recent response times to wait before hedging")] = 95.0,
+        min_delay: Annotated[float, Doc("Shortest wait before hedging, in seconds")] = 0.1,
+        window_size: Annotated[int, Doc("Number of recent response times the percentile is computed over")] = 200,
+        min_samples: Annotated[int, Doc("Response times needed before any request is hedged")] = 20,
+        max_hedge_ratio: Annotated[float, Doc("Most hedges sent per request, on average")] = 0.05,
+        max_in_flight: Annotated[int, Doc("Most hedges waiting for a response at once")] = 2,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.max_in_flight = max_in_flight
+
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+        self._tokens = 0.0
+        self._in_flight = 0
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._refused = 0
+
+    def delay(self) -> Optional[float]:
+        """Count a new request and return how long to wait before hedging it.
+
+        Returns:
+            Seconds to wait, or None while there are too few response times to hedge.
+        """
+        with self._lock:
+            self._requests += 1
+            self._tokens = min(1.0, self._tokens + self.max_hedge_ratio)
+            if len(self._latencies) < self.min_samples:
+                return None
+            return max(self.min_delay, self._percentile_latency())
+
+    def _percentile_latency(self) -> float:
+        ordered = sorted(self._latencies)
+        return ordered[max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1)]
+
+    def acquire(self) -> bool:
+        """Reserve a hedge for a request still unanswered after the delay.
+
+        Returns:
+            True if the hedge may be sent, False if it would exceed the caps.
+        """
+        with self._lock:
+            if self._tokens < 1 or self._in_flight >= self.max_in_flight:
+                self._refused += 1
+                return False
+            self._tokens -= 1
+            self._in_flight += 1
+            self._hedges += 1
+            return True
+
+    def release(self) -> None:
+        """Record that a hedge reserved with `acquire()` has finished."""
+        with self._lock:
+            self._in_flight -= 1
+
+    def record_win(self) -> None:
+        """Record that a hedge answered before the original request."""
+        with self._lock:
+            self._hedge_wins += 1
+
+    def record_latency(self, seconds: float) -> None:
+        """Record how long a request took to be answered."""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the hedging counters, e.g. for exporting as metrics."""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "hedges": self._hedges,
+                "hedge_wins": self._hedge_wins,
+                "hedges_refused": self._refused,
+                "hedges_in_flight": self._in_flight,
+                "delay": max(self.min_delay, self._percentile_latency()) if self._latencies else None,
+            }
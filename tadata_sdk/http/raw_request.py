@@ -0,0 +1,163 @@
+"""Deployment requests that upload a JSON spec file without parsing it."""
+
+import asyncio
+import codecs
+import hashlib
+import os
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Iterator, Optional, Union
+
+from .. import json_backend
+from ..errors.exceptions import SpecInvalidError
+from .schemas import AuthConfig
+
+CHUNK_SIZE = 64 * 1024
+
+
+class RawUpsertDeploymentRequest:
+    """Request to deploy an MCP server from a JSON spec file uploaded byte-for-byte.
+
+    The file is never parsed or validated: its bytes are streamed from disk into the
+    `openApiSpec` field of the request envelope. Only use it for files that are already known
+    to contain a valid OpenAPI 3.x document.
+
+    Iterating over the request yields the JSON body in chunks. It can be iterated more than
+    once, which allows the body to be resent. If the size of the file changes after the
+    request was created, iterating raises SpecInvalidError rather than sending a body that
+    does not match `content_length`.
+    """
+
+    def __init__(
+        self,
+        spec_path: Union[str, Path],
+        name: Optional[str] = None,
+        base_url: Optional[str] = None,
+        auth_config: Optional[AuthConfig] = None,
+    ) -> None:
+        """Create a raw deployment request.
+
+        Args:
+            spec_path: Path to a JSON OpenAPI specification file.
+            name: Optional name for the deployment.
+            base_url: Base URL of the API to proxy requests to.
+            auth_config: Configuration for authentication handling.
+
+        Raises:
+            SpecInvalidError: If the file is not a .json file, cannot be read, or does not hold a JSON object.
+        """
+        self.spec_path = Path(spec_path).resolve()
+        self.name = name
+        self.base_url = base_url
+        self.auth_config = auth_config if auth_config is not None else AuthConfig()
+
+        if self.spec_path.suffix.lower() != ".json":
+            raise SpecInvalidError(
+                f"Only .json files can be uploaded without parsing, got: {self.spec_path.suffix}",
+                details={"file_path": str(self.spec_path)},
+            )
+
+        try:
+            self._spec_size = self.spec_path.stat().st_size
+            with self.spec_path.open("rb") as f:
+                head = f.read(CHUNK_SIZE)
+        except OSError as e:
+            raise SpecInvalidError(
+                f"Failed to read file: {str(e)}",
+                details={"file_path": str(self.spec_path)},
+                cause=e,
+            )
+
+        # JSON text must not start with a byte order mark, so skip it when streaming
+        self._spec_offset = len(codecs.BOM_UTF8) if head.startswith(codecs.BOM_UTF8) else 0
+        if not head[self._spec_offset :].lstrip().startswith(b"{"):
+            raise SpecInvalidError(
+                "OpenAPI spec file does not contain a JSON object",
+                details={"file_path": str(self.spec_path)},
+            )
+
+        envelope = {"name": name, "baseUrl": base_url, "authConfig": self.auth_config.model_dump(by_alias=True)}
+        tail = json_backend.dumps({key: value for key, value in envelope.items() if value is not None})
+        self._head = b'{"openApiSpec":'
+        # Re-use the closing brace of the serialized envelope fields
+        self._tail = b"," + tail[1:]
+
+    @property
+    def content_length(self) -> int:
+        """Size of the JSON body in bytes."""
+        return len(self._head) + self._spec_size - self._spec_offset + len(self._tail)
+
+    def fingerprint(self) -> str:
+        """Compute the SHA-256 of the request body, reading the spec file chunk by chunk.
+
+        The file is not parsed, so unlike `UpsertDeploymentRequest.fingerprint()` this changes
+        with any change to its bytes, including formatting.
+
+        Returns:
+            The hex-encoded fingerprint.
+        """
+        digest = hashlib.sha256()
+        for chunk in self:
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def _changed(self) -> SpecInvalidError:
+        return SpecInvalidError(
+            "OpenAPI spec file changed size after the request was created",
+            details={"file_path": str(self.spec_path), "size": self._spec_size},
+        )
+
+    def _open_spec(self) -> BinaryIO:
+        """Open the spec file at the start of its JSON, checking it still has the size `content_length` counts."""
+        f = self.spec_path.open("rb")
+        try:
+            if os.fstat(f.fileno()).st_size != self._spec_size:
+                raise self._changed()
+            f.seek(self._spec_offset)
+        except BaseException:
+            f.close()
+            raise
+        return f
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        sent = 0
+        with self._open_spec() as f:
+            while chunk := f.read(CHUNK_SIZE):
+                sent += len(chunk)
+                yield chunk
+        if sent != self._spec_size - self._spec_offset:
+            raise self._changed()
+        yield self._tail
+
+    async def _aiter(self) -> AsyncIterator[bytes]:
+        # File reads can block, e.g. on network file systems, so they run in worker threads
+        yield self._head
+        sent = 0
+        f = await asyncio.to_thread(self._open_spec)
+        try:
+            while chunk := await asyncio.to_thread(f.read, CHUNK_SIZE):
+                sent += len(chunk)
+                yield chunk
+        finally:
+            f.close()
+        if sent != self._spec_size - self._spec_offset:
+            raise self._changed()
+        yield self._tail
+
+    def async_stream(self) -> "_AsyncBody":
+        """Return an async iterable over the JSON body, as needed by httpx.AsyncClient."""
+        return _AsyncBody(self)
+
+    def __str__(self) -> str:
+        """Return a string representation of the raw request."""
+        return f"RawUpsertDeploymentRequest(spec_path={self.spec_path}, size={self._spec_size})"
+
+
+class _AsyncBody:
+    """Async iterable view of a RawUpsertDeploymentRequest body."""
+
+    def __init__(self, request: RawUpsertDeploymentRequest) -> None:
+        self._request = request
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._request._aiter()
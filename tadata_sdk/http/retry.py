@@ -0,0 +1,174 @@
+"""Retrying requests to the Tadata API after transient failures."""
+
+import email.utils
+import logging
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Iterable, Optional
+from typing_extensions import Annotated, Doc
+
+if TYPE_CHECKING:
+    import httpx
+
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean the request was not processed and can be sent again: rate limiting and
+# gateway or availability errors. Other 5xx errors may have left a deployment half-done.
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class RetryBudget:
+    """Token bucket that stops retries once most recent attempts are failing.
+
+    Works like gRPC retry throttling: each failed attempt takes one token, each successful
+    request gives back `token_ratio` tokens, and retries are only allowed while more than half
+    of `max_tokens` remain. During an outage this keeps retries from multiplying the load on
+    the API, while isolated failures are still retried.
+
+    A budget is shared by every client using the same `RetryPolicy`, and is safe to use from
+    several threads.
+    """
+
+    def __init__(
+        self,
+        max_tokens: Annotated[float, Doc("Size of the bucket")] = 10,
+        token_ratio: Annotated[float, Doc("Tokens given back by each successful request")] = 0.1,
+    ) -> None:
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Number of tokens currently in the bucket."""
+        return self._tokens
+
+    def record_success(self) -> None:
+        """Give tokens back after a successful request."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def record_failure(self) -> bool:
+        """Take a token for a failed attempt.
+
+        Returns:
+            True if a retry is still allowed.
+        """
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+            return self._tokens > self.max_tokens / 2
+
+
+class RequestStats:
+    """How many attempts one API call took, how long was spent waiting between them, and how many were hedged."""
+
+    def __init__(self) -> None:
+        self.attempts = 0
+        self.retry_wait = 0.0
+        self.hedges = 0
+
+    def __repr__(self) -> str:
+        return f"RequestStats(attempts={self.attempts}, retry_wait={self.retry_wait:.3f}s, hedges={self.hedges})"
+
+
+class RetryPolicy:
+    """When and how long to wait before sending a failed request to the Tadata API again.
+
+    Network errors and the statuses in `retry_statuses` are retried, up to `max_attempts`
+    attempts in total. Waits use exponential backoff with full jitter: a random delay between
+    zero and `backoff_base * 2 ** (attempt - 1)`, capped at `backoff_max`. A `Retry-After`
+    header on the response takes precedence; if it asks for a longer wait than `backoff_max`,
+    the request fails right away instead.
+
+    Share one policy between clients to share its retry budget.
+    """
+
+    def __init__(
+        self,
+        max_attempts: Annotated[int, Doc("Total number of attempts, including the first one. 1 disables retries")] = 3,
+        backoff_base: Annotated[float, Doc("Upper bound of the first backoff, in seconds")] = 0.5,
+        backoff_max: Annotated[float, Doc("Longest wait between two attempts, in seconds")] = 30.0,
+        retry_statuses: Annotated[Iterable[int], Doc("HTTP statuses that are retried")] = DEFAULT_RETRY_STATUSES,
+        retry_network_errors: Annotated[bool, Doc("Whether connection errors and timeouts are retried")] = True,
+        respect_retry_after: Annotated[bool, Doc("Whether to wait as long as the Retry-After header asks")] = True,
+        budget: Annotated[
+            Optional[RetryBudget], Doc("Retry budget. Defaults to a new RetryBudget for this policy")
+        ] = None,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_network_errors = retry_network_errors
+        self.respect_retry_after = respect_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def backoff(self, attempt: int) -> float:
+        """Return a random delay to wait after the given failed attempt (full jitter)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def next_delay(
+        self,
+        attempt: int,
+        *,
+        response: Optional["httpx.Response"] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """Decide whether to retry after a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that failed, starting at 1.
+            response: The error response, if the server answered.
+            error: The network error, if it did not.
+
+        Returns:
+            Seconds to wait before the next attempt, or None if the failure should be raised.
+        """
+        if response is not None:
+            if response.status_code not in self.retry_statuses:
+                return None
+        elif error is None or not self.retry_network_errors:
+            return None
+
+        # Only transient failures count against the budget
+        if not self.budget.record_failure():
+            logger.warning("Retry budget exhausted, not retrying")
+            return None
+        if attempt >= self.max_attempts:
+            return None
+
+        delay = self.backoff(attempt)
+        if response is not None and self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.backoff_max:
+                    logger.warning(f"Server asked to retry in {retry_after:.0f}s, longer than backoff_max")
+                    return None
+                delay = retry_after
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header, given either as seconds or as an HTTP date.
+
+    Args:
+        value: The header value.
+
+    Returns:
+        The number of seconds to wait, or None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
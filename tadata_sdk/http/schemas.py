@@ -3,7 +3,9 @@ from enum import Enum
 from typing import Any, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_json
 
+from ..openapi.canonical import canonical_hash
 from ..openapi.source import OpenAPISpec
 
 
@@ -26,6 +28,8 @@ class ValidationError(BaseModel):
     message: str
     source: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ApiError(BaseModel):
     """API error details."""
@@ -35,6 +39,8 @@ class ApiError(BaseModel):
     errors: Optional[List[ValidationError]] = None
     details: Optional[Any] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ApiResponse(BaseModel):
     """Generic API response envelope.
@@ -46,7 +52,7 @@ class ApiResponse(BaseModel):
     status: int
     data: Optional[Any] = None
     error: Optional[ApiError] = None
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
 
 class AuthConfig(BaseModel):
@@ -80,7 +86,7 @@ class AuthConfig(BaseModel):
         alias="passFormDataParams",
     )
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class UpsertDeploymentRequest(BaseModel):
@@ -93,7 +99,31 @@ class UpsertDeploymentRequest(BaseModel):
         default_factory=AuthConfig, description="Configuration for authentication handling", alias="authConfig"
     )
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the request body exactly as it is sent to the Tadata API.
+
+        The models are encoded straight to UTF-8 JSON bytes by pydantic-core, without first
+        copying the whole spec into a dict, so peak memory stays close to the size of the output.
+
+        Returns:
+            The JSON-encoded request body.
+        """
+        return to_json(self, by_alias=True, exclude_none=True)
+
+    def fingerprint(self) -> str:
+        """Compute a hash identifying the deployment this request asks for.
+
+        It is the SHA-256 of the canonical form of the request body, see `canonical_hash()`: it
+        changes with the spec, name, base URL or auth configuration, but not with key order,
+        number spelling or whether the spec was loaded from JSON or YAML.
+
+        Returns:
+            The hex-encoded fingerprint.
+        """
+        envelope = self.model_dump(by_alias=True, exclude_none=True, exclude={"open_api_spec"})
+        return canonical_hash({**envelope, "openApiSpec": self.open_api_spec._document()})
 
 
 class DeploymentResponseData(BaseModel):
@@ -108,7 +138,7 @@ class DeploymentResponseData(BaseModel):
     mcp_spec_hash: Optional[str] = Field(None, alias="mcpSpecHash")
     status: Optional[str] = Field(None)
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
+    model_config = ConfigDict(populate_by_name=True, extra="allow", defer_build=True)
 
 
 class UpsertDeploymentResponseData(BaseModel):
@@ -117,7 +147,7 @@ class UpsertDeploymentResponseData(BaseModel):
     updated: bool
     deployment: DeploymentResponseData
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class DeploymentResponse(ApiResponse):
@@ -0,0 +1,114 @@
+"""JSON encoding and decoding through the fastest library available.
+
+orjson is preferred, then msgspec, and the standard library `json` module is used when neither
+is installed. All backends read bytes directly, so callers never need to decode a body to str
+first, and `dumps` always returns UTF-8 bytes.
+
+The backend can be forced with the `TADATA_JSON_BACKEND` environment variable ("orjson",
+"msgspec" or "json"); it is read once, at import time.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Callable, Optional, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+JSONInput = Union[bytes, bytearray, memoryview, str]
+
+_Backend = Tuple[str, Callable[[Any], Any], Callable[[Any], bytes]]
+
+
+def _stdlib_loads(data: JSONInput) -> Any:
+    if isinstance(data, memoryview):
+        # Decode straight from the buffer: json.loads only takes bytes, which would be a second copy
+        data = str(data, json.detect_encoding(bytes(data[:4])), "surrogatepass")
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def _orjson_backend() -> _Backend:
+    import orjson  # type: ignore[import]
+
+    # YAML specs can have integer keys, e.g. unquoted response codes; json.dumps turns them into strings too
+    option = orjson.OPT_NON_STR_KEYS
+    return "orjson", orjson.loads, lambda obj: orjson.dumps(obj, option=option)
+
+
+def _msgspec_backend() -> _Backend:
+    import msgspec  # type: ignore[import]
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+    return "msgspec", decoder.decode, encoder.encode
+
+
+_BACKENDS = {"orjson": _orjson_backend, "msgspec": _msgspec_backend}
+
+
+def _select_backend(requested: Optional[str]) -> _Backend:
+    """Return the requested backend, or the fastest installed one if none was requested."""
+    if requested == "json":
+        return "json", _stdlib_loads, _stdlib_dumps
+    if requested is not None and requested not in _BACKENDS:
+        logger.warning(f"Unknown JSON backend {requested!r}, picking one automatically")
+        requested = None
+
+    for name in [requested] if requested is not None else list(_BACKENDS):
+        try:
+            return _BACKENDS[name]()
+        except ImportError:
+            if requested is not None:
+                logger.warning(f"JSON backend {name!r} is not installed, falling back to the json module")
+    return "json", _stdlib_loads, _stdlib_dumps
+
+
+BACKEND_NAME, _loads, _dumps = _select_backend(os.environ.get("TADATA_JSON_BACKEND") or None)
+
+
+def loads(data: JSONInput) -> Any:
+    """Parse a JSON document.
+
+    Documents the fast backend refuses are parsed again with the json module, which is more
+    lenient in a few corner cases, so whether a document loads never depends on the backend.
+
+    Args:
+        data: The JSON document, preferably as UTF-8 bytes.
+
+    Returns:
+        The parsed Python object.
+
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    try:
+        return _loads(data)
+    except ValueError:
+        if BACKEND_NAME == "json":
+            raise
+        return _stdlib_loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 encoded JSON.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        The JSON document.
+
+    Raises:
+        TypeError: If the object is not JSON serializable.
+    """
+    try:
+        return _dumps(obj)
+    except TypeError:
+        if BACKEND_NAME == "json":
+            raise
+        return _stdlib_dumps(obj)
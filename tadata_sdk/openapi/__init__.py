@@ -1,3 +1,17 @@
+from typing import TYPE_CHECKING, Any
+
 from .source import OpenAPISpec
 
-__all__ = ["OpenAPISpec"]
+if TYPE_CHECKING:
+    YAML_LOADER_NAME: str
+
+__all__ = ["OpenAPISpec", "YAML_LOADER_NAME"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on access, so that importing this package does not import PyYAML
+    if name == "YAML_LOADER_NAME":
+        from . import source
+
+        return source.YAML_LOADER_NAME
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,365 @@
+"""Bundling OpenAPI specifications split across several files or URLs into one document."""
+
+import logging
+import re
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from ..errors.exceptions import SpecInvalidError
+from .source import OpenAPISpec, _load_json, _load_yaml
+
+if TYPE_CHECKING:
+    import httpx
+
+    from ..http.deadline import Deadline, TimeoutTypes
+
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_PHASE = "bundling the spec"
+
+# Keys whose value is a schema, and keys whose values are all schemas
+_SCHEMA_KEYS = frozenset({"schema", "items", "additionalProperties", "not", "contains", "propertyNames"})
+_SCHEMA_MAP_KEYS = frozenset({"properties", "patternProperties", "allOf", "anyOf", "oneOf", "prefixItems"})
+
+_COMPONENT_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def _iter_refs(node: Any) -> Iterator[str]:
+    """Yield every `$ref` value in a document, without recursion."""
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            ref = item.get("$ref")
+            if isinstance(ref, str):
+                yield ref
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+
+
+def _escape_token(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _pointer(tokens: List[str]) -> str:
+    """Return the `$ref` pointing at a location of the bundled document."""
+    return "#" + "".join(f"/{urllib.parse.quote(_escape_token(token), safe='')}" for token in tokens)
+
+
+def _resolve_pointer(document: Any, fragment: str, uri: str) -> Any:
+    """Return the node a JSON Pointer fragment designates in a document."""
+    node = document
+    if not fragment:
+        return node
+    if not fragment.startswith("/"):
+        raise SpecInvalidError(f"Unsupported $ref fragment {fragment!r} in {uri}", details={"uri": uri})
+    for raw in fragment[1:].split("/"):
+        token = urllib.parse.unquote(raw).replace("~1", "/").replace("~0", "~")
+        try:
+            node = node[int(token)] if isinstance(node, list) else node[token]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise SpecInvalidError(f"Cannot resolve $ref {uri}#{fragment}", details={"uri": uri, "pointer": fragment})
+    return node
+
+
+def _is_schema_position(tokens: List[str]) -> bool:
+    """Tell whether a location of the document holds a schema, from the keys leading to it."""
+    if not tokens:
+        return False
+    if tokens[-1] in _SCHEMA_KEYS:
+        return True
+    return len(tokens) >= 2 and tokens[-2] in _SCHEMA_MAP_KEYS | {"schemas"}
+
+
+def document_uri(location: Union[str, Path]) -> str:
+    """Return the URI of a spec file or URL that `$ref`s in it are resolved against.
+
+    Args:
+        location: Path to a spec file, or URL of a spec.
+
+    Returns:
+        The URL unchanged, or a ``file://`` URI for paths.
+    """
+    if isinstance(location, str) and urllib.parse.urlsplit(location).scheme in ("http", "https", "file"):
+        return location
+    return Path(location).resolve().as_uri()
+
+
+class _Bundler:
+    """Resolves the external `$ref`s of one document. Not reusable across documents."""
+
+    def __init__(
+        self,
+        root_uri: str,
+        root: Dict[str, Any],
+        http_client: Optional["httpx.Client"],
+        timeout: "TimeoutTypes",
+        max_workers: int,
+        deadline: Optional["Deadline"] = None,
+    ) -> None:
+        self.root_uri = root_uri
+        self.http_client = http_client
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.deadline = deadline
+        self.documents: Dict[str, Any] = {root_uri: root}
+        # Where each resolved target lives in the bundle, as a $ref. Set before the target is
+        # rewritten, so refs back into it, e.g. in recursive schemas, end the walk.
+        self.homes: Dict[Tuple[str, str], str] = {}
+        # Targets that are themselves a bare $ref, and the target their chain of refs ends at
+        self.aliases: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self.taken: Dict[str, Set[str]] = {
+            section: set(entries)
+            for section, entries in root.get("components", {}).items()
+            if isinstance(entries, dict)
+        }
+        self.added: Dict[str, Dict[str, Any]] = {}
+        # Local files may only be read from the root document's directory tree
+        self.root_dir: Optional[Path] = None
+        root_parts = urllib.parse.urlsplit(root_uri)
+        if root_parts.scheme == "file":
+            root_path = Path(urllib.request.url2pathname(root_parts.path)).resolve()
+            self.root_dir = root_path if root_parts.path.endswith("/") else root_path.parent
+
+    def _target(self, ref: str, doc_uri: str) -> Tuple[str, str]:
+        target_uri, fragment = urllib.parse.urldefrag(urllib.parse.urljoin(doc_uri, ref))
+        return target_uri, fragment
+
+    def load_documents(self) -> None:
+        """Load every document reachable through `$ref`s, fetching each wave of URLs concurrently."""
+        pending = [self.root_uri]
+        while pending:
+            wanted: List[str] = []
+            for uri in pending:
+                remote_document = urllib.parse.urlsplit(uri).scheme != "file"
+                for ref in _iter_refs(self.documents[uri]):
+                    target_uri, _ = self._target(ref, uri)
+                    if remote_document and urllib.parse.urlsplit(target_uri).scheme == "file":
+                        # A remote document must not get local files read and uploaded
+                        raise SpecInvalidError(
+                            f"$ref from {uri} to local file {target_uri} is not allowed",
+                            details={"uri": uri, "ref": ref},
+                        )
+                    if target_uri not in self.documents and target_uri not in wanted:
+                        wanted.append(target_uri)
+            remote = [uri for uri in wanted if urllib.parse.urlsplit(uri).scheme in ("http", "https")]
+            for uri in wanted:
+                if uri not in remote:
+                    self.documents[uri] = self._load_file(uri)
+            if remote:
+                self._fetch_all(remote)
+            pending = wanted
+
+    def _load_file(self, uri: str) -> Any:
+        parts = urllib.parse.urlsplit(uri)
+        if parts.scheme != "file":
+            raise SpecInvalidError(f"Unsupported $ref location: {uri}", details={"uri": uri})
+        path = Path(urllib.request.url2pathname(parts.path))
+        if self.root_dir is None or not path.resolve().is_relative_to(self.root_dir):
+            raise SpecInvalidError(f"$ref to {uri} is outside the directory of the root document", details={"uri": uri})
+        logger.debug(f"Loading $ref document {path}")
+        try:
+            content = path.read_bytes()
+        except OSError as e:
+            raise SpecInvalidError(f"Failed to read $ref document: {str(e)}", details={"uri": uri}, cause=e)
+        if path.suffix.lower() == ".json":
+            return _load_json(content)
+        return _load_yaml(content, details={"uri": uri})
+
+    def _fetch_all(self, uris: List[str]) -> None:
+        import httpx
+
+        client = self.http_client or httpx.Client()
+        try:
+            if len(uris) == 1:
+                self.documents[uris[0]] = self._fetch(client, uris[0])
+                return
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(uris))) as executor:
+                for uri, document in zip(uris, executor.map(lambda uri: self._fetch(client, uri), uris)):
+                    self.documents[uri] = document
+        finally:
+            if self.http_client is None:
+                client.close()
+
+    def _fetch(self, client: "httpx.Client", uri: str) -> Any:
+        import httpx
+
+        from ..http.deadline import phase_timeout
+        from .fetch import spec_format
+
+        logger.debug(f"Fetching $ref document {uri}")
+        try:
+            response = client.get(uri, timeout=phase_timeout(self.deadline, self.timeout, BUNDLE_PHASE))
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            if self.deadline is not None and self.deadline.expired:
+                raise self.deadline.exceeded(BUNDLE_PHASE, cause=e)
+            raise SpecInvalidError(f"Failed to fetch $ref document: {str(e)}", details={"uri": uri}, cause=e)
+        if spec_format(uri, response.headers.get("content-type", "")) == "json":
+            return _load_json(response.content)
+        return _load_yaml(response.content, details={"uri": uri})
+
+    def bundle(self) -> Dict[str, Any]:
+        """Return the root document with every external `$ref` pointing into it."""
+        bundled = self._rewrite(self.documents[self.root_uri], self.root_uri, [])
+        if self.added:
+            components = bundled.setdefault("components", {})
+            for section, entries in self.added.items():
+                components.setdefault(section, {}).update(entries)
+        return bundled
+
+    def _rewrite(self, node: Any, doc_uri: str, tokens: List[str]) -> Any:
+        """Copy a node of `doc_uri` to location `tokens` of the bundle, rewriting its `$ref`s."""
+        if isinstance(node, list):
+            return [self._rewrite(item, doc_uri, [*tokens, str(i)]) for i, item in enumerate(node)]
+        if not isinstance(node, dict):
+            return node
+        ref = node.get("$ref")
+        if not isinstance(ref, str):
+            return {key: self._rewrite(value, doc_uri, [*tokens, key]) for key, value in node.items()}
+
+        siblings = {key: self._rewrite(value, doc_uri, [*tokens, key]) for key, value in node.items() if key != "$ref"}
+        target = self._final_target(self._target(ref, doc_uri))
+        home = self._home(target, tokens)
+        if home is not None:
+            return {"$ref": home, **siblings}
+        # Inlined: the target is copied here, and later refs to it point here
+        content = self._rewrite(self._resolve(target), target[0], tokens)
+        if isinstance(content, dict):
+            return {**content, **siblings}
+        return content
+
+    def _resolve(self, target: Tuple[str, str]) -> Any:
+        target_uri, fragment = target
+        return _resolve_pointer(self.documents[target_uri], fragment, target_uri)
+
+    def _final_target(self, target: Tuple[str, str]) -> Tuple[str, str]:
+        """Follow a chain of targets that are a bare `$ref` to another target, to where it ends.
+
+        Each chain is walked once and remembered, so following every ref of a bundle takes linear time.
+        """
+        chain: List[Tuple[str, str]] = []
+        seen: Set[Tuple[str, str]] = set()
+        while target[0] != self.root_uri and target not in self.homes:
+            if target in self.aliases:
+                target = self.aliases[target]
+                break
+            if target in seen:
+                target_uri, fragment = target
+                raise SpecInvalidError(
+                    f"$ref loop through {target_uri}#{fragment}", details={"uri": target_uri, "pointer": fragment}
+                )
+            node = self._resolve(target)
+            if not (isinstance(node, dict) and isinstance(node.get("$ref"), str) and len(node) == 1):
+                break
+            chain.append(target)
+            seen.add(target)
+            target = self._target(node["$ref"], target[0])
+        for alias in chain:
+            self.aliases[alias] = target
+        return target
+
+    def _home(self, target: Tuple[str, str], tokens: List[str]) -> Optional[str]:
+        """Return the `$ref` a target is reached by in the bundle, or None if it is inlined at `tokens`."""
+        target_uri, fragment = target
+        if target_uri == self.root_uri:
+            return "#" + fragment
+        if target in self.homes:
+            return self.homes[target]
+
+        node = self._resolve(target)
+        component = self._component_location(target_uri, fragment, tokens)
+        if component is None:
+            self.homes[target] = _pointer(tokens)
+            return None
+
+        section, name = component
+        home = _pointer(["components", section, name])
+        self.homes[target] = home
+        entries = self.added.setdefault(section, {})
+        entries[name] = None  # keeps components in the order they are first referenced
+        entries[name] = self._rewrite(node, target_uri, ["components", section, name])
+        return home
+
+    def _component_location(self, target_uri: str, fragment: str, tokens: List[str]) -> Optional[Tuple[str, str]]:
+        """Pick the component section and a free name to re-home a target under, if it belongs in components."""
+        parts = fragment.split("/")
+        if len(parts) == 4 and parts[0] == "" and parts[1] == "components":
+            section = parts[2]
+            base = urllib.parse.unquote(parts[3]).replace("~1", "/").replace("~0", "~")
+        elif not fragment and _is_schema_position(tokens):
+            section = "schemas"
+            base = Path(urllib.parse.urlsplit(target_uri).path).stem
+        else:
+            return None
+
+        base = _COMPONENT_NAME_RE.sub("_", base) or "Component"
+        taken = self.taken.setdefault(section, set())
+        name, counter = base, 1
+        while name in taken:
+            counter += 1
+            name = f"{base}_{counter}"
+        taken.add(name)
+        return section, name
+
+
+def bundle_spec(
+    spec: Union[OpenAPISpec, Dict[str, Any]],
+    base_uri: Optional[Union[str, Path]] = None,
+    *,
+    http_client: Optional["httpx.Client"] = None,
+    timeout: "TimeoutTypes" = 30,
+    max_workers: int = 8,
+    deadline: Optional["Deadline"] = None,
+) -> OpenAPISpec:
+    """Bundle a spec whose `$ref`s point to other files or URLs into one self-contained spec.
+
+    Every document reachable through `$ref`s is loaded once; documents found at the same depth
+    are fetched concurrently. Targets under ``/components/<section>/<name>`` are copied into the
+    same section of the bundle, renamed if the name is taken, and whole files referenced where
+    a schema is expected become schemas named after the file. Other targets, e.g. path items,
+    are inlined where they are first referenced, and later refs point there. Each target is
+    copied once, so recursive schemas stay recursive. Refs within the root document are kept.
+
+    Local files are only read when referred to from local documents, and only from the
+    directory of the root document (or the current directory) and below, so that a spec
+    fetched from a URL cannot get local files inlined into what is uploaded.
+
+    Args:
+        spec: The root document.
+        base_uri: Path or URL of the root document, which relative `$ref`s are resolved against.
+            Defaults to the current directory.
+        http_client: Client to fetch remote documents with. A temporary one is used if omitted.
+        timeout: Timeout for fetching each remote document, in seconds or as an httpx.Timeout.
+        max_workers: Most remote documents fetched at once.
+        deadline: Deadline every remote fetch must finish by. Each fetch's timeout is capped to the time left.
+
+    Returns:
+        The bundled specification.
+
+    Raises:
+        DeadlineExceededError: If the deadline passes before every remote document is fetched.
+        SpecInvalidError: If a referenced document cannot be loaded, a `$ref` cannot be
+            resolved or loops onto itself, a remote document refers to a local file, a local
+            file outside the root document's directory is referred to, or the result is not a
+            valid OpenAPI specification.
+    """
+    root = spec.model_dump(mode="json", by_alias=True, exclude_none=True) if isinstance(spec, OpenAPISpec) else spec
+    if base_uri is None:
+        root_uri = Path.cwd().as_uri() + "/"
+    else:
+        root_uri = urllib.parse.urldefrag(document_uri(base_uri))[0]
+
+    bundler = _Bundler(root_uri, root, http_client, timeout, max_workers, deadline)
+    bundler.load_documents()
+    external = len(bundler.documents) - 1
+    if external == 0:
+        return spec if isinstance(spec, OpenAPISpec) else OpenAPISpec.from_dict(spec)
+
+    logger.info(f"Bundling OpenAPI spec with {external} referenced documents")
+    return OpenAPISpec.from_dict(bundler.bundle())
@@ -0,0 +1,250 @@
+"""Canonical form of OpenAPI documents, and a hash of it that ignores how the document was written."""
+
+import datetime
+import hashlib
+import json
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+# Keys whose value maps names chosen by the spec author to objects. Those names are never
+# vendor extensions, e.g. an `x-request-id` response header or an `x-total` schema property.
+_NAME_MAPS = frozenset(
+    {
+        "webhooks",
+        "schemas",
+        "responses",
+        "parameters",
+        "examples",
+        "requestBodies",
+        "headers",
+        "securitySchemes",
+        "links",
+        "callbacks",
+        "pathItems",
+        "properties",
+        "patternProperties",
+        "dependentSchemas",
+        "definitions",
+        "$defs",
+        "content",
+        "encoding",
+        "variables",
+        "mapping",
+        "scopes",
+    }
+)
+
+# Keys whose value is data described by the spec rather than part of the spec itself
+_LITERALS = frozenset({"example", "default", "enum", "const", "value"})
+
+# The top levels of a document, and containers with at least this many members, e.g. `paths` or
+# `components.schemas`, are written in batches of members; smaller containers are encoded in one
+# piece. This way only about one batch of operations or components is encoded at a time.
+_STREAM_MIN_MEMBERS = 32
+_STREAM_DEPTH = 2
+_BATCH_SIZE = 64
+
+# Keys are sorted by the encoder, in C, rather than by building sorted copies of every dict
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), check_circular=False, sort_keys=True)
+
+_STR_ONLY = frozenset({str})
+_PLAIN_SCALARS = frozenset({str, int, bool, type(None)})
+
+# Whether a dict's keys are author-chosen names, and whether the node is literal data
+_Context = Tuple[bool, bool]
+
+
+def _normalize_scalar(value: Any) -> Any:
+    """Give numbers one spelling, e.g. 1, 1.0 and 1e0, and turn YAML timestamps into ISO 8601 strings."""
+    if isinstance(value, float) and value.is_integer() and abs(value) < 2**53:
+        return int(value)
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
+
+def _normalize_key(key: Any) -> str:
+    """Turn a key into the string JSON would use for it, e.g. YAML's unquoted `200:` into "200"."""
+    if isinstance(key, str):
+        return key
+    key = _normalize_scalar(key)
+    return key if isinstance(key, str) else _encoder.encode(key)
+
+
+def _is_normalized(node: Any) -> bool:
+    """Return whether a node has only string keys and scalars `_normalize_scalar()` leaves as they are."""
+    # Types are collected with map() and set(), in C, so that most containers are checked
+    # without a Python-level step per member
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if type(item) is dict:
+            if not _STR_ONLY.issuperset(map(type, item)):
+                return False
+            values: Iterable[Any] = item.values()
+        else:
+            values = item
+        if _PLAIN_SCALARS.issuperset(map(type, values)):
+            continue
+        for value in values:
+            value_type = type(value)
+            if value_type is dict or value_type is list or value_type is tuple:
+                stack.append(value)
+            elif value_type is float:
+                if value.is_integer() and abs(value) < 2**53:
+                    return False
+            elif value_type not in _PLAIN_SCALARS:
+                return False
+    return True
+
+
+def _members(node: Dict[Any, Any], context: _Context, strip_extensions: bool) -> Iterator[Tuple[str, Any, _Context]]:
+    """Yield the members of a dict with normalized keys, and the context of each value."""
+    names, literal = context
+    for key, value in node.items():
+        key = _normalize_key(key)
+        if literal or names:
+            # Values of a name map are spec objects again
+            yield key, value, (False, literal)
+        elif strip_extensions and key.startswith("x-"):
+            continue
+        else:
+            # `examples` is a map of Example objects, except in JSON Schema where it lists values
+            yield key, value, (key in _NAME_MAPS, key in _LITERALS or (key == "examples" and isinstance(value, list)))
+
+
+def _normalize(node: Any, context: _Context, strip_extensions: bool) -> Any:
+    """Return a copy of a node with normalized keys and scalars, in its original key order."""
+    if isinstance(node, dict):
+        return {
+            key: _normalize(value, child, strip_extensions)
+            for key, value, child in _members(node, context, strip_extensions)
+        }
+    if isinstance(node, (list, tuple)):
+        item_context = (False, context[1])
+        return [_normalize(item, item_context, strip_extensions) for item in node]
+    return _normalize_scalar(node)
+
+
+def _prepare(node: Any, context: _Context, strip_extensions: bool) -> Any:
+    """Return a node ready for the encoder: itself if it is already normalized, or a normalized copy."""
+    if not isinstance(node, (dict, list, tuple)):
+        return _normalize_scalar(node)
+    if strip_extensions or not _is_normalized(node):
+        return _normalize(node, context, strip_extensions)
+    return node
+
+
+def _is_streamed(node: Any, depth: int) -> bool:
+    return isinstance(node, (dict, list, tuple)) and (depth < _STREAM_DEPTH or len(node) >= _STREAM_MIN_MEMBERS)
+
+
+def _write(node: Any, context: _Context, strip_extensions: bool, depth: int, write: Callable[[bytes], Any]) -> None:
+    """Write the canonical JSON of a node in pieces, streaming its top levels and large containers.
+
+    Members that are not streamed themselves are gathered in batches, each encoded at once,
+    and written without the batch's enclosing brackets.
+    """
+    if not _is_streamed(node, depth):
+        write(_encoder.encode(_prepare(node, context, strip_extensions)).encode("utf-8", "surrogatepass"))
+        return
+
+    is_dict = isinstance(node, dict)
+    batch: Any = {} if is_dict else []
+    separator = b""
+
+    def flush() -> None:
+        nonlocal batch, separator
+        if batch:
+            write(separator + _encoder.encode(batch)[1:-1].encode("utf-8", "surrogatepass"))
+            separator = b","
+            batch = {} if is_dict else []
+
+    write(b"{" if is_dict else b"[")
+    if is_dict:
+        members = sorted(_members(node, context, strip_extensions), key=lambda member: member[0])
+        for key, value, child in members:
+            if _is_streamed(value, depth + 1):
+                flush()
+                write(separator + encode_basestring(key).encode("utf-8", "surrogatepass") + b":")
+                _write(value, child, strip_extensions, depth + 1, write)
+                separator = b","
+            else:
+                batch[key] = _prepare(value, child, strip_extensions)
+                if len(batch) >= _BATCH_SIZE:
+                    flush()
+    else:
+        item_context = (False, context[1])
+        for item in node:
+            if _is_streamed(item, depth + 1):
+                flush()
+                write(separator)
+                _write(item, item_context, strip_extensions, depth + 1, write)
+                separator = b","
+            else:
+                batch.append(_prepare(item, item_context, strip_extensions))
+                if len(batch) >= _BATCH_SIZE:
+                    flush()
+    flush()
+    write(b"}" if is_dict else b"]")
+
+
+def canonicalize(document: Any, *, strip_extensions: bool = False) -> Any:
+    """Return a canonical copy of a JSON-like document.
+
+    In the copy, dict keys are sorted, non-string keys such as YAML's unquoted status codes
+    are turned into strings, and integral floats become ints, so `1.0` and `1` are the same.
+    YAML timestamps become ISO 8601 strings. With `strip_extensions`, `x-` vendor extensions
+    are removed from spec objects; names chosen by the spec author that start with `x-`,
+    such as header or property names, and literal data such as examples are kept.
+
+    Args:
+        document: The document, e.g. a parsed OpenAPI spec.
+        strip_extensions: Whether to remove `x-` vendor extensions.
+
+    Returns:
+        The canonical copy.
+    """
+    return json.loads(canonical_json(document, strip_extensions=strip_extensions))
+
+
+def canonical_json(document: Any, *, strip_extensions: bool = False) -> bytes:
+    """Serialize the canonical form of a document to compact UTF-8 JSON.
+
+    The output depends only on the content of the document: not on key order, on whether it
+    was loaded from JSON or YAML, on its whitespace, or on the JSON backend in use.
+
+    Args:
+        document: The document.
+        strip_extensions: Whether to remove `x-` vendor extensions.
+
+    Returns:
+        The canonical JSON.
+    """
+    pieces: List[bytes] = []
+    _write(document, (False, False), strip_extensions, 0, pieces.append)
+    return b"".join(pieces)
+
+
+def canonical_hash(document: Any, *, strip_extensions: bool = False) -> str:
+    """Compute the SHA-256 of the canonical JSON of a document, without building it whole.
+
+    The canonical JSON is fed to the hash one operation or component at a time, so hashing a
+    large spec takes little memory beyond the spec itself. The result equals the SHA-256 of
+    `canonical_json(document)`.
+
+    This is not the algorithm of the `openAPISpecHash` the Tadata API returns, which is not
+    documented; do not compare the two.
+
+    Args:
+        document: The document.
+        strip_extensions: Whether to remove `x-` vendor extensions.
+
+    Returns:
+        The hex-encoded hash.
+    """
+    digest = hashlib.sha256()
+    _write(document, (False, False), strip_extensions, 0, digest.update)
+    return digest.hexdigest()
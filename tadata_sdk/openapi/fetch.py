@@ -0,0 +1,246 @@
+"""Downloading OpenAPI specifications from URLs."""
+
+import io
+import logging
+import urllib.parse
+from typing import Any, Callable, Iterable, Iterator, List, Literal, Optional
+
+import httpx
+
+from ..errors.exceptions import SpecInvalidError, TadataSDKError
+from ..http.deadline import Deadline, TimeoutTypes, phase_timeout
+from .http_cache import CachedSpecEntry, HTTPSpecCache
+from .source import OpenAPISpec, _load_json, _load_yaml
+
+
+logger = logging.getLogger(__name__)
+
+# Called while a spec downloads with the number of bytes received so far, and the total size if known
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+SpecFormat = Literal["json", "yaml"]
+
+# Deadline phase of the download, used in DeadlineExceededError messages
+DOWNLOAD_PHASE = "downloading the spec"
+
+
+def spec_format(url: str, content_type: str) -> SpecFormat:
+    """Tell whether a downloaded spec is JSON or YAML, from its content type or else its URL extension.
+
+    Args:
+        url: URL the spec was downloaded from.
+        content_type: The Content-Type header of the response.
+
+    Returns:
+        "json" or "yaml". Specs that give no hint are assumed to be JSON.
+    """
+    if "json" in content_type:
+        return "json"
+    if "yaml" in content_type or "yml" in content_type:
+        return "yaml"
+    url_path = urllib.parse.urlparse(url).path.lower()
+    if url_path.endswith((".yaml", ".yml")):
+        return "yaml"
+    return "json"
+
+
+def _content_length(response: httpx.Response) -> Optional[int]:
+    """Return the Content-Length of a response, or None if it is missing or malformed."""
+    try:
+        length = int(response.headers.get("Content-Length", ""))
+    except ValueError:
+        # The size limit is then only enforced on the chunks as they arrive
+        return None
+    return length if length >= 0 else None
+
+
+class _DownloadTracker:
+    """Counts the bytes of a download, reports progress and enforces the size limit."""
+
+    def __init__(
+        self,
+        url: str,
+        response: httpx.Response,
+        max_size: Optional[int],
+        on_progress: Optional[ProgressCallback],
+        deadline: Optional[Deadline],
+    ) -> None:
+        self.url = url
+        self.max_size = max_size
+        self.on_progress = on_progress
+        self.deadline = deadline
+        self.received = 0
+        content_length = _content_length(response)
+        # With a Content-Encoding, the length is that of the compressed body
+        self.total = content_length if "Content-Encoding" not in response.headers else None
+        if max_size is not None and content_length is not None and content_length > max_size:
+            raise self._too_large()
+
+    def _too_large(self) -> SpecInvalidError:
+        return SpecInvalidError(
+            f"OpenAPI spec at {self.url} is larger than the maximum of {self.max_size} bytes",
+            details={"url": self.url, "max_size": self.max_size},
+        )
+
+    def add(self, chunk: bytes) -> bytes:
+        if self.deadline is not None:
+            # Read timeouts only bound each chunk, not a download that keeps trickling in
+            self.deadline.check(DOWNLOAD_PHASE)
+        self.received += len(chunk)
+        if self.max_size is not None and self.received > self.max_size:
+            raise self._too_large()
+        if self.on_progress is not None:
+            self.on_progress(self.received, self.total)
+        return chunk
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks, so parsers can pull data as it arrives."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _parse_chunks(url: str, fmt: SpecFormat, chunks: Iterable[bytes]) -> OpenAPISpec:
+    """Parse a spec from its body chunks, consuming them as the parser needs them.
+
+    YAML is parsed from a stream over the chunks, so the document is never held whole, neither
+    as bytes nor as text. JSON parsers need the whole document, which is collected as bytes and
+    parsed without decoding it to a str first when orjson or msgspec is installed.
+    """
+    if fmt == "yaml":
+        return OpenAPISpec.from_dict(_load_yaml(io.BufferedReader(_ChunkReader(iter(chunks))), details={"url": url}))
+
+    body = bytearray()
+    for chunk in chunks:
+        body += chunk
+    with memoryview(body) as view:
+        data = _load_json(view)
+    return OpenAPISpec.from_dict(data)
+
+
+def _fetch_error(url: str, error: Exception, deadline: Optional[Deadline]) -> TadataSDKError:
+    """Wrap a failure to download an OpenAPI specification."""
+    if deadline is not None and deadline.expired:
+        return deadline.exceeded(DOWNLOAD_PHASE, cause=error)
+    return SpecInvalidError(f"Failed to fetch OpenAPI spec from URL: {str(error)}", details={"url": url}, cause=error)
+
+
+def _revalidation(spec_cache: Optional[HTTPSpecCache], url: str) -> Optional[CachedSpecEntry]:
+    return spec_cache.lookup(url) if spec_cache is not None else None
+
+
+def _cache_store(spec_cache: Optional[HTTPSpecCache], url: str, response: httpx.Response, spec: OpenAPISpec) -> None:
+    """Store a downloaded spec in the cache, if one is used."""
+    if spec_cache is None:
+        return
+    try:
+        spec_cache.store(url, response, spec)
+    except OSError as e:
+        # The spec was downloaded; a cache that cannot be written only costs a future download
+        logger.warning(f"Failed to cache OpenAPI spec from {url}: {e}")
+
+
+def fetch_spec(
+    url: str,
+    *,
+    http_client: Optional[httpx.Client] = None,
+    timeout: TimeoutTypes = 30,
+    spec_cache: Optional[HTTPSpecCache] = None,
+    max_size: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    deadline: Optional[Deadline] = None,
+) -> OpenAPISpec:
+    """Download and parse an OpenAPI specification, parsing it while it streams in.
+
+    Args:
+        url: URL of the OpenAPI specification.
+        http_client: Client to download through, e.g. to reuse pooled connections. A one-off
+            connection is used if omitted.
+        timeout: Request timeout in seconds, or an httpx.Timeout.
+        spec_cache: Optional cache to revalidate against. On 304 Not Modified the cached spec is returned.
+        max_size: Largest accepted spec, in bytes. Larger downloads are aborted as soon as they exceed it.
+        on_progress: Called with the bytes received so far and the total size, if known.
+        deadline: Deadline the whole download must finish by. The timeout is capped to the time left.
+
+    Returns:
+        The parsed specification.
+
+    Raises:
+        SpecInvalidError: If the download fails, is too large, or is not a valid OpenAPI specification.
+        DeadlineExceededError: If the deadline passes before the download finishes.
+    """
+    logger.info(f"Loading OpenAPI spec from URL: {url}")
+    cached = _revalidation(spec_cache, url)
+    headers = cached.conditional_headers() if cached is not None else None
+    timeout = phase_timeout(deadline, timeout, DOWNLOAD_PHASE)
+    try:
+        if http_client is not None:
+            stream = http_client.stream("GET", url, headers=headers, timeout=timeout)
+        else:
+            stream = httpx.stream("GET", url, headers=headers, timeout=timeout)
+        with stream as response:
+            if spec_cache is not None and cached is not None and response.status_code == 304:
+                return spec_cache.revalidated(cached)
+            response.raise_for_status()
+            tracker = _DownloadTracker(url, response, max_size, on_progress, deadline)
+            fmt = spec_format(url, response.headers.get("content-type", ""))
+            spec = _parse_chunks(url, fmt, (tracker.add(chunk) for chunk in response.iter_bytes()))
+    except httpx.HTTPError as e:
+        raise _fetch_error(url, e, deadline)
+
+    _cache_store(spec_cache, url, response, spec)
+    return spec
+
+
+async def fetch_spec_async(
+    url: str,
+    *,
+    http_client: httpx.AsyncClient,
+    timeout: TimeoutTypes = 30,
+    spec_cache: Optional[HTTPSpecCache] = None,
+    max_size: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    deadline: Optional[Deadline] = None,
+) -> OpenAPISpec:
+    """Download and parse an OpenAPI specification without blocking the event loop.
+
+    This is the asynchronous counterpart of `fetch_spec()`. The body is received without
+    blocking and kept as the list of chunks it arrived in, then parsed from them.
+
+    Raises:
+        SpecInvalidError: If the download fails, is too large, or is not a valid OpenAPI specification.
+        DeadlineExceededError: If the deadline passes before the download finishes.
+    """
+    logger.info(f"Loading OpenAPI spec from URL: {url}")
+    cached = _revalidation(spec_cache, url)
+    headers = cached.conditional_headers() if cached is not None else None
+    timeout = phase_timeout(deadline, timeout, DOWNLOAD_PHASE)
+    try:
+        async with http_client.stream("GET", url, headers=headers, timeout=timeout) as response:
+            if spec_cache is not None and cached is not None and response.status_code == 304:
+                return spec_cache.revalidated(cached)
+            response.raise_for_status()
+            tracker = _DownloadTracker(url, response, max_size, on_progress, deadline)
+            chunks: List[bytes] = [tracker.add(chunk) async for chunk in response.aiter_bytes()]
+    except httpx.HTTPError as e:
+        raise _fetch_error(url, e, deadline)
+
+    spec = _parse_chunks(url, spec_format(url, response.headers.get("content-type", "")), chunks)
+    _cache_store(spec_cache, url, response, spec)
+    return spec
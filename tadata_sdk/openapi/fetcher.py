@@ -0,0 +1,334 @@
+"""Concurrent downloading of many OpenAPI specifications over a shared connection pool."""
+
+import asyncio
+import logging
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, Dict, Iterable, Iterator, Optional
+from typing_extensions import Annotated, Doc
+
+import httpx
+
+from ..http.deadline import Deadline, TimeoutTypes
+from .fetch import ProgressCallback, fetch_spec, fetch_spec_async
+from .http_cache import HTTPSpecCache
+from .source import OpenAPISpec
+
+
+logger = logging.getLogger(__name__)
+
+
+class SpecFetchResult:
+    """Outcome of downloading one OpenAPI specification."""
+
+    def __init__(
+        self,
+        url: str,
+        elapsed: float,
+        spec: Optional[OpenAPISpec] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Initialize a spec fetch result.
+
+        Args:
+            url: URL the spec was downloaded from.
+            elapsed: Wall-clock seconds spent waiting for a connection, downloading and parsing.
+            spec: The parsed spec, if the download succeeded.
+            error: The exception raised for the download, if it failed.
+        """
+        self.url = url
+        self.elapsed = elapsed
+        self.spec = spec
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the spec was downloaded and parsed successfully."""
+        return self.error is None
+
+    def __str__(self) -> str:
+        """Return a string representation of the fetch result."""
+        outcome = "ok" if self.error is None else f"error={self.error!r}"
+        return f"SpecFetchResult(url={self.url}, {outcome}, elapsed={self.elapsed:.3f}s)"
+
+
+def _host_key(url: str) -> str:
+    """Return the scheme and host:port a URL connects to, which per-host limits are counted by."""
+    parts = urllib.parse.urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+class _BaseSpecFetcher:
+    """Settings shared by the sync and async spec fetchers."""
+
+    def __init__(
+        self,
+        *,
+        max_connections: int,
+        max_connections_per_host: int,
+        timeout: TimeoutTypes,
+        spec_cache: Optional[HTTPSpecCache],
+        max_spec_size: Optional[int],
+    ) -> None:
+        if max_connections < 1 or max_connections_per_host < 1:
+            raise ValueError("max_connections and max_connections_per_host must be at least 1")
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.spec_cache = spec_cache
+        self.max_spec_size = max_spec_size
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+
+
+class SpecFetcher(_BaseSpecFetcher):
+    """Downloads many OpenAPI specifications concurrently over one connection pool.
+
+    Downloads share a pool of at most `max_connections` connections, so specs served by the
+    same host reuse warm connections, and at most `max_connections_per_host` downloads run
+    against any one host at a time, so a batch never floods a single service. Specs are
+    streamed and parsed as they download, like `openapi_spec_url` in `deploy()`.
+
+    Use it as a context manager, or call `close()` when done. It is safe to use from several threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: Annotated[int, Doc("Most downloads in flight at once, across all hosts")] = 16,
+        max_connections_per_host: Annotated[int, Doc("Most downloads in flight at once from any one host")] = 4,
+        timeout: Annotated[
+            TimeoutTypes,
+            Doc("Request timeout in seconds, or an httpx.Timeout setting connect, read, write and pool timeouts"),
+        ] = 30,
+        spec_cache: Annotated[
+            Optional[HTTPSpecCache],
+            Doc("Cache of downloaded specs. Unchanged specs are neither downloaded nor parsed again"),
+        ] = None,
+        max_spec_size: Annotated[
+            Optional[int], Doc("Largest spec accepted, in bytes. Larger downloads are aborted early")
+        ] = None,
+        http_client: Annotated[
+            Optional[httpx.Client],
+            Doc("Client to download through. It is not closed by the fetcher. A new pooled client is used if omitted"),
+        ] = None,
+        transport: Annotated[
+            Optional[httpx.BaseTransport],
+            Doc("Custom httpx transport for the fetcher's own client, e.g. httpx.MockTransport in tests"),
+        ] = None,
+    ) -> None:
+        super().__init__(
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
+            timeout=timeout,
+            spec_cache=spec_cache,
+            max_spec_size=max_spec_size,
+        )
+        self._owns_client = http_client is None
+        self.http_client = http_client or httpx.Client(timeout=timeout, limits=self._limits(), transport=transport)
+        self._hosts: Dict[str, threading.BoundedSemaphore] = {}
+        self._hosts_lock = threading.Lock()
+
+    def __enter__(self) -> "SpecFetcher":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the fetcher's connection pool, unless it was passed in as `http_client`."""
+        if self._owns_client:
+            self.http_client.close()
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        key = _host_key(url)
+        with self._hosts_lock:
+            if key not in self._hosts:
+                self._hosts[key] = threading.BoundedSemaphore(self.max_connections_per_host)
+            return self._hosts[key]
+
+    def fetch(
+        self,
+        url: str,
+        *,
+        deadline: Optional[Deadline] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> OpenAPISpec:
+        """Download and parse one OpenAPI specification, waiting for a free slot on its host.
+
+        Args:
+            url: URL of the OpenAPI specification.
+            deadline: Deadline the download must finish by.
+            on_progress: Called with the bytes received so far and the total size, if known.
+
+        Returns:
+            The parsed specification.
+
+        Raises:
+            SpecInvalidError: If the download fails, is too large, or is not a valid OpenAPI specification.
+            DeadlineExceededError: If the deadline passes before the download finishes.
+        """
+        with self._host_slot(url):
+            return fetch_spec(
+                url,
+                http_client=self.http_client,
+                timeout=self.timeout,
+                spec_cache=self.spec_cache,
+                max_size=self.max_spec_size,
+                on_progress=on_progress,
+                deadline=deadline,
+            )
+
+    def _fetch_result(self, url: str, deadline: Optional[Deadline]) -> SpecFetchResult:
+        started = time.perf_counter()
+        try:
+            spec = self.fetch(url, deadline=deadline)
+        except Exception as e:
+            logger.error(f"Fetching OpenAPI spec from {url} failed: {e}")
+            return SpecFetchResult(url, time.perf_counter() - started, error=e)
+        return SpecFetchResult(url, time.perf_counter() - started, spec=spec)
+
+    def fetch_many(
+        self,
+        urls: Annotated[Iterable[str], Doc("URLs of the OpenAPI specifications")],
+        *,
+        deadline: Annotated[Optional[float], Doc("Total seconds for all downloads")] = None,
+    ) -> Iterator[SpecFetchResult]:
+        """Download and parse many OpenAPI specifications concurrently.
+
+        A failed download never stops the others: its exception is captured in its SpecFetchResult.
+
+        Returns:
+            An iterator of results, in the order the downloads finish.
+        """
+        fetch_deadline = Deadline(deadline) if deadline is not None else None
+        executor = ThreadPoolExecutor(max_workers=self.max_connections)
+        try:
+            futures = [executor.submit(self._fetch_result, url, fetch_deadline) for url in urls]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Drop the downloads not started yet if the caller stopped iterating early
+            executor.shutdown(cancel_futures=True)
+
+
+class AsyncSpecFetcher(_BaseSpecFetcher):
+    """Downloads many OpenAPI specifications concurrently on the running event loop.
+
+    This is the asynchronous counterpart of `SpecFetcher` and accepts the same arguments.
+    Use it as an async context manager, or call `aclose()` when done.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: Annotated[int, Doc("Most downloads in flight at once, across all hosts")] = 16,
+        max_connections_per_host: Annotated[int, Doc("Most downloads in flight at once from any one host")] = 4,
+        timeout: Annotated[
+            TimeoutTypes,
+            Doc("Request timeout in seconds, or an httpx.Timeout setting connect, read, write and pool timeouts"),
+        ] = 30,
+        spec_cache: Annotated[
+            Optional[HTTPSpecCache],
+            Doc("Cache of downloaded specs. Unchanged specs are neither downloaded nor parsed again"),
+        ] = None,
+        max_spec_size: Annotated[
+            Optional[int], Doc("Largest spec accepted, in bytes. Larger downloads are aborted early")
+        ] = None,
+        http_client: Annotated[
+            Optional[httpx.AsyncClient],
+            Doc("Client to download through. It is not closed by the fetcher. A new pooled client is used if omitted"),
+        ] = None,
+        transport: Annotated[
+            Optional[httpx.AsyncBaseTransport],
+            Doc("Custom httpx transport for the fetcher's own client, e.g. httpx.MockTransport in tests"),
+        ] = None,
+    ) -> None:
+        super().__init__(
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
+            timeout=timeout,
+            spec_cache=spec_cache,
+            max_spec_size=max_spec_size,
+        )
+        self._owns_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(timeout=timeout, limits=self._limits(), transport=transport)
+        # Waiting in the semaphore rather than for a pooled connection, where the pool timeout would apply
+        self._slots = asyncio.Semaphore(max_connections)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> "AsyncSpecFetcher":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the fetcher's connection pool, unless it was passed in as `http_client`."""
+        if self._owns_client:
+            await self.http_client.aclose()
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        key = _host_key(url)
+        if key not in self._hosts:
+            self._hosts[key] = asyncio.Semaphore(self.max_connections_per_host)
+        return self._hosts[key]
+
+    async def fetch(
+        self,
+        url: str,
+        *,
+        deadline: Optional[Deadline] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> OpenAPISpec:
+        """Download and parse one OpenAPI specification, waiting for a free slot on its host.
+
+        Raises:
+            SpecInvalidError: If the download fails, is too large, or is not a valid OpenAPI specification.
+            DeadlineExceededError: If the deadline passes before the download finishes.
+        """
+        async with self._host_slot(url), self._slots:
+            return await fetch_spec_async(
+                url,
+                http_client=self.http_client,
+                timeout=self.timeout,
+                spec_cache=self.spec_cache,
+                max_size=self.max_spec_size,
+                on_progress=on_progress,
+                deadline=deadline,
+            )
+
+    async def _fetch_result(self, url: str, deadline: Optional[Deadline]) -> SpecFetchResult:
+        started = time.perf_counter()
+        try:
+            spec = await self.fetch(url, deadline=deadline)
+        except Exception as e:
+            logger.error(f"Fetching OpenAPI spec from {url} failed: {e}")
+            return SpecFetchResult(url, time.perf_counter() - started, error=e)
+        return SpecFetchResult(url, time.perf_counter() - started, spec=spec)
+
+    async def fetch_many(
+        self,
+        urls: Annotated[Iterable[str], Doc("URLs of the OpenAPI specifications")],
+        *,
+        deadline: Annotated[Optional[float], Doc("Total seconds for all downloads")] = None,
+    ) -> AsyncIterator[SpecFetchResult]:
+        """Download and parse many OpenAPI specifications concurrently.
+
+        A failed download never stops the others: its exception is captured in its SpecFetchResult.
+
+        Returns:
+            An async iterator of results, in the order the downloads finish.
+        """
+        fetch_deadline = Deadline(deadline) if deadline is not None else None
+        tasks = [asyncio.ensure_future(self._fetch_result(url, fetch_deadline)) for url in urls]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # The caller stopped iterating early
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,162 @@
+"""Selecting which operations of an OpenAPI document to deploy."""
+
+import fnmatch
+import re
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Union
+from typing_extensions import Annotated, Doc
+
+from .index import HTTP_METHODS, normalize_pointer
+from .prune import prune_components
+
+
+def _as_list(values: Optional[Iterable[str]]) -> Optional[List[str]]:
+    if values is None:
+        return None
+    if isinstance(values, str):
+        return [values]
+    return list(values)
+
+
+def _compile(pattern: Optional[Union[str, Pattern[str]]]) -> Optional[Pattern[str]]:
+    return re.compile(pattern) if isinstance(pattern, str) else pattern
+
+
+class OperationFilter:
+    """Which operations of a spec to keep, by tag, path, HTTP method and operationId.
+
+    An operation is kept when it matches every include criterion that is set, and none of the
+    exclude criteria. Within one criterion, matching any of its values is enough:
+    `OperationFilter(tags=["pets", "stores"], methods=["get"])` keeps the GET operations tagged
+    either "pets" or "stores".
+
+    Paths are matched with shell-style globs (`fnmatch`), where `*` also matches `/`:
+    `"/admin/*"` matches every path under `/admin/`. Methods are matched case-insensitively.
+    operationIds are matched with `re.search`, so anchor the pattern to match whole ids.
+    """
+
+    def __init__(
+        self,
+        *,
+        tags: Annotated[Optional[Iterable[str]], Doc("Keep operations with one of these tags")] = None,
+        paths: Annotated[Optional[Iterable[str]], Doc("Keep operations whose path matches one of these globs")] = None,
+        methods: Annotated[Optional[Iterable[str]], Doc("Keep operations with one of these HTTP methods")] = None,
+        operation_id: Annotated[
+            Optional[Union[str, Pattern[str]]], Doc("Keep operations whose operationId matches this regex")
+        ] = None,
+        exclude_tags: Annotated[Optional[Iterable[str]], Doc("Drop operations with one of these tags")] = None,
+        exclude_paths: Annotated[
+            Optional[Iterable[str]], Doc("Drop operations whose path matches one of these globs")
+        ] = None,
+        exclude_methods: Annotated[
+            Optional[Iterable[str]], Doc("Drop operations with one of these HTTP methods")
+        ] = None,
+        exclude_operation_id: Annotated[
+            Optional[Union[str, Pattern[str]]], Doc("Drop operations whose operationId matches this regex")
+        ] = None,
+    ) -> None:
+        self.tags = _as_list(tags)
+        self.paths = _as_list(paths)
+        self.methods = _as_list(methods)
+        self.operation_id = _compile(operation_id)
+        self.exclude_tags = _as_list(exclude_tags)
+        self.exclude_paths = _as_list(exclude_paths)
+        self.exclude_methods = _as_list(exclude_methods)
+        self.exclude_operation_id = _compile(exclude_operation_id)
+
+        self._tags = frozenset(self.tags) if self.tags is not None else None
+        self._methods = frozenset(m.lower() for m in self.methods) if self.methods is not None else None
+        self._exclude_tags = frozenset(self.exclude_tags or ())
+        self._exclude_methods = frozenset(m.lower() for m in self.exclude_methods or ())
+
+    def __repr__(self) -> str:
+        settings = ", ".join(f"{key}={value!r}" for key, value in vars(self).items() if not key.startswith("_"))
+        return f"OperationFilter({settings})"
+
+    def matches(self, path: str, method: str, operation: Dict[str, Any]) -> bool:
+        """Return whether to keep an operation.
+
+        Args:
+            path: Path of the operation, e.g. ``/pets/{id}``.
+            method: HTTP method of the operation.
+            operation: The operation object.
+        """
+        method = method.lower()
+        tags = operation.get("tags") or ()
+        operation_id = operation.get("operationId")
+        if not isinstance(operation_id, str):
+            operation_id = None
+
+        if self._tags is not None and self._tags.isdisjoint(tags):
+            return False
+        if self.paths is not None and not any(fnmatch.fnmatchcase(path, glob) for glob in self.paths):
+            return False
+        if self._methods is not None and method not in self._methods:
+            return False
+        if self.operation_id is not None and (operation_id is None or not self.operation_id.search(operation_id)):
+            return False
+
+        if not self._exclude_tags.isdisjoint(tags) or method in self._exclude_methods:
+            return False
+        if self.exclude_paths and any(fnmatch.fnmatchcase(path, glob) for glob in self.exclude_paths):
+            return False
+        if self.exclude_operation_id is not None and operation_id is not None:
+            return not self.exclude_operation_id.search(operation_id)
+        return True
+
+    def apply(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a document with only the operations this filter keeps.
+
+        Paths left without operations are removed, and so are the components that nothing
+        kept refers to any more. The document is not modified; the returned one shares the
+        kept operations and every unchanged node with it.
+
+        Args:
+            document: An OpenAPI document.
+
+        Returns:
+            The filtered document.
+        """
+        paths = document.get("paths")
+        if not isinstance(paths, dict):
+            return document
+
+        kept_paths: Dict[str, Any] = {}
+        for path, path_item in paths.items():
+            item = path_item
+            ref = path_item.get("$ref") if isinstance(path_item, dict) else None
+            if isinstance(ref, str) and ref.startswith("#"):
+                # Path items defined under components are filtered through the item they point to
+                item = _resolve(document, ref)
+            if not isinstance(item, dict):
+                kept_paths[path] = path_item
+                continue
+
+            kept_item: Dict[str, Any] = {}
+            operations = dropped = 0
+            for key, value in item.items():
+                if key in HTTP_METHODS and isinstance(value, dict):
+                    operations += 1
+                    if not self.matches(path, key, value):
+                        dropped += 1
+                        continue
+                kept_item[key] = value
+            if operations and operations == dropped:
+                continue
+            kept_paths[path] = path_item if not dropped else kept_item
+
+        filtered, _ = prune_components({**document, "paths": kept_paths})
+        return filtered
+
+
+def _resolve(document: Dict[str, Any], ref: str) -> Any:
+    """Return the node an internal `$ref` points to, or None if there is none."""
+    node: Any = document
+    for token in normalize_pointer(ref).split("/")[1:]:
+        token = token.replace("~1", "/").replace("~0", "~")
+        if isinstance(node, dict):
+            node = node.get(token)
+        elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+            node = node[int(token)]
+        else:
+            return None
+    return node
@@ -0,0 +1,161 @@
+"""On-disk HTTP cache of OpenAPI specs downloaded from URLs."""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing_extensions import Annotated, Doc
+
+from .. import json_backend
+from .source import OpenAPISpec
+
+if TYPE_CHECKING:
+    import httpx
+
+
+logger = logging.getLogger(__name__)
+
+
+class CachedSpecEntry:
+    """A cached spec together with the validators needed to revalidate it."""
+
+    def __init__(self, path: Path, url: str, etag: Optional[str], last_modified: Optional[str], spec: Any) -> None:
+        self.path = path
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self._spec = spec
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return the headers asking the server to answer 304 if the spec has not changed."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def load_spec(self) -> OpenAPISpec:
+        """Build the cached spec, without downloading, parsing or validating the original document again."""
+        return OpenAPISpec._from_cached(self._spec)
+
+
+class HTTPSpecCache:
+    """Cache of OpenAPI specs downloaded from URLs, revalidated with conditional GET requests.
+
+    For each URL the cache keeps the parsed spec with the `ETag` and `Last-Modified` headers of
+    the response. The next download of the URL sends `If-None-Match` / `If-Modified-Since`; if
+    the server answers 304 Not Modified, the cached spec is used and the document is neither
+    downloaded nor parsed again. Responses without either header are not cached.
+
+    Entries are kept as one JSON file each, written atomically, so several processes can share
+    a cache directory. Once the directory grows over `max_size` bytes, the least recently used
+    entries are removed.
+    """
+
+    def __init__(
+        self,
+        directory: Annotated[Union[str, Path], Doc("Directory where cached specs are stored")],
+        max_size: Annotated[int, Doc("Largest total size of the cached entries, in bytes")] = 256 * 1024 * 1024,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def _entry_path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def lookup(self, url: str) -> Optional[CachedSpecEntry]:
+        """Return the cached entry for a URL, if there is one.
+
+        Args:
+            url: URL of the OpenAPI specification.
+
+        Returns:
+            The cached entry, or None if the URL is not cached or its entry cannot be read.
+        """
+        path = self._entry_path(url)
+        try:
+            entry = json_backend.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url or not isinstance(entry.get("spec"), dict):
+            return None
+        return CachedSpecEntry(path, url, entry.get("etag"), entry.get("last_modified"), entry["spec"])
+
+    def revalidated(self, entry: CachedSpecEntry) -> OpenAPISpec:
+        """Return the spec of an entry the server confirmed is unchanged, marking it as recently used.
+
+        Args:
+            entry: The entry returned by `lookup()`.
+
+        Returns:
+            The cached spec.
+        """
+        logger.info(f"OpenAPI spec at {entry.url} not modified, using cached copy")
+        try:
+            os.utime(entry.path)
+        except OSError:
+            pass
+        return entry.load_spec()
+
+    def store(self, url: str, response: "httpx.Response", spec: OpenAPISpec) -> None:
+        """Cache a downloaded spec, if the response carries validators to revalidate it with.
+
+        Args:
+            url: URL of the OpenAPI specification.
+            response: The response the spec was parsed from.
+            spec: The parsed spec.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return
+
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+            "spec": spec.model_dump(mode="json", by_alias=True, exclude_none=True),
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_backend.dumps(entry))
+            os.replace(tmp_path, self._entry_path(url))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in `max_size`."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            if path.name.startswith("."):
+                # Entry being written by another process
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_size:
+                break
+            logger.debug(f"Evicting cached spec {path.name}")
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        if not self.directory.exists():
+            return
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,182 @@
+"""Lookup tables over an OpenAPI document: JSON Pointers, operations, tags and references."""
+
+import urllib.parse
+from typing import Any, Dict, List, Optional, Tuple
+
+HTTP_METHODS = frozenset({"get", "put", "post", "delete", "options", "head", "patch", "trace"})
+
+# (path, method) of an operation, e.g. ("/pets/{id}", "get")
+OperationKey = Tuple[str, str]
+
+
+def escape_token(token: str) -> str:
+    """Escape a key for use as a JSON Pointer reference token (RFC 6901)."""
+    if "~" in token or "/" in token:
+        return token.replace("~", "~0").replace("/", "~1")
+    return token
+
+
+def _unescape_token(token: str) -> str:
+    if "~" in token:
+        return token.replace("~1", "/").replace("~0", "~")
+    return token
+
+
+def normalize_pointer(pointer: str) -> str:
+    """Turn a JSON Pointer, or an internal `$ref` such as ``#/components/schemas/Pet``, into a plain pointer."""
+    if pointer.startswith("#"):
+        return urllib.parse.unquote(pointer[1:])
+    return pointer
+
+
+class SpecIndex:
+    """Lookup tables over an OpenAPI document, each built the first time it is needed.
+
+    - `resolve()` finds the node at a JSON Pointer in constant time. Only containers (dicts and
+      lists) are keyed by pointer; other values are looked up in their parent container, which
+      keeps the index at one entry per container.
+    - `operation()` and `operations_with_tag()` find operations by operationId and by tag.
+    - `references_to()` lists the locations whose internal `$ref` points at a pointer.
+
+    The index holds references to the document's nodes, not copies. It does not notice
+    changes made to the document afterwards; `OpenAPISpec.index` is rebuilt when a field of
+    the spec is assigned, and `OpenAPISpec.invalidate_index()` must be called after editing
+    its nested dicts in place.
+    """
+
+    def __init__(self, document: Dict[str, Any]) -> None:
+        self.document = document
+        self._containers: Optional[Dict[str, Any]] = None
+        self._references: Optional[Dict[str, List[str]]] = None
+        self._operations: Optional[Dict[str, OperationKey]] = None
+        self._tags: Optional[Dict[str, List[OperationKey]]] = None
+
+    def _walk(self) -> None:
+        """Index every container of the document by pointer, and every internal `$ref` by target."""
+        containers: Dict[str, Any] = {}
+        references: Dict[str, List[str]] = {}
+        stack: List[Tuple[str, Any]] = [("", self.document)]
+        while stack:
+            pointer, node = stack.pop()
+            containers[pointer] = node
+            if isinstance(node, dict):
+                ref = node.get("$ref")
+                if isinstance(ref, str) and ref.startswith("#"):
+                    references.setdefault(normalize_pointer(ref), []).append(pointer)
+                for key, value in node.items():
+                    if isinstance(value, (dict, list)):
+                        stack.append((f"{pointer}/{escape_token(str(key))}", value))
+            else:
+                for i, value in enumerate(node):
+                    if isinstance(value, (dict, list)):
+                        stack.append((f"{pointer}/{i}", value))
+        self._containers = containers
+        self._references = references
+
+    def _index_operations(self) -> None:
+        operations: Dict[str, OperationKey] = {}
+        tags: Dict[str, List[OperationKey]] = {}
+        paths = self.document.get("paths")
+        for path, path_item in paths.items() if isinstance(paths, dict) else ():
+            if not isinstance(path_item, dict):
+                continue
+            for method, operation in path_item.items():
+                if method not in HTTP_METHODS or not isinstance(operation, dict):
+                    continue
+                key = (path, method)
+                operation_id = operation.get("operationId")
+                if isinstance(operation_id, str):
+                    # operationIds must be unique; if they are not, the first one wins
+                    operations.setdefault(operation_id, key)
+                for tag in operation.get("tags") or ():
+                    if isinstance(tag, str):
+                        tags.setdefault(tag, []).append(key)
+        self._operations = operations
+        self._tags = tags
+
+    def resolve(self, pointer: str) -> Any:
+        """Return the node at a JSON Pointer.
+
+        Args:
+            pointer: A JSON Pointer such as ``/paths/~1pets/get``, or an internal `$ref` such as
+                ``#/components/schemas/Pet``.
+
+        Returns:
+            The node at the pointer.
+
+        Raises:
+            KeyError: If nothing exists at the pointer.
+        """
+        if self._containers is None:
+            self._walk()
+        assert self._containers is not None
+        pointer = normalize_pointer(pointer)
+        node = self._containers.get(pointer)
+        if node is not None:
+            return node
+        parent_pointer, _, token = pointer.rpartition("/")
+        parent = self._containers.get(parent_pointer) if pointer else None
+        try:
+            if isinstance(parent, dict):
+                return parent[_unescape_token(token)]
+            if isinstance(parent, list):
+                return parent[int(token)]
+        except (KeyError, IndexError, ValueError):
+            pass
+        raise KeyError(pointer)
+
+    def references_to(self, pointer: str) -> List[str]:
+        """Return the pointers of the nodes whose internal `$ref` targets a pointer.
+
+        Args:
+            pointer: A JSON Pointer or internal `$ref`.
+
+        Returns:
+            Pointers of the referencing nodes (the objects holding the `$ref`), possibly empty.
+        """
+        if self._references is None:
+            self._walk()
+        assert self._references is not None
+        return list(self._references.get(normalize_pointer(pointer), ()))
+
+    @property
+    def referenced_pointers(self) -> List[str]:
+        """Pointers that at least one internal `$ref` targets."""
+        if self._references is None:
+            self._walk()
+        assert self._references is not None
+        return list(self._references)
+
+    def operation(self, operation_id: str) -> OperationKey:
+        """Return the path and method of the operation with an operationId.
+
+        Raises:
+            KeyError: If no operation has this operationId.
+        """
+        if self._operations is None:
+            self._index_operations()
+        assert self._operations is not None
+        return self._operations[operation_id]
+
+    def operations_with_tag(self, tag: str) -> List[OperationKey]:
+        """Return the path and method of every operation with a tag, in document order."""
+        if self._tags is None:
+            self._index_operations()
+        assert self._tags is not None
+        return list(self._tags.get(tag, ()))
+
+    @property
+    def operation_ids(self) -> Dict[str, OperationKey]:
+        """Path and method of every operation with an operationId, keyed by operationId."""
+        if self._operations is None:
+            self._index_operations()
+        assert self._operations is not None
+        return dict(self._operations)
+
+    @property
+    def tags(self) -> List[str]:
+        """Tags used by at least one operation."""
+        if self._tags is None:
+            self._index_operations()
+        assert self._tags is not None
+        return list(self._tags)
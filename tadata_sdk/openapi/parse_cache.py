@@ -0,0 +1,156 @@
+"""On-disk cache of parsed OpenAPI specifications, so the same document is not parsed twice."""
+
+import hashlib
+import logging
+import marshal
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Literal, Optional, Union
+from typing_extensions import Annotated, Doc
+
+
+logger = logging.getLogger(__name__)
+
+# The marshal format changes between Python versions, so entries are never shared across them
+_KEY_PREFIX = f"tadata-parsed-spec-1\0py{sys.version_info[0]}.{sys.version_info[1]}\0"
+
+
+class ParsedSpecCache:
+    """Cache of parsed and validated OpenAPI specifications, shared by processes on one machine.
+
+    Pass it as `cache=` to `OpenAPISpec.from_file()`, `from_json()` or `from_yaml()`. Files are
+    looked up by path, modification time and size, so a hit does not even read the file; JSON
+    and YAML documents are looked up by the SHA-256 of their content. Only documents that
+    parsed into a valid spec are cached, serialized with `marshal`; a hit builds the spec
+    without validating it again.
+
+    Loading an entry is far faster than parsing YAML, and faster than the standard `json`
+    module. orjson and msgspec parse JSON about as fast as an entry loads, so with either of
+    them installed JSON documents bypass the cache.
+
+    Entries are kept as one file each, written atomically, so several processes can share a
+    cache directory. Once the directory grows over `max_size` bytes, the least recently used
+    entries are removed. `marshal` data must come from a trusted source: only point the cache
+    at a directory that other users cannot write to.
+    """
+
+    def __init__(
+        self,
+        directory: Annotated[Union[str, Path], Doc("Directory where parsed specs are stored")],
+        max_size: Annotated[int, Doc("Largest total size of the cached entries, in bytes")] = 512 * 1024 * 1024,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    @staticmethod
+    def file_key(path: Path) -> str:
+        """Return the cache key of a spec file, from its path, modification time and size.
+
+        Args:
+            path: Resolved path of the file.
+
+        Returns:
+            The hex-encoded key.
+
+        Raises:
+            OSError: If the file cannot be accessed.
+        """
+        stat = path.stat()
+        identity = f"{_KEY_PREFIX}file\0{path}\0{stat.st_mtime_ns}\0{stat.st_size}"
+        return hashlib.sha256(identity.encode("utf-8", "surrogatepass")).hexdigest()
+
+    @staticmethod
+    def content_key(content: Union[str, bytes, memoryview], kind: Literal["json", "yaml"]) -> str:
+        """Return the cache key of a JSON or YAML document, from the SHA-256 of its content.
+
+        Args:
+            content: The document, as a str or UTF-8 bytes.
+            kind: Whether the document is JSON or YAML.
+
+        Returns:
+            The hex-encoded key.
+        """
+        digest = hashlib.sha256(f"{_KEY_PREFIX}{kind}\0".encode("utf-8"))
+        digest.update(content.encode("utf-8", "surrogatepass") if isinstance(content, str) else content)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.marshal"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the parsed spec stored under a key, marking it as recently used.
+
+        Args:
+            key: Key from `file_key()` or `content_key()`.
+
+        Returns:
+            The parsed spec document, or None if it is not cached or its entry cannot be read.
+        """
+        path = self._entry_path(key)
+        try:
+            data = marshal.loads(path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(data, dict):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        """Store a parsed spec document that was validated successfully.
+
+        Documents holding values marshal cannot serialize, e.g. YAML timestamps, are not cached.
+
+        Args:
+            key: Key from `file_key()` or `content_key()`.
+            data: The parsed spec document.
+        """
+        try:
+            serialized = marshal.dumps(data)
+        except ValueError as e:
+            logger.debug(f"Not caching parsed spec: {e}")
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".marshal")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(serialized)
+            os.replace(tmp_path, self._entry_path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in `max_size`."""
+        entries = []
+        for path in self.directory.glob("*.marshal"):
+            if path.name.startswith("."):
+                # Entry being written by another process
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_size:
+                break
+            logger.debug(f"Evicting parsed spec {path.name}")
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        if not self.directory.exists():
+            return
+        for path in self.directory.glob("*.marshal"):
+            path.unlink(missing_ok=True)
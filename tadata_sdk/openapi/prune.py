@@ -0,0 +1,148 @@
+"""Removing components that nothing in an OpenAPI document refers to."""
+
+import urllib.parse
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .. import json_backend
+
+# Sections of `components` whose entries are only used through `$ref`. Security schemes are
+# referenced by name from security requirements instead, so they are always kept.
+PRUNABLE_SECTIONS = frozenset(
+    {"schemas", "responses", "parameters", "examples", "requestBodies", "headers", "links", "callbacks", "pathItems"}
+)
+
+_COMPONENTS_PREFIX = "#/components/"
+
+
+def _component_of(ref: str) -> Optional[Tuple[str, str]]:
+    """Return the (section, name) of the component an internal `$ref` points into, if any."""
+    if not ref.startswith(_COMPONENTS_PREFIX):
+        return None
+    tokens = urllib.parse.unquote(ref[len(_COMPONENTS_PREFIX) :]).split("/", 2)
+    if len(tokens) < 2:
+        return None
+    section, name = (token.replace("~1", "/").replace("~0", "~") for token in tokens[:2])
+    return section, name
+
+
+def reachable_components(document: Dict[str, Any]) -> Dict[str, Set[str]]:
+    """Find the components used, directly or through other components, by the rest of a document.
+
+    Everything outside `components`, and every component section that is not in
+    `PRUNABLE_SECTIONS`, is a root. Each node is visited once, so this takes time linear in the
+    size of the document. Discriminator mappings count as references to the schemas they name.
+
+    Args:
+        document: An OpenAPI document.
+
+    Returns:
+        Names of the reachable components, keyed by the `PRUNABLE_SECTIONS` they belong to.
+    """
+    components = document.get("components")
+    if not isinstance(components, dict):
+        return {}
+
+    stack: List[Any] = [value for key, value in document.items() if key != "components"]
+    stack.extend(value for section, value in components.items() if section not in PRUNABLE_SECTIONS)
+    reachable: Dict[str, Set[str]] = {}
+
+    def visit(ref: str) -> None:
+        component = _component_of(ref)
+        if component is None or component[0] not in PRUNABLE_SECTIONS:
+            return
+        section, name = component
+        names = reachable.setdefault(section, set())
+        entries = components.get(section)
+        if name not in names and isinstance(entries, dict) and name in entries:
+            names.add(name)
+            stack.append(entries[name])
+
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                visit(ref)
+            discriminator = node.get("discriminator")
+            if isinstance(discriminator, dict) and isinstance(discriminator.get("mapping"), dict):
+                for target in discriminator["mapping"].values():
+                    if isinstance(target, str):
+                        # Mapping values are either refs or bare schema names
+                        visit(target if "/" in target else f"{_COMPONENTS_PREFIX}schemas/{target}")
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return reachable
+
+
+class PruneReport:
+    """What pruning removed from a spec's components."""
+
+    def __init__(self, removed: Dict[str, List[str]], bytes_saved: int) -> None:
+        """Initialize a prune report.
+
+        Args:
+            removed: Names of the removed components, keyed by section.
+            bytes_saved: Size of the removed components serialized as compact JSON, which is
+                about how much smaller the uploaded spec gets.
+        """
+        self.removed = removed
+        self.bytes_saved = bytes_saved
+
+    @property
+    def removed_count(self) -> int:
+        """Number of components removed."""
+        return sum(len(names) for names in self.removed.values())
+
+    def __str__(self) -> str:
+        sections = ", ".join(f"{len(names)} {section}" for section, names in self.removed.items())
+        return f"Removed {self.removed_count} unused components ({sections or 'none'}), saving {self.bytes_saved} bytes"
+
+
+def prune_components(document: Dict[str, Any]) -> Tuple[Dict[str, Any], PruneReport]:
+    """Return a document without the components that `reachable_components()` does not reach.
+
+    The document is not modified: the returned one shares everything but `components` with it.
+    Sections left empty are removed, and so is `components` if nothing is left in it.
+
+    Args:
+        document: An OpenAPI document.
+
+    Returns:
+        The pruned document, or `document` itself if every component is used, and a report of
+        what was removed.
+    """
+    components = document.get("components")
+    if not isinstance(components, dict):
+        return document, PruneReport({}, 0)
+
+    reachable = reachable_components(document)
+    pruned: Dict[str, Any] = {}
+    removed: Dict[str, Dict[str, Any]] = {}
+    for section, entries in components.items():
+        if section not in PRUNABLE_SECTIONS or not isinstance(entries, dict):
+            pruned[section] = entries
+            continue
+        names = reachable.get(section, set())
+        if len(names) == len(entries):
+            pruned[section] = entries
+            continue
+        kept: Dict[str, Any] = {}
+        for name, value in entries.items():
+            if name in names:
+                kept[name] = value
+            else:
+                removed.setdefault(section, {})[name] = value
+        if kept:
+            pruned[section] = kept
+    report = PruneReport(
+        {section: list(entries) for section, entries in removed.items()},
+        len(json_backend.dumps(removed)) if removed else 0,
+    )
+    if not removed:
+        return document, report
+
+    result = {key: value for key, value in document.items() if key != "components"}
+    if pruned:
+        result["components"] = pruned
+    return result, report
@@ -1,12 +1,89 @@
-import json
+import functools
+import logging
+import mmap
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, Optional, Union
 
-import yaml
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
+from .. import json_backend
 from ..errors.exceptions import SpecInvalidError
 
+if TYPE_CHECKING:
+    from .filter import OperationFilter
+    from .index import SpecIndex
+    from .parse_cache import ParsedSpecCache
+    from .prune import PruneReport
+
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader() -> Any:
+    """Return the YAML loader class to use, importing PyYAML on first use only."""
+    try:
+        # libyaml's C loader is an order of magnitude faster than the pure-Python one on large specs
+        from yaml import CSafeLoader
+
+        return CSafeLoader
+    except ImportError:  # pragma: no cover
+        from yaml import SafeLoader
+
+        return SafeLoader
+
+
+def __getattr__(name: str) -> Any:
+    # Name of the YAML loader in use: "CSafeLoader" with libyaml, "SafeLoader" without.
+    # Computed on access, so that importing this module does not import PyYAML.
+    if name == "YAML_LOADER_NAME":
+        return _yaml_loader().__name__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@contextmanager
+def _map_file(file_path: Path) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Memory-map a file for reading, so parsers can work on its bytes without copying them."""
+    with file_path.open("rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            yield b""
+            return
+        with mapped:
+            yield mapped
+
+
+def _load_json(data: Union[str, bytes, memoryview]) -> Any:
+    """Parse a JSON document, raising SpecInvalidError if it is not valid JSON."""
+    try:
+        return json_backend.loads(data)
+    except ValueError as e:
+        # Copy the excerpt out of buffers, which may be backed by a file mapping that is about to close
+        excerpt = data[:100] if isinstance(data, (str, bytes)) else bytes(data[:100])
+        raise SpecInvalidError(f"Invalid JSON: {str(e)}", details={"json_str": excerpt}, cause=e)
+
+
+def _load_yaml(stream: Union[str, bytes, mmap.mmap, IO[bytes]], details: Dict[str, Any]) -> Any:
+    """Parse a YAML document, raising SpecInvalidError if it is not valid YAML."""
+    import yaml
+
+    try:
+        return yaml.load(stream, Loader=_yaml_loader())
+    except yaml.YAMLError as e:
+        raise SpecInvalidError(f"Invalid YAML: {str(e)}", details=details, cause=e)
+
+
+def _json_cache(cache: Optional["ParsedSpecCache"]) -> Optional["ParsedSpecCache"]:
+    """Return the parsed spec cache to use for a JSON document.
+
+    orjson and msgspec parse JSON about as fast as marshal loads a cache entry, so with them
+    the cache would only add hashing and disk I/O. It is used for JSON with the json module only.
+    """
+    return cache if json_backend.BACKEND_NAME == "json" else None
+
 
 class OpenAPIInfo(BaseModel):
     """OpenAPI info object."""
@@ -15,7 +92,7 @@ class OpenAPIInfo(BaseModel):
     version: str
     description: Optional[str] = None
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class OpenAPISpec(BaseModel):
@@ -28,7 +105,97 @@ class OpenAPISpec(BaseModel):
     openapi: str = Field(..., description="OpenAPI version string")
     info: OpenAPIInfo = Field(..., description="Information about the API")
     paths: Dict[str, Any] = Field(..., description="API paths")
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    # Validators are built on first use rather than at import time
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
+
+    _index: Optional["SpecIndex"] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.invalidate_index()
+
+    @property
+    def index(self) -> "SpecIndex":
+        """Lookup tables over this specification, built on first use.
+
+        The index maps JSON Pointers to nodes, operationIds and tags to operations, and
+        reference targets to the `$ref`s pointing at them, so tools can look things up in
+        constant time instead of walking the document. It is dropped whenever a field of the
+        spec is assigned; call `invalidate_index()` after editing nested dicts in place.
+        """
+        if self._index is None:
+            from .index import SpecIndex
+
+            self._index = SpecIndex(self._document())
+        return self._index
+
+    def invalidate_index(self) -> None:
+        """Drop the lookup tables of `index`, so they are rebuilt from the current document on next use."""
+        self._index = None
+
+    def _document(self) -> Dict[str, Any]:
+        """Return the specification as a dict sharing its nodes, unlike `model_dump()` which copies them."""
+        return {
+            "openapi": self.openapi,
+            "info": self.info.model_dump(by_alias=True, exclude_none=True),
+            "paths": self.paths,
+            **(self.model_extra or {}),
+        }
+
+    def filter_operations(self, operation_filter: "OperationFilter") -> "OpenAPISpec":
+        """Return a specification with only the operations a filter keeps.
+
+        Paths left without operations are removed, and so are the components that nothing
+        kept refers to any more. This specification is not modified; the returned one shares
+        the kept operations and every unchanged node with it.
+
+        Args:
+            operation_filter: Which operations to keep.
+
+        Returns:
+            The filtered specification.
+        """
+        return type(self).from_dict(operation_filter.apply(self._document()))
+
+    def canonical_hash(self, strip_extensions: bool = False) -> str:
+        """Compute a hash of this specification that only changes when its content does.
+
+        Key order, whitespace, number spelling such as `1.0` vs `1`, and whether the spec was
+        loaded from JSON or YAML do not affect it. The hash is computed over a stream of the
+        canonical JSON, which is never held in memory whole. See `canonical_json()` for the
+        exact form that is hashed.
+
+        Args:
+            strip_extensions: Whether to leave `x-` vendor extensions out of the hash.
+
+        Returns:
+            The hex-encoded SHA-256.
+        """
+        from .canonical import canonical_hash
+
+        return canonical_hash(self._document(), strip_extensions=strip_extensions)
+
+    def prune_unused_components(self) -> "PruneReport":
+        """Remove the components that no operation or other part of the spec uses.
+
+        Reachability is followed from everything outside `components` through `$ref` chains
+        and discriminator mappings, visiting each node once. Security schemes, which are
+        referenced by name rather than `$ref`, are always kept. The spec is modified in place.
+
+        Returns:
+            A report of the removed components and the bytes saved.
+        """
+        from .prune import prune_components
+
+        document, report = prune_components(self._document())
+        if report.removed:
+            if "components" in document:
+                setattr(self, "components", document["components"])
+            else:
+                delattr(self, "components")
+                self.invalidate_index()
+        return report
 
     @field_validator("openapi")
     @classmethod
@@ -67,11 +234,39 @@ class OpenAPISpec(BaseModel):
             raise SpecInvalidError(f"Invalid OpenAPI specification: {str(e)}", details=data, cause=e)
 
     @classmethod
-    def from_json(cls, json_str: str) -> "OpenAPISpec":
+    def _from_cached(cls, data: Dict[str, Any]) -> "OpenAPISpec":
+        """Build a spec from a document validated before it was cached, without validating it again."""
+        if not isinstance(data.get("info"), dict):
+            # Not an entry `_from_parsed()` wrote
+            return cls.from_dict(data)
+        info = OpenAPIInfo.model_construct(**data["info"])
+        return cls.model_construct(**{**data, "info": info})
+
+    @classmethod
+    def _from_parsed(cls, data: Any, cache: Optional["ParsedSpecCache"], key: Optional[str]) -> "OpenAPISpec":
+        """Validate a parsed document, caching it under `key` once it is known to be a valid spec."""
+        spec = cls.from_dict(data)
+        if cache is not None and key is not None:
+            try:
+                cache.put(key, data)
+            except OSError as e:
+                # The spec was parsed; a cache that cannot be written only costs a future parse
+                logger.warning(f"Failed to cache parsed OpenAPI spec: {e}")
+        return spec
+
+    @classmethod
+    def from_json(
+        cls, json_str: Union[str, bytes, memoryview], cache: Optional["ParsedSpecCache"] = None
+    ) -> "OpenAPISpec":
         """Create an OpenAPISpec instance from a JSON string.
 
+        The JSON is parsed with the fastest backend available (see `tadata_sdk.json_backend`).
+        Passing UTF-8 bytes, e.g. straight from a file or HTTP response, saves decoding them first.
+
         Args:
-            json_str: A JSON string representing an OpenAPI specification.
+            json_str: A JSON string, or UTF-8 bytes or a buffer over them, representing an OpenAPI specification.
+            cache: Optional cache of parsed specs. A document parsed before is loaded from it instead.
+                It is only used with the json module backend; orjson and msgspec parse as fast.
 
         Returns:
             An OpenAPISpec instance.
@@ -79,18 +274,25 @@ class OpenAPISpec(BaseModel):
         Raises:
             SpecInvalidError: If the JSON string is not valid JSON or not a valid OpenAPI specification.
         """
-        try:
-            data = json.loads(json_str)
-            return cls.from_dict(data)
-        except json.JSONDecodeError as e:
-            raise SpecInvalidError(f"Invalid JSON: {str(e)}", details={"json_str": json_str[:100]}, cause=e)
+        key = None
+        cache = _json_cache(cache)
+        if cache is not None:
+            key = cache.content_key(json_str, "json")
+            cached = cache.get(key)
+            if cached is not None:
+                return cls._from_cached(cached)
+        return cls._from_parsed(_load_json(json_str), cache, key)
 
     @classmethod
-    def from_yaml(cls, yaml_str: str) -> "OpenAPISpec":
+    def from_yaml(cls, yaml_str: str, cache: Optional["ParsedSpecCache"] = None) -> "OpenAPISpec":
         """Create an OpenAPISpec instance from a YAML string.
 
+        The fast libyaml-based loader is used when PyYAML was built with it; `YAML_LOADER_NAME`
+        tells which loader is in use.
+
         Args:
             yaml_str: A YAML string representing an OpenAPI specification.
+            cache: Optional cache of parsed specs. A document parsed before is loaded from it instead.
 
         Returns:
             An OpenAPISpec instance.
@@ -98,20 +300,32 @@ class OpenAPISpec(BaseModel):
         Raises:
             SpecInvalidError: If the YAML string is not valid YAML or not a valid OpenAPI specification.
         """
-        try:
-            data = yaml.safe_load(yaml_str)
-            return cls.from_dict(data)
-        except yaml.YAMLError as e:
-            raise SpecInvalidError(f"Invalid YAML: {str(e)}", details={"yaml_str": yaml_str[:100]}, cause=e)
+        key = None
+        if cache is not None:
+            key = cache.content_key(yaml_str, "yaml")
+            cached = cache.get(key)
+            if cached is not None:
+                return cls._from_cached(cached)
+        return cls._from_parsed(_load_yaml(yaml_str, details={"yaml_str": yaml_str[:100]}), cache, key)
 
     @classmethod
-    def from_file(cls, file_path: Union[str, Path]) -> "OpenAPISpec":
+    def from_file(cls, file_path: Union[str, Path], cache: Optional["ParsedSpecCache"] = None) -> "OpenAPISpec":
         """Create an OpenAPISpec instance from a file.
 
-        The file can be either JSON or YAML, determined by the file extension.
+        The file can be either JSON or YAML, determined by the file extension. It is
+        memory-mapped rather than read into a str: YAML is read from the mapping in chunks, and
+        JSON is parsed straight from the mapped bytes when orjson or msgspec is installed, so
+        the file is never copied into a str or bytes object. This does not lower peak memory
+        or parse time measurably, as both are dominated by building the parsed document; see
+        `benchmarks/bench_from_file.py`.
+
+        With a `cache`, a file whose path, modification time and size match an earlier parse is
+        loaded from the cache without being read. JSON files only use the cache with the json
+        module backend, as orjson and msgspec parse them as fast as the cache loads them.
 
         Args:
             file_path: Path to a JSON or YAML file containing an OpenAPI specification.
+            cache: Optional cache of parsed specs.
 
         Returns:
             An OpenAPISpec instance.
@@ -125,21 +339,39 @@ class OpenAPISpec(BaseModel):
 
         try:
             file_path = file_path.resolve()
-            content = file_path.read_text(encoding="utf-8")
 
             # Determine parser to use based on file extension
-            if file_path.suffix.lower() in (".json",):
-                return cls.from_json(content)
-            elif file_path.suffix.lower() in (".yaml", ".yml"):
-                return cls.from_yaml(content)
-            else:
+            suffix = file_path.suffix.lower()
+            if suffix not in (".json", ".yaml", ".yml"):
                 raise SpecInvalidError(
                     f"Unsupported file extension: {file_path.suffix}. Only .json, .yaml, and .yml files are supported.",
                     details={"file_path": str(file_path)},
                 )
+
+            key = None
+            if suffix == ".json":
+                cache = _json_cache(cache)
+            if cache is not None:
+                key = cache.file_key(file_path)
+                cached = cache.get(key)
+                if cached is not None:
+                    return cls._from_cached(cached)
+
+            if suffix == ".json" and json_backend.BACKEND_NAME == "json":
+                # The json module only parses str, so mapping the file would just add a copy of it
+                data = _load_json(file_path.read_text(encoding="utf-8"))
+            else:
+                with _map_file(file_path) as mapped:
+                    if suffix == ".json":
+                        with memoryview(mapped) as view:
+                            data = _load_json(view)
+                    else:
+                        # PyYAML reads file-like objects in chunks, so the document is never decoded as a whole
+                        data = _load_yaml(mapped, details={"file_path": str(file_path)})
         except (OSError, IOError) as e:
             raise SpecInvalidError(
                 f"Failed to read file: {str(e)}",
                 details={"file_path": str(file_path)},
                 cause=e,
             )
+        return cls._from_parsed(data, cache, key)
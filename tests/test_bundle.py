@@ -0,0 +1,216 @@
+import json
+import threading
+import time
+
+import httpx
+import pytest
+import yaml
+
+from tadata_sdk import OpenAPISpec, TadataClient, bundle_spec
+from tadata_sdk.errors.exceptions import DeadlineExceededError, SpecInvalidError
+from tadata_sdk.http.deadline import Deadline
+from tadata_sdk.openapi.bundle import _iter_refs
+
+
+def _write(path, document) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document) if path.suffix == ".json" else yaml.safe_dump(document))
+
+
+def _root(paths: dict, **extra) -> dict:
+    return {"openapi": "3.0.0", "info": {"title": "Split API", "version": "1.0"}, "paths": paths, **extra}
+
+
+def test_external_files_are_bundled_into_components(tmp_path):
+    """Test that component refs are re-homed, whole schema files named after the file, and path items inlined."""
+    _write(
+        tmp_path / "common.yaml",
+        {
+            "components": {
+                "schemas": {
+                    "Pet": {"type": "object", "properties": {"owner": {"$ref": "schemas/Owner.json"}}},
+                    "Error": {"type": "object"},
+                },
+                "parameters": {"Limit": {"name": "limit", "in": "query", "schema": {"type": "integer"}}},
+            }
+        },
+    )
+    _write(tmp_path / "schemas" / "Owner.json", {"type": "object", "properties": {"pets": {"$ref": "../pets.yaml"}}})
+    _write(tmp_path / "pets.yaml", {"type": "array", "items": {"$ref": "common.yaml#/components/schemas/Pet"}})
+    _write(
+        tmp_path / "paths" / "pets.yaml",
+        {
+            "get": {
+                "parameters": [{"$ref": "../common.yaml#/components/parameters/Limit"}],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {"application/json": {"schema": {"$ref": "../pets.yaml"}}},
+                    },
+                    "default": {"$ref": "responses.yaml#/components/responses/Problem"},
+                },
+            }
+        },
+    )
+    problem = {"description": "Problem"}
+    _write(tmp_path / "paths" / "responses.yaml", {"components": {"responses": {"Problem": problem}}})
+    root = _root(
+        {"/pets": {"$ref": "paths/pets.yaml"}, "/errors": {"get": {"responses": {"500": {"description": "x"}}}}},
+        components={"schemas": {"Pet": {"type": "string"}}},
+    )
+    _write(tmp_path / "openapi.yaml", root)
+
+    spec = bundle_spec(root, tmp_path / "openapi.yaml")
+    bundled = spec.model_dump(by_alias=True, exclude_none=True)
+
+    operation = bundled["paths"]["/pets"]["get"]
+    assert operation["parameters"] == [{"$ref": "#/components/parameters/Limit"}]
+    ok_content = operation["responses"]["200"]["content"]
+    assert ok_content["application/json"]["schema"] == {"$ref": "#/components/schemas/pets"}
+    assert operation["responses"]["default"] == {"$ref": "#/components/responses/Problem"}
+
+    schemas = bundled["components"]["schemas"]
+    assert schemas["Pet"] == {"type": "string"}  # the root's own Pet is kept, the external one renamed
+    assert schemas["pets"] == {"type": "array", "items": {"$ref": "#/components/schemas/Pet_2"}}
+    assert schemas["Pet_2"]["properties"]["owner"] == {"$ref": "#/components/schemas/Owner"}
+    assert schemas["Owner"]["properties"]["pets"] == {"$ref": "#/components/schemas/pets"}  # cycle closed
+    assert "Error" not in schemas  # only what is referenced is copied
+    assert all(ref.startswith("#/") for ref in _iter_refs(bundled))
+
+
+def test_spec_without_external_refs_is_returned_unchanged(tmp_path):
+    """Test that a self-contained spec is not copied."""
+    spec = OpenAPISpec.from_dict(_root({"/a": {"$ref": "#/components/pathItems/A"}}))
+    assert bundle_spec(spec, tmp_path / "openapi.yaml") is spec
+
+
+def test_ref_loops_and_missing_targets_are_reported(tmp_path):
+    """Test that a chain of refs leading back to itself, and a pointer to nothing, raise SpecInvalidError."""
+    _write(tmp_path / "loop.yaml", {"A": {"$ref": "#/B"}, "B": {"$ref": "#/A"}, "C": {"type": "string"}})
+    with pytest.raises(SpecInvalidError, match="loop"):
+        bundle_spec(_root({"/a": {"$ref": "loop.yaml#/A"}}), tmp_path / "openapi.yaml")
+    with pytest.raises(SpecInvalidError, match="Cannot resolve"):
+        bundle_spec(_root({"/a": {"$ref": "loop.yaml#/D"}}), tmp_path / "openapi.yaml")
+    with pytest.raises(SpecInvalidError, match="Failed to read"):
+        bundle_spec(_root({"/a": {"$ref": "missing.yaml"}}), tmp_path / "openapi.yaml")
+
+
+def test_local_files_cannot_be_pulled_in_from_remote_or_outside_documents(tmp_path):
+    """Test that remote documents cannot ref local files, and local refs stay under the root's directory."""
+    secret = tmp_path / "secret.yaml"
+    _write(secret, {"components": {"schemas": {"Key": {"type": "string"}}}})
+    leak = {"/a": {"get": {"responses": {"200": {"$ref": f"{secret.as_uri()}#/components/schemas/Key"}}}}}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"components": {"schemas": {"Pet": {"$ref": secret.as_uri()}}}})
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(SpecInvalidError, match="local file"):
+            bundle_spec(_root(leak), "https://specs.example.com/openapi.json", http_client=client)
+        nested = {"/a": {"$ref": "https://specs.example.com/pets.json#/components/schemas/Pet"}}
+        with pytest.raises(SpecInvalidError, match="local file"):
+            bundle_spec(_root(nested), tmp_path / "openapi.yaml", http_client=client)
+
+    with pytest.raises(SpecInvalidError, match="outside the directory"):
+        bundle_spec(_root({"/a": {"$ref": "../secret.yaml"}}), tmp_path / "api" / "openapi.yaml")
+
+
+def test_remote_refs_are_fetched_concurrently_once():
+    """Test that documents referenced from a URL are fetched concurrently, each only once."""
+    lock = threading.Lock()
+    in_flight, peak, requested = [0], [0], []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            requested.append(request.url.path)
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        name = request.url.path.rsplit("/", 1)[-1].split(".")[0]
+        return httpx.Response(200, json={"components": {"schemas": {name: {"type": "object"}}}})
+
+    paths = {
+        f"/{name}": {
+            "get": {
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {"schema": {"$ref": f"schemas/{name}.json#/components/schemas/{name}"}}
+                        },
+                    },
+                    "400": {
+                        "description": "Bad",
+                        "content": {
+                            "application/json": {"schema": {"$ref": f"schemas/{name}.json#/components/schemas/{name}"}}
+                        },
+                    },
+                }
+            }
+        }
+        for name in ("a", "b", "c")
+    }
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        spec = bundle_spec(_root(paths), "https://specs.example.com/openapi.json", http_client=client)
+
+    assert sorted(requested) == ["/schemas/a.json", "/schemas/b.json", "/schemas/c.json"]
+    assert peak[0] > 1
+    assert set(spec.model_dump()["components"]["schemas"]) == {"a", "b", "c"}
+
+
+def test_remote_refs_are_fetched_within_the_deadline():
+    """Test that each fetch's timeout is capped to the deadline, and no fetch starts once it has passed."""
+    deadline = Deadline(0.2)
+    requested, read_timeouts = [], []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        read_timeouts.append(request.extensions["timeout"]["read"])
+        time.sleep(0.25)
+        return httpx.Response(200, json={"components": {"schemas": {"A": {"$ref": "b.json#/B"}}}})
+
+    schema = {"$ref": "a.json#/components/schemas/A"}
+    paths = {
+        "/a": {
+            "get": {"responses": {"200": {"description": "OK", "content": {"application/json": {"schema": schema}}}}}
+        }
+    }
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            bundle_spec(
+                _root(paths),
+                "https://specs.example.com/openapi.json",
+                http_client=client,
+                timeout=30,
+                deadline=deadline,
+            )
+
+    assert requested == ["/a.json"]
+    assert read_timeouts[0] <= 0.2
+    assert exc_info.value.phase == "bundling the spec"
+
+
+def test_deploy_bundles_refs_when_asked(tmp_path):
+    """Test that deploy(bundle_refs=True) uploads the bundled spec, and refuses spec_passthrough."""
+    _write(tmp_path / "schemas.yaml", {"components": {"schemas": {"Item": {"type": "object"}}}})
+    schema_ref = {"$ref": "schemas.yaml#/components/schemas/Item"}
+    response = {"description": "OK", "content": {"application/json": {"schema": schema_ref}}}
+    _write(tmp_path / "openapi.json", _root({"/items": {"get": {"responses": {"200": response}}}}))
+    uploads = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        uploads.append(json.loads(request.read()))
+        deployment = {"updated": True, "deployment": {"id": "bundled"}}
+        return httpx.Response(201, json={"ok": True, "status": 201, "data": deployment})
+
+    with TadataClient("key", transport=httpx.MockTransport(handler), compression="none") as client:
+        client.deploy(openapi_spec_path=str(tmp_path / "openapi.json"), bundle_refs=True)
+        with pytest.raises(ValueError):
+            client.deploy(openapi_spec_path=str(tmp_path / "openapi.json"), bundle_refs=True, spec_passthrough=True)
+
+    uploaded = uploads[0]["openApiSpec"]
+    assert uploaded["components"]["schemas"] == {"Item": {"type": "object"}}
+    content = uploaded["paths"]["/items"]["get"]["responses"]["200"]["content"]
+    assert content["application/json"]["schema"] == {"$ref": "#/components/schemas/Item"}
@@ -0,0 +1,116 @@
+import hashlib
+import json
+
+import yaml
+
+from tadata_sdk.core.ledger import DeploymentLedger
+from tadata_sdk.http.schemas import UpsertDeploymentRequest
+from tadata_sdk.openapi.canonical import canonical_hash, canonical_json, canonicalize
+from tadata_sdk.openapi.source import OpenAPISpec
+
+
+def _spec_dict(operations: int = 3) -> dict:
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Test API", "version": "1.0.0"},
+        "paths": {
+            f"/items{i}": {
+                "get": {
+                    "operationId": f"getItem{i}",
+                    "x-internal": True,
+                    "parameters": [{"name": "limit", "in": "query", "schema": {"type": "integer", "maximum": 100.0}}],
+                    "responses": {"200": {"description": "OK"}},
+                }
+            }
+            for i in range(operations)
+        },
+    }
+
+
+def _reversed(node):
+    """Return a copy of a node with the key order of every dict reversed."""
+    if isinstance(node, dict):
+        return {key: _reversed(value) for key, value in reversed(list(node.items()))}
+    if isinstance(node, list):
+        return [_reversed(item) for item in node]
+    return node
+
+
+def test_hash_ignores_key_order_and_number_spelling():
+    """Test that reordered keys and `1.0` vs `1` give the same hash, and content changes do not."""
+    document = _spec_dict()
+    respelled = _reversed(document)
+    respelled["paths"]["/items0"]["get"]["parameters"][0]["schema"]["maximum"] = 100
+
+    assert canonical_hash(respelled) == canonical_hash(document)
+    changed = _spec_dict()
+    changed["paths"]["/items0"]["get"]["parameters"][0]["schema"]["maximum"] = 101
+    assert canonical_hash(changed) != canonical_hash(document)
+
+
+def test_hash_is_the_same_for_json_and_yaml():
+    """Test that a spec loaded from YAML hashes like the same spec loaded from JSON."""
+    document = _spec_dict()
+    from_json = OpenAPISpec.from_json(json.dumps(document))
+    # Unquoted status codes are ints in YAML
+    from_yaml = OpenAPISpec.from_yaml(yaml.safe_dump(document).replace("'200':", "200:"))
+
+    assert from_yaml.canonical_hash() == from_json.canonical_hash()
+
+
+def test_hash_equals_sha256_of_canonical_json():
+    """Test that the streamed hash matches hashing the canonical JSON, also for large documents."""
+    for operations in (1, 200):
+        document = _spec_dict(operations)
+        canonical = canonical_json(document)
+
+        assert canonical_hash(document) == hashlib.sha256(canonical).hexdigest()
+        assert canonical == json.dumps(document, sort_keys=True, separators=(",", ":")).replace("100.0", "100").encode(
+            "utf-8"
+        )
+
+
+def test_strip_extensions_keeps_author_chosen_names_and_examples():
+    """Test that only vendor extensions are stripped, not names or data starting with `x-`."""
+    document = {
+        "openapi": "3.0.0",
+        "x-generator": "tool",
+        "paths": {
+            "/items": {
+                "get": {
+                    "x-internal": True,
+                    "responses": {"200": {"description": "OK", "headers": {"x-request-id": {"schema": {}}}}},
+                }
+            }
+        },
+        "components": {
+            "schemas": {
+                "Item": {
+                    "properties": {"x-total": {"type": "integer"}},
+                    "example": {"x-total": 1},
+                    "x-order": 1,
+                }
+            }
+        },
+    }
+
+    stripped = canonicalize(document, strip_extensions=True)
+
+    assert "x-generator" not in stripped
+    assert "x-internal" not in stripped["paths"]["/items"]["get"]
+    assert "x-request-id" in stripped["paths"]["/items"]["get"]["responses"]["200"]["headers"]
+    assert stripped["components"]["schemas"]["Item"] == {
+        "properties": {"x-total": {"type": "integer"}},
+        "example": {"x-total": 1},
+    }
+    assert canonical_hash(document, strip_extensions=True) != canonical_hash(document)
+
+
+def test_fingerprint_ignores_key_order():
+    """Test that the ledger and request fingerprints survive reordering the spec."""
+    first = UpsertDeploymentRequest(openApiSpec=OpenAPISpec.from_dict(_spec_dict()), name="svc", baseUrl=None)
+    second = UpsertDeploymentRequest(
+        openApiSpec=OpenAPISpec.from_dict(_reversed(_spec_dict())), name="svc", baseUrl=None
+    )
+
+    assert DeploymentLedger.fingerprint(first) == DeploymentLedger.fingerprint(second) == second.fingerprint()
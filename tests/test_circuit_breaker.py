@@ -0,0 +1,169 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from tadata_sdk import CircuitBreaker, RetryPolicy, deploy_many
+from tadata_sdk.errors.exceptions import ApiError, CircuitOpenError
+from tadata_sdk.http.circuit import circuit_breaker_snapshots
+from tadata_sdk.http.client import ApiClient, AsyncApiClient
+from tadata_sdk.http.schemas import UpsertDeploymentRequest
+from tadata_sdk.openapi.source import OpenAPISpec
+
+
+DEPLOYMENT_BODY = {"ok": True, "status": 201, "data": {"updated": True, "deployment": {"id": "circuit-id"}}}
+SPEC = {"openapi": "3.0.0", "info": {"title": "Test API", "version": "1.0.0"}, "paths": {}}
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Fixture patching the circuit breaker's clock."""
+    fake = FakeClock()
+    with patch("tadata_sdk.http.circuit.time.monotonic", fake):
+        yield fake
+
+
+def _request() -> UpsertDeploymentRequest:
+    return UpsertDeploymentRequest(openApiSpec=OpenAPISpec.from_dict(SPEC), name="svc", baseUrl=None)
+
+
+def test_opens_after_consecutive_failures_and_recovers(clock):
+    """Test the closed, open, half-open cycle."""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+    for _ in range(3):
+        breaker.before_request()
+        breaker.record_failure()
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_request()
+    assert exc_info.value.retry_in == 10
+
+    clock.now += 10
+    assert breaker.state == "half_open"
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()  # only one probe at a time
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now += 10
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.snapshot()["times_opened"] == 2
+    assert breaker.snapshot()["rejected_calls"] == 2
+
+
+def test_opens_on_failure_rate(clock):
+    """Test that a high failure rate opens the circuit even without a long failure streak."""
+    breaker = CircuitBreaker(failure_threshold=100, failure_rate_threshold=0.5, window_size=10, minimum_calls=6)
+    for _ in range(2):
+        breaker.record_failure()
+        breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"  # not enough calls yet
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.snapshot()["failure_rate"] == pytest.approx(4 / 6)
+
+
+def test_shared_per_base_url():
+    """Test that clients of the same base URL share one breaker, reported in the snapshots."""
+    first = ApiClient(api_key="key", base_url="https://circuit.example.com/", circuit_breaker=True)
+    second = ApiClient(api_key="key", base_url="https://circuit.example.com", circuit_breaker=True)
+    other = ApiClient(api_key="key", base_url="https://other.example.com", circuit_breaker=True)
+
+    assert first.circuit_breaker is second.circuit_breaker
+    assert first.circuit_breaker is not other.circuit_breaker
+    assert ApiClient(api_key="key").circuit_breaker is None
+    assert circuit_breaker_snapshots()["https://circuit.example.com"]["state"] == "closed"
+
+
+def test_client_fails_fast_while_open(clock):
+    """Test that server errors open the circuit and later requests are not sent."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(503)
+
+    breaker = CircuitBreaker(failure_threshold=2)
+    client = ApiClient(
+        api_key="key",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        retry=RetryPolicy(max_attempts=5, backoff_base=0),
+        circuit_breaker=breaker,
+    )
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        client.deploy_from_openapi(_request())
+    assert len(seen) == 2
+    assert exc_info.value.stats is not None
+    assert exc_info.value.stats.attempts == 2
+
+    with pytest.raises(CircuitOpenError):
+        client.deploy_from_openapi(_request())
+    assert len(seen) == 2
+
+
+def test_client_errors_do_not_open_the_circuit():
+    """Test that 4xx responses count as the API being up."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = ApiClient(
+        api_key="key",
+        http_client=httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(400))),
+        circuit_breaker=breaker,
+    )
+
+    with pytest.raises(ApiError):
+        client.deploy_from_openapi(_request())
+    assert breaker.state == "closed"
+
+
+async def test_async_probe_closes_circuit(clock):
+    """Test that a successful half-open probe through the async client closes the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5)
+    breaker.record_failure()
+    clock.now += 5
+
+    async with AsyncApiClient(
+        api_key="key",
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(201, json=DEPLOYMENT_BODY))
+        ),
+        circuit_breaker=breaker,
+    ) as client:
+        response = await client.deploy_from_openapi(_request())
+
+    assert response.data is not None
+    assert breaker.state == "closed"
+
+
+def test_deploy_many_items_fail_fast(clock):
+    """Test that once the circuit opens, the remaining batch items fail without being sent."""
+    breaker = CircuitBreaker(failure_threshold=2)
+
+    with patch("tadata_sdk.core.bulk.ApiClient._send", return_value=httpx.Response(500)) as mock_send:
+        summary = deploy_many(
+            [SPEC] * 5,
+            api_key="key",
+            concurrency=1,
+            retry=RetryPolicy(max_attempts=1),
+            circuit_breaker=breaker,
+        )
+
+    assert mock_send.call_count == 2
+    assert [type(result.error) for result in summary.failed[2:]] == [CircuitOpenError] * 3
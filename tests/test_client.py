@@ -0,0 +1,71 @@
+import httpx
+import pytest
+
+from tadata_sdk import TadataClient
+from tadata_sdk.core import sdk
+from tadata_sdk.errors.exceptions import AuthError
+
+
+@pytest.fixture
+def valid_openapi_dict():
+    """Fixture with a valid OpenAPI spec as a dictionary."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Test API", "version": "1.0.0"},
+        "paths": {"/test": {"get": {"responses": {"200": {"description": "OK"}}}}},
+    }
+
+
+def _deployment_handler(requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.params.get("apiKey") != "test-api-key":
+            return httpx.Response(401, json={"error": {"message": "bad key"}})
+        return httpx.Response(
+            201,
+            json={"ok": True, "status": 201, "data": {"updated": True, "deployment": {"id": f"id-{len(requests)}"}}},
+        )
+
+    return handler
+
+
+def test_tadata_client_reuses_connection_pool(valid_openapi_dict):
+    """Test that repeated deploys go through the same pooled httpx.Client."""
+    requests = []
+    with TadataClient(api_key="test-api-key", transport=httpx.MockTransport(_deployment_handler(requests))) as client:
+        first = client.deploy(openapi_spec=valid_openapi_dict, name="first")
+        second = client.deploy(openapi_spec=valid_openapi_dict, name="second")
+        http_client = client.http_client
+
+    assert (first.id, second.id) == ("id-1", "id-2")
+    assert [request.headers["x-api-version"] for request in requests] == ["latest", "latest"]
+    assert http_client.is_closed
+
+
+def test_tadata_client_pool_configuration():
+    """Test that pool limits and keepalive expiry are applied."""
+    limits = httpx.Limits(max_connections=4, max_keepalive_connections=2)
+    with TadataClient(api_key="test-api-key", limits=limits, keepalive_expiry=30.0) as client:
+        pool = client.http_client._transport._pool  # type: ignore[attr-defined]
+        assert pool._max_connections == 4
+        assert pool._max_keepalive_connections == 2
+        assert pool._keepalive_expiry == 30.0
+
+
+def test_tadata_client_error_mapping(valid_openapi_dict):
+    """Test that API errors surface as SDK exceptions."""
+    handler = _deployment_handler([])
+    with TadataClient(api_key="wrong-key", transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(AuthError):
+            client.deploy(openapi_spec=valid_openapi_dict)
+
+
+def test_shared_http_client_is_reused():
+    """Test that the module-level deploy() keeps one lazily created client."""
+    first = sdk._get_shared_http_client()
+    assert sdk._get_shared_http_client() is first
+
+    first.close()
+    replacement = sdk._get_shared_http_client()
+    assert replacement is not first
+    assert not replacement.is_closed
@@ -0,0 +1,115 @@
+import gzip
+import json
+
+import httpx
+import pytest
+
+from tadata_sdk import RetryPolicy
+from tadata_sdk.errors.exceptions import ApiError
+from tadata_sdk.http.client import ApiClient
+from tadata_sdk.http.compression import MIN_COMPRESSION_SIZE, compress_body, compression_level, resolve_encoding
+from tadata_sdk.http.schemas import UpsertDeploymentRequest
+from tadata_sdk.openapi.source import OpenAPISpec
+
+
+DEPLOYMENT_BODY = {"ok": True, "status": 201, "data": {"updated": True, "deployment": {"id": "compressed-id"}}}
+
+
+def _large_request(operations: int = 500) -> UpsertDeploymentRequest:
+    paths = {
+        f"/resource-{i}": {"get": {"summary": f"Get resource {i}", "responses": {"200": {"description": "OK"}}}}
+        for i in range(operations)
+    }
+    spec = OpenAPISpec.from_dict({"openapi": "3.0.0", "info": {"title": "Big API", "version": "1.0.0"}, "paths": paths})
+    return UpsertDeploymentRequest(openApiSpec=spec, name=None, baseUrl=None)
+
+
+def _client(handler, **kwargs) -> ApiClient:
+    return ApiClient(api_key="test-api-key", http_client=httpx.Client(transport=httpx.MockTransport(handler)), **kwargs)
+
+
+def test_compress_body_skips_small_bodies():
+    """Test that small bodies are sent uncompressed."""
+    body = b"{}" * 10
+    assert compress_body(body, "gzip") == (body, None)
+    assert compress_body(b"x" * MIN_COMPRESSION_SIZE, None) == (b"x" * MIN_COMPRESSION_SIZE, None)
+
+
+def test_compression_level_depends_on_size():
+    """Test that larger bodies get cheaper compression levels."""
+    assert compression_level("gzip", 100_000) > compression_level("gzip", 50_000_000)
+
+
+def test_resolve_encoding():
+    """Test resolving compression settings."""
+    assert resolve_encoding("auto") == "gzip"
+    assert resolve_encoding("none") is None
+    with pytest.raises(ValueError):
+        resolve_encoding("deflate")  # type: ignore[arg-type]
+
+
+def test_large_request_is_gzipped():
+    """Test that large deployment bodies are gzip-compressed with a Content-Encoding header."""
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["encoding"] = request.headers.get("content-encoding")
+        seen["size"] = len(request.content)
+        seen["body"] = json.loads(gzip.decompress(request.content))
+        return httpx.Response(201, json=DEPLOYMENT_BODY)
+
+    request = _large_request()
+    response = _client(handler, compression="auto").deploy_from_openapi(request)
+
+    assert response.data is not None
+    assert seen["encoding"] == "gzip"
+    assert seen["body"] == request.model_dump(by_alias=True, exclude_none=True)
+    assert seen["size"] < len(request.model_dump_json(by_alias=True, exclude_none=True)) / 4
+
+
+def test_compression_is_off_by_default():
+    """Test that bodies are sent uncompressed unless compression is asked for."""
+    encodings = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        encodings.append(request.headers.get("content-encoding"))
+        return httpx.Response(201, json=DEPLOYMENT_BODY)
+
+    _client(handler).deploy_from_openapi(_large_request())
+    _client(handler, compression="none").deploy_from_openapi(_large_request())
+    assert encodings == [None, None]
+
+
+def test_falls_back_when_server_rejects_encoding():
+    """Test that a rejected compressed body is resent uncompressed, and compression stays off."""
+    encodings = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        encoding = request.headers.get("content-encoding")
+        encodings.append(encoding)
+        if encoding is not None:
+            return httpx.Response(415, json={"error": {"code": "INVALID_CONTENT_TYPE", "message": "no gzip"}})
+        json.loads(request.content)
+        return httpx.Response(201, json=DEPLOYMENT_BODY)
+
+    client = _client(handler, compression="gzip")
+    client.deploy_from_openapi(_large_request())
+    client.deploy_from_openapi(_large_request())
+
+    assert encodings == ["gzip", None, None]
+
+
+def test_bad_request_is_not_resent_uncompressed():
+    """Test that a 400 for a compressed body is reported as is, without a second upload."""
+    encodings = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        encodings.append(request.headers.get("content-encoding"))
+        return httpx.Response(400, json={"error": {"code": "JSON_PARSE_ERROR", "message": "bad body"}})
+
+    client = _client(handler, compression="gzip", retry=RetryPolicy(max_attempts=1))
+    with pytest.raises(ApiError):
+        client.deploy_from_openapi(_large_request())
+
+    assert encodings == ["gzip"]
+    assert client._content_encoding == "gzip"
@@ -0,0 +1,136 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from tadata_sdk import RetryPolicy, deploy
+from tadata_sdk.errors.exceptions import ApiError, DeadlineExceededError
+from tadata_sdk.http.client import UPLOAD_PHASE, ApiClient
+from tadata_sdk.http.deadline import Deadline
+from tadata_sdk.http.schemas import UpsertDeploymentRequest
+from tadata_sdk.openapi.source import OpenAPISpec
+
+
+DEPLOYMENT_BODY = {"ok": True, "status": 201, "data": {"updated": True, "deployment": {"id": "deadline-id"}}}
+SPEC = {"openapi": "3.0.0", "info": {"title": "Test API", "version": "1.0.0"}, "paths": {}}
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Fixture patching the deadline clock."""
+    fake = FakeClock()
+    with patch("tadata_sdk.http.deadline.time.monotonic", fake):
+        yield fake
+
+
+def _request() -> UpsertDeploymentRequest:
+    return UpsertDeploymentRequest(openApiSpec=OpenAPISpec.from_dict(SPEC), name="svc", baseUrl=None)
+
+
+def _client(handler, **kwargs) -> ApiClient:
+    return ApiClient(api_key="key", http_client=httpx.Client(transport=httpx.MockTransport(handler)), **kwargs)
+
+
+def test_timeouts_are_shortened_to_the_time_left(clock):
+    """Test that each part of a timeout is capped by the remaining budget."""
+    deadline = Deadline(10)
+    clock.now += 4
+
+    timeout = deadline.timeout(httpx.Timeout(30, connect=2, pool=None), "testing")
+    assert timeout.connect == 2
+    assert timeout.read == timeout.write == timeout.pool == 6
+
+    clock.now += 6
+    assert deadline.expired
+    with pytest.raises(DeadlineExceededError) as exc_info:
+        deadline.timeout(5, "testing")
+    assert exc_info.value.phase == "testing"
+
+
+def test_requests_get_the_remaining_budget(clock):
+    """Test that the API client sends each attempt with a timeout ending at the deadline."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(201, json=DEPLOYMENT_BODY)
+
+    client = _client(handler, timeout=httpx.Timeout(30, connect=1))
+    client.deploy_from_openapi(_request(), deadline=Deadline(8))
+    client.deploy_from_openapi(_request())
+
+    assert seen[0] == {"connect": 1, "read": 8, "write": 8, "pool": 8}
+    assert seen[1] == {"connect": 1, "read": 30, "write": 30, "pool": 30}
+
+
+def test_no_retry_past_the_deadline(clock):
+    """Test that a retry that could not start before the deadline is not waited for."""
+    handler_calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        handler_calls.append(request)
+        return httpx.Response(503, headers={"Retry-After": "5"})
+
+    with pytest.raises(ApiError):
+        _client(handler, retry=RetryPolicy()).deploy_from_openapi(_request(), deadline=Deadline(3))
+    assert len(handler_calls) == 1
+
+
+def test_timeout_at_the_deadline_raises_deadline_error(clock):
+    """Test that a request cut off by the deadline is reported as such, with its attempts."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        clock.now += 5
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    with pytest.raises(DeadlineExceededError) as exc_info:
+        _client(handler, retry=RetryPolicy(backoff_base=0)).deploy_from_openapi(_request(), deadline=Deadline(5))
+
+    assert exc_info.value.phase == UPLOAD_PHASE
+    assert isinstance(exc_info.value.cause, httpx.ReadTimeout)
+    assert exc_info.value.stats is not None
+    assert exc_info.value.stats.attempts == 1
+
+
+@pytest.mark.parametrize(
+    "spec_times_out, expected_phase",
+    [(True, "downloading the spec"), (False, "uploading the deployment")],
+)
+def test_deploy_deadline_covers_spec_download(clock, spec_times_out, expected_phase):
+    """Test that the spec download and the upload share the deploy deadline."""
+    uploads = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "specs.example.com":
+            clock.now += 4
+            if spec_times_out:
+                clock.now += 6
+                raise httpx.ReadTimeout("timed out", request=request)
+            return httpx.Response(200, json=SPEC)
+        uploads.append(request.extensions["timeout"])
+        clock.now += 2
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    with patch("tadata_sdk.core.sdk._get_shared_http_client", return_value=http_client):
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            deploy(
+                openapi_spec_url="https://specs.example.com/openapi.json",
+                api_key="key",
+                deadline=6,
+                retry=RetryPolicy(backoff_base=0),
+            )
+
+    assert exc_info.value.phase == expected_phase
+    if not spec_times_out:
+        assert uploads == [{"connect": 2, "read": 2, "write": 2, "pool": 2}]
@@ -0,0 +1,172 @@
+import json
+import threading
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from tadata_sdk import DeploymentLedger, deploy_async
+from tadata_sdk.errors.exceptions import ApiError, AuthError, NetworkError
+from tadata_sdk.http.client import AsyncApiClient
+from tadata_sdk.http.retry import RetryPolicy
+from tadata_sdk.http.schemas import DeploymentResponse, UpsertDeploymentRequest, UpsertDeploymentResponseData
+from tadata_sdk.openapi.source import OpenAPISpec
+
+
+@pytest.fixture
+def valid_openapi_dict():
+    """Fixture with a valid OpenAPI spec as a dictionary."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Test API", "version": "1.0.0"},
+        "paths": {"/test": {"get": {"responses": {"200": {"description": "OK"}}}}},
+    }
+
+
+@pytest.fixture
+def deployment_payload():
+    """Fixture with a successful deployment response body."""
+    return {
+        "ok": True,
+        "status": 201,
+        "data": {
+            "updated": True,
+            "deployment": {"id": "async-deployment-id", "createdAt": "2023-01-01T00:00:00Z"},
+        },
+    }
+
+
+@pytest.fixture
+def mock_async_api_client(deployment_payload):
+    """Fixture that returns a mock AsyncApiClient."""
+    with patch("tadata_sdk.core.sdk.AsyncApiClient") as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
+        mock_client.deploy_from_openapi.return_value = DeploymentResponse(
+            ok=True,
+            status=201,
+            data=UpsertDeploymentResponseData.model_validate(deployment_payload["data"]),
+        )
+        yield mock_client
+
+
+def _client_with_transport(handler, **kwargs) -> AsyncApiClient:
+    return AsyncApiClient(
+        api_key="test-api-key", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), **kwargs
+    )
+
+
+async def test_deploy_async_with_spec_dict(valid_openapi_dict, mock_async_api_client):
+    """Test deploying asynchronously with a spec dictionary."""
+    result = await deploy_async(openapi_spec=valid_openapi_dict, api_key="test-api-key", name="async")
+
+    mock_async_api_client.deploy_from_openapi.assert_awaited_once()
+    request = mock_async_api_client.deploy_from_openapi.await_args.args[0]
+    assert request.name == "async"
+    assert result.id == "async-deployment-id"
+    assert result.updated is True
+
+
+async def test_deploy_async_invalid_input():
+    """Test that deploy_async validates its spec sources like deploy."""
+    with pytest.raises(ValueError) as exc_info:
+        await deploy_async(api_key="test-api-key")
+    assert "must be provided" in str(exc_info.value)
+
+
+async def test_async_api_client_deploy(valid_openapi_dict, deployment_payload):
+    """Test that AsyncApiClient sends the request and parses the response."""
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["url"] = str(request.url)
+        seen["version"] = request.headers["x-api-version"]
+        return httpx.Response(201, json=deployment_payload)
+
+    request = UpsertDeploymentRequest(openApiSpec=OpenAPISpec.from_dict(valid_openapi_dict))
+    async with _client_with_transport(handler) as client:
+        response = await client.deploy_from_openapi(request)
+
+    assert response.data is not None
+    assert response.data.deployment.id == "async-deployment-id"
+    assert "apiKey=test-api-key" in seen["url"]
+    assert seen["version"] == "latest"
+
+
+@pytest.mark.parametrize(
+    "status_code,error_class",
+    [(401, AuthError), (403, AuthError), (400, ApiError), (500, ApiError)],
+)
+async def test_async_api_client_error_mapping(valid_openapi_dict, status_code, error_class):
+    """Test that AsyncApiClient maps error responses to the same exceptions as ApiClient."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code, json={"error": {"message": "boom"}})
+
+    request = UpsertDeploymentRequest(openApiSpec=OpenAPISpec.from_dict(valid_openapi_dict))
+    async with _client_with_transport(handler) as client:
+        with pytest.raises(error_class) as exc_info:
+            await client.deploy_from_openapi(request)
+    assert "boom" in str(exc_info.value)
+
+
+async def test_async_api_client_network_error(valid_openapi_dict):
+    """Test that transport failures are retried, then become NetworkError."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    request = UpsertDeploymentRequest(openApiSpec=OpenAPISpec.from_dict(valid_openapi_dict))
+    async with _client_with_transport(handler, retry=RetryPolicy(backoff_base=0)) as client:
+        with pytest.raises(NetworkError) as exc_info:
+            await client.deploy_from_openapi(request)
+    assert exc_info.value.stats is not None
+    assert exc_info.value.stats.attempts == 3
+
+
+async def test_hashing_and_encoding_run_off_the_event_loop(tmp_path, valid_openapi_dict, deployment_payload):
+    """Test that the ledger fingerprint and the request body are computed in worker threads."""
+    loop_thread = threading.get_ident()
+    threads = []
+    fingerprint = UpsertDeploymentRequest.fingerprint
+    encode_body = AsyncApiClient._encode_body
+
+    def record_fingerprint(self):
+        threads.append(threading.get_ident())
+        return fingerprint(self)
+
+    def record_encode_body(self, data, content):
+        threads.append(threading.get_ident())
+        return encode_body(self, data, content)
+
+    with patch("tadata_sdk.core.sdk.AsyncApiClient") as client_class:
+        client_class.return_value = _client_with_transport(lambda request: httpx.Response(201, json=deployment_payload))
+        with (
+            patch.object(UpsertDeploymentRequest, "fingerprint", record_fingerprint),
+            patch.object(AsyncApiClient, "_encode_body", record_encode_body),
+        ):
+            await deploy_async(
+                openapi_spec=valid_openapi_dict, api_key="test-api-key", ledger=DeploymentLedger(tmp_path)
+            )
+
+    assert len(threads) == 2
+    assert loop_thread not in threads
+
+
+async def test_local_spec_is_loaded_off_the_event_loop(tmp_path, valid_openapi_dict, mock_async_api_client):
+    """Test that reading and parsing a spec file happens in a worker thread."""
+    spec_path = tmp_path / "openapi.json"
+    spec_path.write_text(json.dumps(valid_openapi_dict))
+    loop_thread = threading.get_ident()
+    threads = []
+    from_file = OpenAPISpec.from_file
+
+    def record_from_file(*args, **kwargs):
+        threads.append(threading.get_ident())
+        return from_file(*args, **kwargs)
+
+    with patch.object(OpenAPISpec, "from_file", record_from_file):
+        await deploy_async(openapi_spec_path=str(spec_path), api_key="test-api-key")
+
+    assert threads and loop_thread not in threads
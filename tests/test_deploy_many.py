@@ -0,0 +1,140 @@
+import threading
+import time
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from tadata_sdk import DeploymentItem, SpecFetcher, deploy_many, deploy_many_async
+from tadata_sdk.errors.exceptions import ApiError
+from tadata_sdk.http.deadline import Deadline
+from tadata_sdk.http.retry import RequestStats
+from tadata_sdk.http.schemas import DeploymentResponse, UpsertDeploymentRequest, UpsertDeploymentResponseData
+
+
+def _spec(title: str) -> dict:
+    return {"openapi": "3.0.0", "info": {"title": title, "version": "1.0.0"}, "paths": {}}
+
+
+def _response(deployment_id: str) -> DeploymentResponse:
+    return DeploymentResponse(
+        ok=True,
+        status=201,
+        data=UpsertDeploymentResponseData.model_validate({"updated": True, "deployment": {"id": deployment_id}}),
+    )
+
+
+def _deploy_by_title(
+    request: UpsertDeploymentRequest, stats: Optional[RequestStats] = None, deadline: Optional[Deadline] = None
+) -> DeploymentResponse:
+    title = request.open_api_spec.info.title
+    if title == "bad":
+        raise ApiError("Invalid spec", 400)
+    return _response(f"id-{title}")
+
+
+@pytest.fixture
+def mock_api_client():
+    """Fixture that returns a mock ApiClient deploying specs by title."""
+    with patch("tadata_sdk.core.bulk.ApiClient") as mock_client_class:
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        mock_client.deploy_from_openapi.side_effect = _deploy_by_title
+        yield mock_client
+
+
+def test_deploy_many_collects_results_and_errors(mock_api_client):
+    """Test that a failing item does not abort the batch."""
+    items = [
+        _spec("a"),
+        DeploymentItem(openapi_spec=_spec("bad"), name="broken"),
+        DeploymentItem(openapi_spec=_spec("c"), name="third", base_url="https://c.example.com"),
+        {"openapi": "2.0", "info": {"title": "old", "version": "1"}, "paths": {}},
+    ]
+    streamed = []
+
+    summary = deploy_many(items, api_key="test-api-key", concurrency=2, on_result=streamed.append)
+
+    assert [r.index for r in summary.results] == [0, 1, 2, 3]
+    assert sorted(r.index for r in streamed) == [0, 1, 2, 3]
+    assert [r.result.id for r in summary.succeeded] == ["id-a", "id-c"]
+    assert [r.index for r in summary.failed] == [1, 3]
+    assert isinstance(summary.results[1].error, ApiError)
+    assert set(summary.timings) == {0, 1, 2, 3}
+    assert all(elapsed >= 0 for elapsed in summary.timings.values())
+
+    requests = [call.args[0] for call in mock_api_client.deploy_from_openapi.call_args_list]
+    third = next(r for r in requests if r.name == "third")
+    assert third.base_url == "https://c.example.com"
+
+
+def test_deploy_many_respects_concurrency(mock_api_client):
+    """Test that no more than `concurrency` deployments run at once."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def slow_deploy(request, stats=None, deadline=None):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return _deploy_by_title(request)
+
+    mock_api_client.deploy_from_openapi.side_effect = slow_deploy
+
+    summary = deploy_many([_spec(str(i)) for i in range(9)], api_key="test-api-key", concurrency=3)
+
+    assert len(summary.succeeded) == 9
+    assert peak <= 3
+
+
+def test_deploy_many_downloads_urls_through_spec_fetcher(mock_api_client):
+    """Test that URL items are downloaded through the given spec fetcher."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=_spec(request.url.host.split(".")[0]))
+
+    urls = ["https://a.example.com/openapi.json", "https://bad.example.com/openapi.json"]
+    with SpecFetcher(max_connections_per_host=1, transport=httpx.MockTransport(handler)) as fetcher:
+        summary = deploy_many(urls, api_key="test-api-key", spec_fetcher=fetcher)
+
+    assert [r.ok for r in summary.results] == [True, False]
+    assert summary.results[0].result.id == "id-a"
+
+
+def test_deploy_many_invalid_arguments():
+    """Test argument validation for deploy_many."""
+    with pytest.raises(ValueError):
+        deploy_many([_spec("a")], api_key="test-api-key", concurrency=0)
+    with pytest.raises(ValueError):
+        DeploymentItem()
+
+
+def test_deployment_item_from_source():
+    """Test that bare sources are mapped to the right DeploymentItem field."""
+    assert DeploymentItem.from_source("https://example.com/openapi.json").openapi_spec_url is not None
+    assert DeploymentItem.from_source("specs/openapi.yaml").openapi_spec_path == "specs/openapi.yaml"
+    assert DeploymentItem.from_source(_spec("a")).openapi_spec == _spec("a")
+
+
+async def test_deploy_many_async():
+    """Test the asynchronous bulk deployment."""
+    with patch("tadata_sdk.core.bulk.AsyncApiClient") as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
+        mock_client.deploy_from_openapi.side_effect = _deploy_by_title
+
+        streamed = []
+        summary = await deploy_many_async(
+            [_spec("a"), _spec("bad"), _spec("b")], api_key="test-api-key", concurrency=2, on_result=streamed.append
+        )
+
+    assert len(streamed) == 3
+    assert [r.ok for r in summary.results] == [True, False, True]
+    assert "failed=1" in str(summary)
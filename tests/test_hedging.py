@@ -0,0 +1,135 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from tadata_sdk import HedgingPolicy
+from tadata_sdk.http.client import ApiClient, AsyncApiClient
+from tadata_sdk.http.retry import RequestStats
+from tadata_sdk.http.schemas import UpsertDeploymentRequest
+from tadata_sdk.openapi.source import OpenAPISpec
+
+
+DEPLOYMENT_BODY = {"ok": True, "status": 201, "data": {"updated": True, "deployment": {"id": "hedged-id"}}}
+
+
+def _request() -> UpsertDeploymentRequest:
+    spec = OpenAPISpec.from_dict({"openapi": "3.0.0", "info": {"title": "Test API", "version": "1.0.0"}, "paths": {}})
+    return UpsertDeploymentRequest(openApiSpec=spec, name="svc", baseUrl=None)
+
+
+def _warmed_up(latency: float = 0.01, **settings) -> HedgingPolicy:
+    """Return a policy that has seen enough response times to hedge right away."""
+    policy = HedgingPolicy(min_samples=5, min_delay=0, max_hedge_ratio=1, **settings)
+    for _ in range(5):
+        policy.record_latency(latency)
+    return policy
+
+
+def test_delay_follows_percentile_of_recent_latencies():
+    """Test that no hedge is sent before enough samples, and the delay tracks the percentile."""
+    policy = HedgingPolicy(percentile=90, min_samples=10, min_delay=0.05)
+    assert policy.delay() is None
+
+    for latency in range(1, 11):
+        policy.record_latency(latency / 100)
+    assert policy.delay() == pytest.approx(0.09)
+
+    with pytest.raises(ValueError):
+        HedgingPolicy(percentile=100)
+
+
+def test_hedges_are_capped():
+    """Test that the hedge ratio and in-flight caps refuse extra hedges."""
+    policy = HedgingPolicy(max_hedge_ratio=0.5, max_in_flight=1)
+    policy.delay()
+    assert policy.acquire() is False  # half a token
+
+    policy.delay()
+    assert policy.acquire() is True
+    policy.delay()
+    policy.delay()
+    assert policy.acquire() is False  # one hedge already in flight
+
+    policy.release()
+    assert policy.acquire() is True
+    snapshot = policy.snapshot()
+    assert snapshot["requests"] == 4
+    assert snapshot["hedges"] == 2
+    assert snapshot["hedges_refused"] == 2
+
+
+def test_slow_request_is_hedged_and_hedge_wins():
+    """Test that a request stuck past the delay is sent again and the faster copy is used."""
+    release_first = threading.Event()
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers["Idempotency-Key"])
+        if len(calls) == 1:
+            release_first.wait(timeout=5)
+            return httpx.Response(201, json={**DEPLOYMENT_BODY, "status": 200})
+        return httpx.Response(201, json=DEPLOYMENT_BODY)
+
+    policy = _warmed_up()
+    client = ApiClient(api_key="key", http_client=httpx.Client(transport=httpx.MockTransport(handler)), hedging=policy)
+    stats = RequestStats()
+    try:
+        response = client.deploy_from_openapi(_request(), stats=stats)
+    finally:
+        release_first.set()
+        client.close()
+
+    assert response.status == 201
+    assert len(calls) == 2
+    assert calls[0] == calls[1]
+    assert stats.hedges == 1
+    assert policy.snapshot()["hedge_wins"] == 1
+
+
+def test_fast_requests_and_unkeyed_requests_are_not_hedged():
+    """Test that hedging only applies to slow requests carrying an idempotency key."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(201, json=DEPLOYMENT_BODY)
+
+    policy = _warmed_up(latency=5)
+    with ApiClient(
+        api_key="key", http_client=httpx.Client(transport=httpx.MockTransport(handler)), hedging=policy
+    ) as client:
+        client.deploy_from_openapi(_request())
+        client._request("GET", "/api/status")
+
+    assert len(calls) == 2
+    assert policy.snapshot()["hedges"] == 0
+
+
+async def test_async_hedge_cancels_the_slower_copy():
+    """Test that the async client uses the first answer and cancels the other request."""
+    cancelled = asyncio.Event()
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return httpx.Response(201, json=DEPLOYMENT_BODY)
+
+    policy = _warmed_up()
+    async with AsyncApiClient(
+        api_key="key", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), hedging=policy
+    ) as client:
+        response = await client.deploy_from_openapi(_request())
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    assert response.data is not None
+    assert len(calls) == 2
+    assert policy.snapshot()["hedge_wins"] == 1
+    assert policy.snapshot()["hedges_in_flight"] == 0
@@ -0,0 +1,121 @@
+import json
+import os
+from unittest.mock import patch
+
+import httpx
+
+from tadata_sdk import HTTPSpecCache, TadataClient
+from tadata_sdk.openapi import fetch
+from tadata_sdk.openapi.source import OpenAPISpec
+
+
+SPEC_URL = "https://specs.example.com/openapi.yaml"
+SPEC_YAML = "openapi: 3.0.0\ninfo:\n  title: Cached API\n  version: '1.0'\npaths: {}\n"
+DEPLOYMENT_BODY = {"ok": True, "status": 201, "data": {"updated": True, "deployment": {"id": "cached-id"}}}
+
+
+class SpecServer:
+    """Stand-in for a spec host that supports conditional requests, and for the Tadata API."""
+
+    def __init__(self, etag: bool = True) -> None:
+        self.etag = etag
+        self.spec_requests: list = []
+        self.uploads: list = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == "specs.example.com":
+            self.spec_requests.append(request)
+            if self.etag and request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            headers = {"Content-Type": "application/yaml"}
+            if self.etag:
+                headers.update({"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 00:00:00 GMT"})
+            return httpx.Response(200, text=SPEC_YAML, headers=headers)
+        self.uploads.append(json.loads(request.read()))
+        return httpx.Response(201, json=DEPLOYMENT_BODY)
+
+
+def _deploy_twice(server: SpecServer, cache: HTTPSpecCache) -> None:
+    with TadataClient("key", transport=httpx.MockTransport(server.handle), spec_cache=cache) as client:
+        client.deploy(openapi_spec_url=SPEC_URL)
+        client.deploy(openapi_spec_url=SPEC_URL)
+
+
+def test_unchanged_spec_is_revalidated_not_parsed(tmp_path):
+    """Test that a 304 answer reuses the cached spec without parsing the document again."""
+    server = SpecServer()
+    cache = HTTPSpecCache(tmp_path)
+
+    with patch.object(fetch, "_parse_chunks", wraps=fetch._parse_chunks) as parse:
+        _deploy_twice(server, cache)
+
+    assert parse.call_count == 1
+    assert "If-None-Match" not in server.spec_requests[0].headers
+    assert server.spec_requests[1].headers["If-None-Match"] == '"v1"'
+    assert server.spec_requests[1].headers["If-Modified-Since"] == "Wed, 01 Oct 2025 00:00:00 GMT"
+    assert server.uploads[0] == server.uploads[1]
+    assert server.uploads[1]["openApiSpec"]["info"]["title"] == "Cached API"
+
+
+def test_responses_without_validators_are_not_cached(tmp_path):
+    """Test that specs served without ETag or Last-Modified are always downloaded."""
+    server = SpecServer(etag=False)
+    _deploy_twice(server, HTTPSpecCache(tmp_path))
+
+    assert all("If-None-Match" not in request.headers for request in server.spec_requests)
+    assert list(tmp_path.glob("*.json")) == []
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """Test that the cache stays under max_size by removing the entries used longest ago."""
+    spec = OpenAPISpec.from_yaml(SPEC_YAML)
+    response = httpx.Response(200, headers={"ETag": '"v1"'})
+    cache = HTTPSpecCache(tmp_path)
+
+    for age, url in enumerate(["https://a.example.com", "https://b.example.com", "https://c.example.com"]):
+        cache.store(url, response, spec)
+        mtime = 1_000_000 - age * 1000
+        os.utime(cache._entry_path(url), (mtime, mtime))
+    entry_size = cache._entry_path("https://a.example.com").stat().st_size
+
+    entry = cache.lookup("https://c.example.com")
+    assert entry is not None
+    assert cache.revalidated(entry).info.title == "Cached API"  # now the most recently used
+
+    # Entries differ in size by a few bytes, e.g. in the digits of their timestamps
+    cache.max_size = entry_size * 2 + 32
+    cache.store("https://d.example.com", response, spec)
+
+    assert cache.lookup("https://a.example.com") is None
+    assert cache.lookup("https://b.example.com") is None
+    assert cache.lookup("https://c.example.com") is not None
+    assert cache.lookup("https://d.example.com") is not None
+
+
+def test_unwritable_cache_does_not_fail_deploy(tmp_path):
+    """Test that a cache directory that cannot be written to only logs a warning."""
+    blocked = tmp_path / "not-a-directory"
+    blocked.write_text("")
+    server = SpecServer()
+
+    _deploy_twice(server, HTTPSpecCache(blocked))
+
+    assert len(server.uploads) == 2
+    assert all("If-None-Match" not in request.headers for request in server.spec_requests)
+
+
+def test_revalidated_spec_is_not_validated_again_and_bad_entries_miss(tmp_path):
+    """Test that a 304 reuses the cached spec as is, and entries that are not cached specs are ignored."""
+    spec = OpenAPISpec.from_yaml(SPEC_YAML)
+    cache = HTTPSpecCache(tmp_path)
+    cache.store(SPEC_URL, httpx.Response(200, headers={"ETag": '"v1"'}), spec)
+
+    entry = cache.lookup(SPEC_URL)
+    assert entry is not None
+    with patch.object(OpenAPISpec, "model_validate") as validate:
+        assert cache.revalidated(entry) == spec
+    validate.assert_not_called()
+
+    for content in ("[1, 2]", json.dumps({"url": SPEC_URL, "spec": "not a spec"})):
+        cache._entry_path(SPEC_URL).write_text(content)
+        assert cache.lookup(SPEC_URL) is None
@@ -0,0 +1,100 @@
+import json
+from typing import Dict, List
+
+import httpx
+
+from tadata_sdk import RetryPolicy
+from tadata_sdk.http.client import IDEMPOTENCY_KEY_HEADER, ApiClient, AsyncApiClient
+from tadata_sdk.http.raw_request import RawUpsertDeploymentRequest
+from tadata_sdk.http.schemas import UpsertDeploymentRequest
+from tadata_sdk.openapi.source import OpenAPISpec
+
+
+class StandInServer:
+    """Stand-in for the deployments endpoint that deduplicates requests by idempotency key.
+
+    The first request for a key creates a deployment. When `drop_first_response` is set, the
+    response to that request is lost, as if the connection timed out after the server did the work.
+    """
+
+    def __init__(self, drop_first_response: bool = False) -> None:
+        self.drop_first_response = drop_first_response
+        self.deployments: List[dict] = []
+        self.keys: List[str] = []
+        self._responses: Dict[str, dict] = {}
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request, request.read())
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request, await request.aread())
+
+    def _respond(self, request: httpx.Request, body: bytes) -> httpx.Response:
+        key = request.headers[IDEMPOTENCY_KEY_HEADER]
+        self.keys.append(key)
+        if key not in self._responses:
+            self.deployments.append(json.loads(body))
+            deployment = {"id": f"deployment-{len(self.deployments)}"}
+            self._responses[key] = {"ok": True, "status": 201, "data": {"updated": True, "deployment": deployment}}
+            if self.drop_first_response and len(self.keys) == 1:
+                raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(201, json=self._responses[key])
+
+
+def _request(title: str = "Test API") -> UpsertDeploymentRequest:
+    spec = OpenAPISpec.from_dict({"openapi": "3.0.0", "info": {"title": title, "version": "1.0.0"}, "paths": {}})
+    return UpsertDeploymentRequest(openApiSpec=spec, name="svc", baseUrl=None)
+
+
+def _client(server: StandInServer) -> ApiClient:
+    return ApiClient(
+        api_key="test-api-key",
+        http_client=httpx.Client(transport=httpx.MockTransport(server.handle)),
+        retry=RetryPolicy(backoff_base=0),
+    )
+
+
+def test_retried_deploy_is_served_from_first_response():
+    """Test that a deploy retried after a lost response does not create a second deployment."""
+    server = StandInServer(drop_first_response=True)
+
+    response = _client(server).deploy_from_openapi(_request())
+
+    assert len(server.keys) == 2
+    assert server.keys[0] == server.keys[1]
+    assert len(server.deployments) == 1
+    assert response.data is not None
+    assert response.data.deployment.id == "deployment-1"
+
+
+def test_idempotency_key_is_new_for_each_call():
+    """Test that separate deploys of the same request get different keys, unless one is given."""
+    server = StandInServer()
+    client = _client(server)
+
+    client.deploy_from_openapi(_request())
+    client.deploy_from_openapi(_request())
+    client.deploy_from_openapi(_request(), idempotency_key="fixed-key")
+    client.deploy_from_openapi(_request(), idempotency_key="fixed-key")
+
+    assert server.keys[0] != server.keys[1]
+    assert server.keys[2] == server.keys[3] == "fixed-key"
+    assert len(server.deployments) == 3
+
+
+async def test_async_client_sends_same_key_for_raw_requests(tmp_path):
+    """Test that the retry of a streamed raw request reuses the key of its first attempt."""
+    spec_file = tmp_path / "openapi.json"
+    spec_file.write_text(json.dumps({"openapi": "3.0.0", "info": {"title": "Raw", "version": "1"}, "paths": {}}))
+    server = StandInServer(drop_first_response=True)
+    request = RawUpsertDeploymentRequest(spec_file, name="raw")
+
+    async with AsyncApiClient(
+        api_key="test-api-key",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handle_async)),
+        retry=RetryPolicy(backoff_base=0),
+    ) as client:
+        await client.deploy_from_openapi(request)
+
+    assert server.keys[0] == server.keys[1]
+    assert len(server.deployments) == 1
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+import pytest
+
+import tadata_sdk
+
+
+HEAVY_MODULES = ["httpx", "yaml", "pydantic", "importlib.metadata", "tadata_sdk.core"]
+
+
+def _imported_after(statement: str) -> list:
+    """Run a statement in a fresh interpreter and return which heavy modules it imported."""
+    code = f"import sys\n{statement}\nprint(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return output.stdout.split()
+
+
+def test_import_is_lazy():
+    """Test that importing the package does not import its dependencies."""
+    assert _imported_after("import tadata_sdk") == []
+
+
+def test_spec_models_do_not_import_http_stack():
+    """Test that working with specs and auth configs imports neither httpx nor PyYAML."""
+    statement = (
+        "from tadata_sdk import AuthConfig, OpenAPISpec\n"
+        "OpenAPISpec.from_dict({'openapi': '3.0.0', 'info': {'title': 'T', 'version': '1'}, 'paths': {}})"
+    )
+    imported = _imported_after(statement)
+    assert "httpx" not in imported
+    assert "yaml" not in imported
+
+
+def test_lazy_attributes():
+    """Test that lazily imported names resolve to the objects defined in their modules."""
+    from tadata_sdk.core.sdk import deploy
+
+    assert tadata_sdk.deploy is deploy
+    assert isinstance(tadata_sdk.__version__, str)
+    assert set(tadata_sdk.__all__) <= set(dir(tadata_sdk))
+
+    with pytest.raises(AttributeError):
+        tadata_sdk.does_not_exist  # noqa: B018
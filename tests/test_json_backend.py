@@ -0,0 +1,63 @@
+import httpx
+import pytest
+
+from tadata_sdk import json_backend
+from tadata_sdk.errors.exceptions import ApiError, SpecInvalidError
+from tadata_sdk.http.client import ApiClient
+from tadata_sdk.http.schemas import UpsertDeploymentRequest
+from tadata_sdk.openapi.source import OpenAPISpec
+
+
+SPEC_JSON = b'{"openapi":"3.0.0","info":{"title":"Caf\xc3\xa9 API","version":"1.0.0"},"paths":{}}'
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec", "json"])
+def test_backends_round_trip(backend):
+    """Test that every installed backend reads bytes, str and memoryviews and writes compact UTF-8."""
+    name, loads, dumps = json_backend._select_backend(backend)
+    if name != backend:
+        pytest.skip(f"{backend} is not installed")
+
+    expected = {"openapi": "3.0.0", "info": {"title": "Café API", "version": "1.0.0"}, "paths": {}}
+    assert loads(SPEC_JSON) == expected
+    assert loads(SPEC_JSON.decode("utf-8")) == expected
+    assert loads(memoryview(SPEC_JSON)) == expected
+    assert dumps(expected) == SPEC_JSON
+    assert dumps({200: "OK"}) == b'{"200":"OK"}'
+
+
+def test_select_backend_falls_back_to_json():
+    """Test that unknown backends fall back to an automatic choice."""
+    assert json_backend._select_backend("json")[0] == "json"
+    assert json_backend._select_backend("no-such-backend")[0] in ("orjson", "msgspec", "json")
+
+
+def test_loads_and_dumps_fall_back_to_stdlib():
+    """Test that values a fast backend refuses are handled by the json module."""
+    with pytest.raises(ValueError):
+        json_backend.loads(b"{not json")
+    # Tuples as keys are rejected by every backend
+    with pytest.raises(TypeError):
+        json_backend.dumps({(1, 2): "x"})
+
+
+def test_from_json_accepts_bytes():
+    """Test that OpenAPISpec.from_json parses UTF-8 bytes without decoding them first."""
+    spec = OpenAPISpec.from_json(SPEC_JSON)
+    assert spec.info.title == "Café API"
+
+    with pytest.raises(SpecInvalidError, match="Invalid JSON"):
+        OpenAPISpec.from_json(b"{not json")
+
+
+def test_invalid_response_body_is_reported_once_decoded():
+    """Test that a successful response with an unexpected body raises ApiError carrying the body."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"<html>oops</html>"))
+    client = ApiClient(api_key="test-api-key", http_client=httpx.Client(transport=transport))
+    request = UpsertDeploymentRequest(openApiSpec=OpenAPISpec.from_json(SPEC_JSON), name=None, baseUrl=None)
+
+    with pytest.raises(ApiError) as exc_info:
+        client.deploy_from_openapi(request)
+
+    assert exc_info.value.status_code == 200
+    assert exc_info.value.body == {"body": "<html>oops</html>"}
@@ -0,0 +1,139 @@
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from tadata_sdk import DeploymentLedger, TadataClient, deploy, deploy_async
+from tadata_sdk.http.schemas import DeploymentResponse, UpsertDeploymentRequest, UpsertDeploymentResponseData
+from tadata_sdk.openapi.source import OpenAPISpec
+
+
+@pytest.fixture
+def valid_openapi_dict():
+    """Fixture with a valid OpenAPI spec as a dictionary."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Test API", "version": "1.0.0"},
+        "paths": {"/test": {"get": {"responses": {"200": {"description": "OK"}}}}},
+    }
+
+
+@pytest.fixture
+def deployment_response():
+    """Fixture with a successful deployment response."""
+    return DeploymentResponse(
+        ok=True,
+        status=201,
+        data=UpsertDeploymentResponseData.model_validate(
+            {"updated": True, "deployment": {"id": "ledger-deployment-id", "openAPISpecHash": "abc"}}
+        ),
+    )
+
+
+@pytest.fixture
+def mock_api_client(deployment_response):
+    """Fixture that returns a mock ApiClient."""
+    with patch("tadata_sdk.core.sdk.ApiClient") as mock_client_class:
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        mock_client.deploy_from_openapi.return_value = deployment_response
+        yield mock_client
+
+
+def _request(spec_dict, **kwargs) -> UpsertDeploymentRequest:
+    return UpsertDeploymentRequest(openApiSpec=OpenAPISpec.from_dict(spec_dict), **kwargs)
+
+
+def test_fingerprint_tracks_request_changes(valid_openapi_dict):
+    """Test that the fingerprint changes with the spec and deployment settings."""
+    base = DeploymentLedger.fingerprint(_request(valid_openapi_dict, name="svc"))
+    assert DeploymentLedger.fingerprint(_request(valid_openapi_dict, name="svc")) == base
+    assert DeploymentLedger.fingerprint(_request(valid_openapi_dict, name="svc", baseUrl="https://x")) != base
+
+    valid_openapi_dict["info"]["version"] = "2.0.0"
+    assert DeploymentLedger.fingerprint(_request(valid_openapi_dict, name="svc")) != base
+
+
+def test_ledger_lookup_and_expiry(tmp_path, deployment_response):
+    """Test recording, matching and expiring ledger entries."""
+    ledger = DeploymentLedger(tmp_path, ttl=60)
+    ledger.record("key", "svc", "fp-1", deployment_response)
+
+    cached = ledger.lookup("key", "svc", "fp-1")
+    assert cached is not None
+    assert cached.data is not None
+    assert cached.data.deployment.open_api_spec_hash == "abc"
+    assert ledger.lookup("key", "svc", "fp-2") is None
+    assert ledger.lookup("other-key", "svc", "fp-1") is None
+    assert ledger.lookup("key", "other", "fp-1") is None
+
+    with patch("tadata_sdk.core.ledger.time.time", return_value=time.time() + 120):
+        assert ledger.lookup("key", "svc", "fp-1") is None
+
+    ledger.forget("key", "svc")
+    assert ledger.lookup("key", "svc", "fp-1") is None
+
+
+def test_ledger_ignores_corrupt_entries(tmp_path, deployment_response):
+    """Test that unreadable entries are treated as misses."""
+    ledger = DeploymentLedger(tmp_path)
+    ledger.record("key", "svc", "fp-1", deployment_response)
+    for content in ("{not json", '["fp-1"]', '{"fingerprint": "fp-1", "recorded_at": "yesterday"}'):
+        for path in tmp_path.glob("*.json"):
+            path.write_text(content)
+        assert ledger.lookup("key", "svc", "fp-1") is None
+    ledger.clear()
+    assert list(tmp_path.glob("*.json")) == []
+
+
+def test_deploy_skips_unchanged_spec(tmp_path, valid_openapi_dict, mock_api_client):
+    """Test that deploy() skips the upload when the ledger has a matching entry."""
+    ledger = DeploymentLedger(tmp_path)
+
+    first = deploy(openapi_spec=valid_openapi_dict, api_key="test-api-key", name="svc", ledger=ledger)
+    second = deploy(openapi_spec=valid_openapi_dict, api_key="test-api-key", name="svc", ledger=ledger)
+
+    assert mock_api_client.deploy_from_openapi.call_count == 1
+    assert first.skipped_locally is False
+    assert second.skipped_locally is True
+    assert second.id == first.id
+
+    deploy(openapi_spec=valid_openapi_dict, api_key="test-api-key", name="svc", ledger=ledger, force=True)
+    assert mock_api_client.deploy_from_openapi.call_count == 2
+
+    valid_openapi_dict["info"]["version"] = "2.0.0"
+    changed = deploy(openapi_spec=valid_openapi_dict, api_key="test-api-key", name="svc", ledger=ledger)
+    assert mock_api_client.deploy_from_openapi.call_count == 3
+    assert changed.skipped_locally is False
+
+
+async def test_request_is_hashed_once_per_deploy(tmp_path, valid_openapi_dict):
+    """Test that deploying with a ledger hashes the spec once, and deploying without one never does."""
+    deployment = {"updated": True, "deployment": {"id": "hashed-once"}}
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(201, json={"ok": True, "status": 201, "data": deployment})
+    )
+
+    with patch.object(UpsertDeploymentRequest, "fingerprint", autospec=True, return_value="fp") as fingerprint:
+        with TadataClient("key", transport=transport, ledger=DeploymentLedger(tmp_path)) as client:
+            client.deploy(openapi_spec=valid_openapi_dict, name="svc", force=True)
+        assert fingerprint.call_count == 1
+
+        with patch("tadata_sdk.core.sdk.AsyncApiClient") as async_client_class:
+            async_client = async_client_class.return_value.__aenter__.return_value
+            async_client.deploy_from_openapi = AsyncMock(
+                return_value=DeploymentResponse.model_validate({"ok": True, "status": 201, "data": deployment})
+            )
+            await deploy_async(
+                openapi_spec=valid_openapi_dict,
+                api_key="key",
+                name="svc",
+                ledger=DeploymentLedger(tmp_path),
+                force=True,
+            )
+        assert fingerprint.call_count == 2
+
+        with TadataClient("key", transport=transport) as client:
+            client.deploy(openapi_spec=valid_openapi_dict, name="svc")
+        assert fingerprint.call_count == 2
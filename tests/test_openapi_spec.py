@@ -1,9 +1,11 @@
 import json
 import tempfile
+from unittest.mock import patch
 
 import pytest
 import yaml
 
+from tadata_sdk import json_backend
 from tadata_sdk.errors.exceptions import SpecInvalidError
 from tadata_sdk.openapi.source import OpenAPISpec
 
@@ -104,3 +106,66 @@ def test_validate_openapi_version():
     with pytest.raises(ValueError) as exc_info:
         OpenAPISpec.validate_openapi_version("2.0.0")
     assert "Only OpenAPI 3.x specifications are supported" in str(exc_info.value)
+
+
+def test_from_yaml_uses_libyaml_when_available(valid_openapi_dict):
+    """Test that the C loader is picked when PyYAML was built with libyaml."""
+    from tadata_sdk.openapi import source
+
+    expected = "CSafeLoader" if getattr(yaml, "__with_libyaml__", False) else "SafeLoader"
+    assert source.YAML_LOADER_NAME == expected
+
+    with patch("yaml.load", wraps=yaml.load) as mock_load:
+        OpenAPISpec.from_yaml(yaml.dump(valid_openapi_dict))
+    assert mock_load.call_args.kwargs["Loader"].__name__ == expected
+
+
+def test_from_yaml_rejects_unsafe_tags():
+    """Test that the loader stays a safe loader."""
+    with pytest.raises(SpecInvalidError):
+        OpenAPISpec.from_yaml("!!python/object/apply:os.system ['echo unsafe']")
+
+
+@pytest.mark.parametrize("suffix", [".json", ".yaml", ".yml"])
+def test_from_file_maps_file_instead_of_reading_it(tmp_path, valid_openapi_dict, suffix):
+    """Test that from_file parses a memory-mapped file rather than a str copy of it."""
+    path = tmp_path / f"spec{suffix}"
+    if suffix == ".json" and json_backend.BACKEND_NAME == "json":
+        pytest.skip("the json module parses str, so JSON files are read as text")
+    path.write_text(json.dumps(valid_openapi_dict) if suffix == ".json" else yaml.dump(valid_openapi_dict))
+
+    with (
+        patch("pathlib.Path.read_text", side_effect=AssertionError("read_text")),
+        patch("pathlib.Path.read_bytes", side_effect=AssertionError("read_bytes")),
+    ):
+        spec = OpenAPISpec.from_file(path)
+    assert spec.info.title == "Test API"
+
+
+def test_from_file_yaml_with_pure_python_loader(tmp_path, valid_openapi_dict):
+    """Test that the pure-Python YAML loader also reads from the mapped file."""
+    path = tmp_path / "spec.yaml"
+    path.write_text(yaml.dump(valid_openapi_dict))
+
+    with patch("tadata_sdk.openapi.source._yaml_loader", return_value=yaml.SafeLoader):
+        spec = OpenAPISpec.from_file(path)
+    assert spec.info.title == "Test API"
+
+
+@pytest.mark.parametrize(
+    "name, content, message",
+    [
+        ("bad.json", '{"openapi": ', "Invalid JSON"),
+        ("bad.yaml", "paths: [", "Invalid YAML"),
+        ("empty.json", "", "Invalid JSON"),
+        ("empty.yml", "", "Invalid OpenAPI specification"),
+        ("spec.txt", "{}", "Unsupported file extension"),
+    ],
+)
+def test_from_file_errors(tmp_path, name, content, message):
+    """Test that unreadable files raise SpecInvalidError and release the file mapping."""
+    path = tmp_path / name
+    path.write_text(content)
+
+    with pytest.raises(SpecInvalidError, match=message):
+        OpenAPISpec.from_file(path)
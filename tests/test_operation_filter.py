@@ -0,0 +1,149 @@
+import json
+
+import httpx
+import pytest
+
+from tadata_sdk import OpenAPISpec, OperationFilter, TadataClient
+
+
+def _json_content(ref: str) -> dict:
+    return {"application/json": {"schema": {"$ref": ref}}}
+
+
+def _document() -> dict:
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Store", "version": "1.0"},
+        "paths": {
+            "/pets": {
+                "parameters": [{"$ref": "#/components/parameters/Trace"}],
+                "get": {
+                    "operationId": "listPets",
+                    "tags": ["pets"],
+                    "responses": {"200": {"description": "OK", "content": _json_content("#/components/schemas/Pets")}},
+                },
+                "post": {
+                    "operationId": "createPet",
+                    "tags": ["pets"],
+                    "requestBody": {"$ref": "#/components/requestBodies/NewPet"},
+                    "responses": {"201": {"description": "Created"}},
+                },
+            },
+            "/admin/users/{id}": {
+                "delete": {
+                    "operationId": "adminDeleteUser",
+                    "tags": ["admin"],
+                    "responses": {"404": {"$ref": "#/components/responses/NotFound"}},
+                }
+            },
+            "/orders": {"$ref": "#/components/pathItems/Orders"},
+        },
+        "components": {
+            "schemas": {
+                "Pets": {"type": "array", "items": {"$ref": "#/components/schemas/Pet"}},
+                "Pet": {
+                    "oneOf": [{"$ref": "#/components/schemas/Dog"}],
+                    "discriminator": {"propertyName": "kind", "mapping": {"cat": "Cat"}},
+                },
+                "Dog": {"type": "object"},
+                "Cat": {"type": "object"},
+                "NewPet": {"type": "object"},
+                "User": {"type": "object"},
+                "Order": {"type": "object"},
+            },
+            "requestBodies": {"NewPet": {"content": _json_content("#/components/schemas/NewPet")}},
+            "responses": {
+                "NotFound": {"description": "Missing", "content": _json_content("#/components/schemas/User")}
+            },
+            "parameters": {"Trace": {"name": "trace", "in": "header"}},
+            "pathItems": {
+                "Orders": {
+                    "get": {
+                        "operationId": "listOrders",
+                        "tags": ["orders"],
+                        "responses": {
+                            "200": {"description": "OK", "content": _json_content("#/components/schemas/Order")}
+                        },
+                    },
+                    "post": {"operationId": "createOrder", "tags": ["orders"], "responses": {}},
+                }
+            },
+            "securitySchemes": {"key": {"type": "apiKey", "name": "X-Key", "in": "header"}},
+        },
+    }
+
+
+def _operations(spec: OpenAPISpec) -> set:
+    return {(path, method) for path, item in spec.paths.items() for method in item if method != "parameters"}
+
+
+def test_include_and_exclude_criteria():
+    """Test that include criteria must all match, and any exclude criterion drops an operation."""
+    spec = OpenAPISpec.from_dict(_document())
+    assert _operations(spec.filter_operations(OperationFilter(tags=["pets", "admin"], methods=["GET", "delete"]))) == {
+        ("/pets", "get"),
+        ("/admin/users/{id}", "delete"),
+    }
+    excluded = OperationFilter(exclude_paths=["/admin/*"], exclude_methods=["post"])
+    assert _operations(spec.filter_operations(excluded)) == {("/pets", "get"), ("/orders", "get")}
+    assert _operations(spec.filter_operations(OperationFilter(operation_id="^list", exclude_tags="orders"))) == {
+        ("/pets", "get")
+    }
+    assert _operations(spec.filter_operations(OperationFilter(exclude_operation_id="Order$"))) == {
+        ("/pets", "get"),
+        ("/pets", "post"),
+        ("/admin/users/{id}", "delete"),
+        ("/orders", "get"),
+    }
+    assert _operations(spec.filter_operations(OperationFilter(paths="/pets"))) == {("/pets", "get"), ("/pets", "post")}
+
+
+def test_unreferenced_components_are_dropped():
+    """Test that components are kept only when something kept still reaches them."""
+    document = _document()
+    spec = OpenAPISpec.from_dict(document)
+    filtered = spec.filter_operations(OperationFilter(operation_id="^(listPets|listOrders)$")).model_dump()
+
+    assert filtered["paths"]["/pets"]["parameters"] == [{"$ref": "#/components/parameters/Trace"}]
+    assert set(filtered["paths"]["/pets"]) == {"parameters", "get"}
+    assert set(filtered["paths"]["/orders"]) == {"get"}  # the partly kept path item is inlined
+    components = filtered["components"]
+    # Pet reaches Dog through oneOf and Cat through its discriminator mapping
+    assert set(components["schemas"]) == {"Pets", "Pet", "Dog", "Cat", "Order"}
+    assert set(components) == {"schemas", "parameters", "securitySchemes"}
+
+    # The source spec is left as it was
+    assert spec.model_dump()["components"] == document["components"]
+    assert set(spec.paths["/pets"]) == {"parameters", "get", "post"}
+
+
+def test_filter_keeping_everything_shares_the_document():
+    """Test that paths and components are reused as they are when nothing is dropped."""
+    spec = OpenAPISpec.from_dict(_document())
+    filtered = spec.filter_operations(OperationFilter())
+    assert filtered.paths["/pets"] is spec.paths["/pets"]
+    assert filtered.model_extra is not None and spec.model_extra is not None
+    assert filtered.model_extra["components"] is spec.model_extra["components"]
+
+
+def test_deploy_uploads_only_filtered_operations(tmp_path):
+    """Test that deploy(operation_filter=...) uploads the filtered spec, and refuses spec_passthrough."""
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps(_document()))
+    uploads = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        uploads.append(json.loads(request.read()))
+        deployment = {"updated": True, "deployment": {"id": "filtered"}}
+        return httpx.Response(201, json={"ok": True, "status": 201, "data": deployment})
+
+    with TadataClient("key", transport=httpx.MockTransport(handler), compression="none") as client:
+        client.deploy(openapi_spec_path=str(path), operation_filter=OperationFilter(tags=["admin"]))
+        with pytest.raises(ValueError):
+            client.deploy(
+                openapi_spec_path=str(path), operation_filter=OperationFilter(tags=["admin"]), spec_passthrough=True
+            )
+
+    uploaded = uploads[0]["openApiSpec"]
+    assert list(uploaded["paths"]) == ["/admin/users/{id}"]
+    assert set(uploaded["components"]["schemas"]) == {"User"}
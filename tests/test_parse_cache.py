@@ -0,0 +1,120 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from tadata_sdk import ParsedSpecCache
+from tadata_sdk.errors.exceptions import SpecInvalidError
+from tadata_sdk.openapi import source
+from tadata_sdk.openapi.source import OpenAPISpec
+
+
+SPEC = {"openapi": "3.0.0", "info": {"title": "Cached API", "version": "1.0"}, "paths": {"/items": {}}}
+
+
+@pytest.fixture(autouse=True)
+def stdlib_json(monkeypatch):
+    """Report the json module as the JSON backend, the one JSON documents are cached with."""
+    monkeypatch.setattr(source.json_backend, "BACKEND_NAME", "json")
+
+
+def test_file_is_parsed_once_until_it_changes(tmp_path):
+    """Test that a cached file is not read again, and that changing it invalidates the entry."""
+    spec_file = tmp_path / "openapi.json"
+    spec_file.write_text(json.dumps(SPEC))
+    cache = ParsedSpecCache(tmp_path / "cache")
+
+    with patch.object(source, "_load_json", wraps=source._load_json) as parse:
+        first = OpenAPISpec.from_file(spec_file, cache=cache)
+        second = OpenAPISpec.from_file(str(spec_file), cache=cache)
+        assert parse.call_count == 1
+
+        spec_file.write_text(json.dumps({**SPEC, "info": {"title": "Changed API", "version": "2.0"}}))
+        os.utime(spec_file, ns=(0, spec_file.stat().st_mtime_ns + 1_000_000))
+        changed = OpenAPISpec.from_file(spec_file, cache=cache)
+        assert parse.call_count == 2
+
+    assert first == second
+    assert changed.info.title == "Changed API"
+
+
+def test_documents_are_keyed_by_content(tmp_path):
+    """Test that JSON and YAML documents hit the cache when their content matches."""
+    cache = ParsedSpecCache(tmp_path)
+    yaml_str = "openapi: 3.0.0\ninfo:\n  title: Cached API\n  version: '1.0'\npaths:\n  /items: {}\n"
+
+    OpenAPISpec.from_yaml(yaml_str, cache=cache)
+    OpenAPISpec.from_json(json.dumps(SPEC).encode(), cache=cache)
+    with (
+        patch.object(source, "_load_yaml") as parse_yaml,
+        patch.object(source, "_load_json") as parse_json,
+        patch.object(OpenAPISpec, "model_validate") as validate,
+    ):
+        assert OpenAPISpec.from_yaml(yaml_str, cache=cache).paths == {"/items": {}}
+        cached = OpenAPISpec.from_json(json.dumps(SPEC), cache=cache)
+
+    parse_yaml.assert_not_called()
+    parse_json.assert_not_called()
+    validate.assert_not_called()
+    assert cached == OpenAPISpec.from_dict(SPEC)
+    assert len(list(tmp_path.glob("*.marshal"))) == 2
+
+
+def test_invalid_and_unserializable_documents_are_not_cached(tmp_path):
+    """Test that only valid specs marshal can store are cached, and corrupt entries are ignored."""
+    cache = ParsedSpecCache(tmp_path)
+    with pytest.raises(SpecInvalidError):
+        OpenAPISpec.from_json(json.dumps({**SPEC, "openapi": "2.0"}), cache=cache)
+    OpenAPISpec.from_yaml(f"{json.dumps(SPEC)[:-1]}, 'released': 2025-01-01}}", cache=cache)
+    assert list(tmp_path.glob("*.marshal")) == []
+
+    key = cache.content_key(json.dumps(SPEC), "json")
+    (tmp_path / f"{key}.marshal").write_bytes(b"not marshal data")
+    assert cache.get(key) is None
+    assert OpenAPISpec.from_json(json.dumps(SPEC), cache=cache).info.title == "Cached API"
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """Test that the cache stays under max_size by removing the entries used longest ago."""
+    cache = ParsedSpecCache(tmp_path)
+    for age, key in enumerate(["a", "b", "c"]):
+        cache.put(key, SPEC)
+        mtime = 1_000_000 - age * 1000
+        os.utime(cache._entry_path(key), (mtime, mtime))
+    entry_size = cache._entry_path("a").stat().st_size
+
+    assert cache.get("c") == SPEC  # now the most recently used
+    cache.max_size = entry_size * 2
+    cache.put("d", SPEC)
+
+    assert [cache.get(key) is not None for key in "abcd"] == [False, False, True, True]
+    cache.clear()
+    assert cache.get("d") is None
+
+
+def test_unwritable_cache_does_not_fail_loading(tmp_path):
+    """Test that a cache directory that cannot be written to only logs a warning."""
+    blocked = tmp_path / "not-a-directory"
+    blocked.write_text("")
+    spec_file = tmp_path / "openapi.json"
+    spec_file.write_text(json.dumps(SPEC))
+    cache = ParsedSpecCache(blocked)
+
+    assert OpenAPISpec.from_file(spec_file, cache=cache).info.title == "Cached API"
+    assert OpenAPISpec.from_json(json.dumps(SPEC), cache=cache).info.title == "Cached API"
+
+
+def test_json_bypasses_cache_with_fast_backend(tmp_path, monkeypatch):
+    """Test that JSON is parsed directly when orjson or msgspec is the backend, and YAML still cached."""
+    monkeypatch.setattr(source.json_backend, "BACKEND_NAME", "orjson")
+    spec_file = tmp_path / "openapi.json"
+    spec_file.write_text(json.dumps(SPEC))
+    cache = ParsedSpecCache(tmp_path / "cache")
+
+    OpenAPISpec.from_file(spec_file, cache=cache)
+    OpenAPISpec.from_json(json.dumps(SPEC), cache=cache)
+    assert not (tmp_path / "cache").exists()
+
+    OpenAPISpec.from_yaml("openapi: 3.0.0\ninfo: {title: Cached API, version: '1.0'}\npaths: {}\n", cache=cache)
+    assert len(list((tmp_path / "cache").glob("*.marshal"))) == 1
@@ -0,0 +1,85 @@
+import json
+
+import httpx
+
+from tadata_sdk import OpenAPISpec, TadataClient
+
+
+def _document() -> dict:
+    schema = {"$ref": "#/components/schemas/Pet"}
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Pets", "version": "1.0"},
+        "paths": {
+            "/pets": {
+                "get": {
+                    "responses": {
+                        "200": {"description": "OK", "content": {"application/json": {"schema": schema}}},
+                        "default": {"$ref": "#/components/responses/Problem"},
+                    }
+                }
+            }
+        },
+        "components": {
+            "schemas": {
+                "Pet": {"type": "object", "properties": {"owner": {"$ref": "#/components/schemas/Owner"}}},
+                "Owner": {"type": "object", "properties": {"pets": {"type": "array", "items": schema}}},
+                "Problem": {"type": "object"},
+                "Unused": {"type": "object", "properties": {"pet": schema}},
+                "AlsoUnused": {"$ref": "#/components/schemas/Unused"},
+            },
+            "responses": {
+                "Problem": {
+                    "description": "Problem",
+                    "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Problem"}}},
+                }
+            },
+            "parameters": {"Unused": {"name": "q", "in": "query"}},
+            "securitySchemes": {"key": {"type": "apiKey", "name": "X-Key", "in": "header"}},
+        },
+    }
+
+
+def test_unreachable_components_are_removed():
+    """Test that only components reached from paths survive, even when unused ones reference used ones."""
+    spec = OpenAPISpec.from_dict(_document())
+    index = spec.index
+    report = spec.prune_unused_components()
+
+    components = spec.model_dump()["components"]
+    assert set(components["schemas"]) == {"Pet", "Owner", "Problem"}  # Pet and Owner reference each other
+    assert set(components) == {"schemas", "responses", "securitySchemes"}
+    assert report.removed == {"schemas": ["Unused", "AlsoUnused"], "parameters": ["Unused"]}
+    assert report.removed_count == 3
+    assert 0 < report.bytes_saved < len(json.dumps(_document()))
+    assert "3 unused components" in str(report)
+    assert spec.index is not index  # pruning invalidates the index
+
+    assert spec.prune_unused_components().removed == {}
+
+
+def test_components_removed_entirely_when_nothing_is_used():
+    """Test that `components` disappears when no component is referenced."""
+    document = _document()
+    document["paths"] = {"/health": {"get": {"responses": {"204": {"description": "OK"}}}}}
+    del document["components"]["securitySchemes"]
+    spec = OpenAPISpec.from_dict(document)
+    spec.prune_unused_components()
+    assert "components" not in spec.model_dump()
+
+
+def test_deploy_prunes_a_copy_of_the_spec():
+    """Test that deploy(prune_components=True) uploads the pruned spec and leaves the caller's spec as it was."""
+    spec = OpenAPISpec.from_dict(_document())
+    uploads = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        uploads.append(json.loads(request.read()))
+        deployment = {"updated": True, "deployment": {"id": "pruned"}}
+        return httpx.Response(201, json={"ok": True, "status": 201, "data": deployment})
+
+    with TadataClient("key", transport=httpx.MockTransport(handler), compression="none") as client:
+        client.deploy(openapi_spec=spec, prune_components=True)
+
+    assert set(uploads[0]["openApiSpec"]["components"]["schemas"]) == {"Pet", "Owner", "Problem"}
+    assert "Unused" in spec.model_dump()["components"]["schemas"]
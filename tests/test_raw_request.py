@@ -0,0 +1,159 @@
+import asyncio
+import codecs
+import gzip
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from tadata_sdk import deploy
+from tadata_sdk.errors.exceptions import SpecInvalidError
+from tadata_sdk.http.client import ApiClient, AsyncApiClient
+from tadata_sdk.http.raw_request import RawUpsertDeploymentRequest
+from tadata_sdk.http.schemas import AuthConfig, DeploymentResponse
+
+
+DEPLOYMENT_BODY = {"ok": True, "status": 201, "data": {"updated": True, "deployment": {"id": "raw-id"}}}
+
+
+@pytest.fixture
+def valid_openapi_dict():
+    """Fixture with a valid OpenAPI spec as a dictionary."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Test API", "version": "1.0.0"},
+        "paths": {f"/test-{i}": {"get": {"responses": {"200": {"description": "OK"}}}} for i in range(500)},
+    }
+
+
+@pytest.fixture
+def spec_file(tmp_path, valid_openapi_dict):
+    """Fixture writing the spec to a pretty-printed JSON file."""
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps(valid_openapi_dict, indent=2))
+    return path
+
+
+def test_raw_request_body(spec_file, valid_openapi_dict):
+    """Test that the streamed body wraps the file bytes in the request envelope."""
+    request = RawUpsertDeploymentRequest(spec_file, name="raw", auth_config=AuthConfig(passHeaders=["x-key"]))
+    body = b"".join(request)
+
+    assert len(body) == request.content_length
+    assert body == b"".join(request)
+    assert json.loads(body) == {
+        "openApiSpec": valid_openapi_dict,
+        "name": "raw",
+        "authConfig": AuthConfig(passHeaders=["x-key"]).model_dump(by_alias=True),
+    }
+
+
+def test_raw_request_skips_bom(tmp_path, valid_openapi_dict):
+    """Test that a UTF-8 byte order mark is not copied into the body."""
+    path = tmp_path / "bom.json"
+    path.write_bytes(codecs.BOM_UTF8 + json.dumps(valid_openapi_dict).encode())
+    request = RawUpsertDeploymentRequest(path)
+
+    assert json.loads(b"".join(request))["openApiSpec"] == valid_openapi_dict
+    assert len(b"".join(request)) == request.content_length
+
+
+def test_raw_request_rejects_unsupported_files(tmp_path):
+    """Test that only JSON object files are accepted."""
+    yaml_path = tmp_path / "openapi.yaml"
+    yaml_path.write_text("openapi: 3.0.0")
+    with pytest.raises(SpecInvalidError):
+        RawUpsertDeploymentRequest(yaml_path)
+
+    array_path = tmp_path / "array.json"
+    array_path.write_text("[1, 2]")
+    with pytest.raises(SpecInvalidError):
+        RawUpsertDeploymentRequest(array_path)
+
+    with pytest.raises(SpecInvalidError):
+        RawUpsertDeploymentRequest(tmp_path / "missing.json")
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip"])
+def test_api_client_streams_raw_request(spec_file, valid_openapi_dict, compression):
+    """Test that ApiClient uploads raw requests with a Content-Length, compressed or not."""
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["headers"] = request.headers
+        body = request.read()
+        seen["body"] = gzip.decompress(body) if request.headers.get("content-encoding") == "gzip" else body
+        return httpx.Response(201, json=DEPLOYMENT_BODY)
+
+    request = RawUpsertDeploymentRequest(spec_file)
+    client = ApiClient(
+        api_key="test-api-key",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        compression=compression,  # type: ignore[arg-type]
+    )
+    client.deploy_from_openapi(request)
+
+    assert "transfer-encoding" not in seen["headers"]
+    assert json.loads(seen["body"])["openApiSpec"] == valid_openapi_dict
+    if compression == "none":
+        assert int(seen["headers"]["content-length"]) == request.content_length
+    else:
+        assert seen["headers"]["content-encoding"] == "gzip"
+
+
+async def test_async_api_client_streams_raw_request(spec_file, valid_openapi_dict):
+    """Test that AsyncApiClient can upload raw requests."""
+    bodies = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(await request.aread())
+        return httpx.Response(201, json=DEPLOYMENT_BODY)
+
+    async with AsyncApiClient(
+        api_key="test-api-key",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        compression="none",
+    ) as client:
+        await client.deploy_from_openapi(RawUpsertDeploymentRequest(spec_file))
+
+    assert json.loads(bodies[0])["openApiSpec"] == valid_openapi_dict
+
+
+async def test_async_body_reads_file_in_worker_threads(spec_file, valid_openapi_dict):
+    """Test that the async body does not read the spec file on the event loop."""
+    request = RawUpsertDeploymentRequest(spec_file)
+    with patch("tadata_sdk.http.raw_request.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+        body = b"".join([chunk async for chunk in request.async_stream()])
+
+    assert json.loads(body)["openApiSpec"] == valid_openapi_dict
+    assert to_thread.call_count > 1
+
+
+async def test_changed_file_is_not_uploaded(spec_file):
+    """Test that a file whose size changed since the request was created raises instead of being sent."""
+    request = RawUpsertDeploymentRequest(spec_file)
+    spec_file.write_text(spec_file.read_text() + "\n")
+
+    with pytest.raises(SpecInvalidError, match="changed size"):
+        list(request)
+    with pytest.raises(SpecInvalidError, match="changed size"):
+        [chunk async for chunk in request.async_stream()]
+
+
+def test_deploy_with_spec_passthrough(spec_file):
+    """Test that deploy() skips parsing the spec in passthrough mode."""
+    with (
+        patch("tadata_sdk.core.sdk.ApiClient") as mock_client_class,
+        patch("tadata_sdk.core.sdk.OpenAPISpec.from_file") as mock_from_file,
+    ):
+        mock_client = mock_client_class.return_value
+        mock_client.deploy_from_openapi.return_value = DeploymentResponse.model_validate(DEPLOYMENT_BODY)
+        result = deploy(openapi_spec_path=str(spec_file), api_key="test-api-key", spec_passthrough=True)
+
+    mock_from_file.assert_not_called()
+    assert isinstance(mock_client.deploy_from_openapi.call_args.args[0], RawUpsertDeploymentRequest)
+    assert result.id == "raw-id"
+
+    with pytest.raises(ValueError):
+        deploy(openapi_spec={"openapi": "3.0.0"}, api_key="test-api-key", spec_passthrough=True)  # type: ignore[call-overload]
@@ -0,0 +1,42 @@
+import json
+import tracemalloc
+
+from tadata_sdk.http.schemas import AuthConfig, UpsertDeploymentRequest
+from tadata_sdk.openapi.source import OpenAPISpec
+
+
+def _large_request(operations: int = 3000) -> UpsertDeploymentRequest:
+    paths = {
+        f"/resource-{i}/{{id}}": {
+            "get": {
+                "operationId": f"getResource{i}",
+                "parameters": [{"name": "id", "in": "path", "required": True, "schema": {"type": "string"}}],
+                "responses": {"200": {"description": f"Resource {i}"}},
+            }
+        }
+        for i in range(operations)
+    }
+    spec = OpenAPISpec.from_dict({"openapi": "3.0.0", "info": {"title": "Big API", "version": "1.0.0"}, "paths": paths})
+    return UpsertDeploymentRequest(openApiSpec=spec, name="big", baseUrl=None, authConfig=AuthConfig())
+
+
+def test_to_json_bytes_matches_model_dump():
+    """Test that the direct serialization produces the same document as model_dump."""
+    request = _large_request(10)
+    assert json.loads(request.to_json_bytes()) == request.model_dump(by_alias=True, exclude_none=True)
+    assert b'"baseUrl"' not in request.to_json_bytes()
+    assert b'"openApiSpec"' in request.to_json_bytes()
+
+
+def test_to_json_bytes_peak_memory():
+    """Test that serializing a large request allocates little more than the output itself."""
+    request = _large_request()
+
+    tracemalloc.start()
+    try:
+        body = request.to_json_bytes()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 1.5 * len(body)
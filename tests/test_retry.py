@@ -0,0 +1,142 @@
+import email.utils
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from tadata_sdk import RetryPolicy, TadataClient
+from tadata_sdk.errors.exceptions import ApiError, AuthError
+from tadata_sdk.http.client import ApiClient
+from tadata_sdk.http.retry import RequestStats, RetryBudget, parse_retry_after
+from tadata_sdk.http.schemas import UpsertDeploymentRequest
+from tadata_sdk.openapi.source import OpenAPISpec
+
+
+DEPLOYMENT_BODY = {"ok": True, "status": 201, "data": {"updated": True, "deployment": {"id": "retried-id"}}}
+
+
+@pytest.fixture
+def request_body() -> UpsertDeploymentRequest:
+    """Fixture with a small deployment request."""
+    spec = OpenAPISpec.from_dict({"openapi": "3.0.0", "info": {"title": "Test API", "version": "1.0.0"}, "paths": {}})
+    return UpsertDeploymentRequest(openApiSpec=spec, name="svc", baseUrl=None)
+
+
+def _flaky_handler(responses):
+    """Return a handler that answers with the given responses in order, and the requests it saw."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        response = responses[len(seen) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return handler, seen
+
+
+def _client(handler, **kwargs) -> ApiClient:
+    return ApiClient(api_key="test-api-key", http_client=httpx.Client(transport=httpx.MockTransport(handler)), **kwargs)
+
+
+def test_next_delay_only_retries_transient_failures():
+    """Test which failures are retried, and that attempts are capped."""
+    policy = RetryPolicy(max_attempts=3, backoff_base=1, backoff_max=10)
+
+    assert policy.next_delay(1, response=httpx.Response(503)) is not None
+    assert policy.next_delay(1, error=httpx.ConnectError("refused")) is not None
+    assert policy.next_delay(1, response=httpx.Response(400)) is None
+    assert policy.next_delay(1, response=httpx.Response(500)) is None
+    assert policy.next_delay(3, response=httpx.Response(503)) is None
+    assert RetryPolicy(retry_network_errors=False).next_delay(1, error=httpx.ConnectError("refused")) is None
+
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_backoff_uses_full_jitter():
+    """Test that backoff delays are drawn between zero and the capped exponential bound."""
+    policy = RetryPolicy(backoff_base=1, backoff_max=5)
+    delays = [policy.backoff(attempt) for attempt in (1, 2, 3, 4, 5) for _ in range(50)]
+    assert all(0 <= delay <= 5 for delay in delays)
+    assert max(policy.backoff(1) for _ in range(50)) <= 1
+
+
+def test_retry_after_header():
+    """Test that Retry-After is honored in seconds or as an HTTP date, unless it is too long."""
+    policy = RetryPolicy(backoff_max=30)
+    assert policy.next_delay(1, response=httpx.Response(429, headers={"Retry-After": "7"})) == 7
+    assert policy.next_delay(1, response=httpx.Response(429, headers={"Retry-After": "120"})) is None
+
+    http_date = email.utils.formatdate(time.time() + 60, usegmt=True)
+    assert 55 < (parse_retry_after(http_date) or 0) <= 60
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_budget_stops_retry_storms():
+    """Test that the budget refuses retries once most attempts fail, and refills on success."""
+    budget = RetryBudget(max_tokens=4, token_ratio=1)
+    assert budget.record_failure() is True
+    assert budget.record_failure() is False
+
+    budget.record_success()
+    assert budget.tokens == 3
+
+    policy = RetryPolicy(budget=RetryBudget(max_tokens=2))
+    assert policy.next_delay(1, response=httpx.Response(503)) is None
+
+
+def test_api_client_retries_until_success(request_body):
+    """Test that transient failures are retried and reported on the response stats."""
+    handler, seen = _flaky_handler(
+        [
+            httpx.ConnectError("refused"),
+            httpx.Response(503, json={"error": {"message": "unavailable"}}, headers={"Retry-After": "2"}),
+            httpx.Response(201, json=DEPLOYMENT_BODY),
+        ]
+    )
+    client = _client(handler, retry=RetryPolicy(backoff_base=0.01))
+
+    stats = RequestStats()
+    with patch("tadata_sdk.http.client.time.sleep") as mock_sleep:
+        response = client.deploy_from_openapi(request_body, stats=stats)
+
+    assert response.data is not None
+    assert response.data.deployment.id == "retried-id"
+    assert len(seen) == 3
+    assert seen[0].content == seen[2].content
+    assert stats.attempts == 3
+    assert mock_sleep.call_args_list[1].args == (2.0,)
+    assert stats.retry_wait == pytest.approx(sum(call.args[0] for call in mock_sleep.call_args_list))
+
+
+def test_api_client_reports_attempts_on_errors(request_body):
+    """Test that exhausted retries raise with the attempts made, and auth errors are not retried."""
+    handler, seen = _flaky_handler([httpx.Response(502)] * 2)
+    with pytest.raises(ApiError) as exc_info:
+        _client(handler, retry=RetryPolicy(max_attempts=2, backoff_base=0)).deploy_from_openapi(request_body)
+    assert exc_info.value.stats is not None
+    assert exc_info.value.stats.attempts == 2
+
+    handler, seen = _flaky_handler([httpx.Response(401)])
+    with pytest.raises(AuthError) as auth_info:
+        _client(handler, retry=RetryPolicy(backoff_base=0)).deploy_from_openapi(request_body)
+    assert len(seen) == 1
+    assert auth_info.value.stats is not None
+    assert auth_info.value.stats.attempts == 1
+
+
+def test_tadata_client_result_carries_stats():
+    """Test that deploy results report the attempts made."""
+    handler, _ = _flaky_handler([httpx.Response(429), httpx.Response(201, json=DEPLOYMENT_BODY)])
+    spec = {"openapi": "3.0.0", "info": {"title": "Test API", "version": "1.0.0"}, "paths": {}}
+
+    retry = RetryPolicy(backoff_base=0)
+    with TadataClient("test-api-key", transport=httpx.MockTransport(handler), retry=retry) as client:
+        result = client.deploy(openapi_spec=spec)
+
+    assert result.id == "retried-id"
+    assert result.stats.attempts == 2
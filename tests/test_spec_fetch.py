@@ -0,0 +1,103 @@
+import json
+
+import httpx
+import pytest
+
+from tadata_sdk.errors.exceptions import SpecInvalidError
+from tadata_sdk.openapi.fetch import fetch_spec, fetch_spec_async, spec_format
+
+
+SPEC = {"openapi": "3.0.0", "info": {"title": "Streamed API", "version": "1.0"}, "paths": {"/items": {}}}
+SPEC_YAML = b"openapi: 3.0.0\ninfo:\n  title: Streamed API\n  version: '1.0'\npaths:\n  /items: {}\n"
+
+
+class ChunkedBody(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body delivered in small chunks, recording how many were read."""
+
+    def __init__(self, body: bytes, chunk_size: int = 16) -> None:
+        self.chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+        self.sent = 0
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+
+def _client(body: ChunkedBody, headers=None) -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers=headers, stream=body)
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_spec_format_uses_content_type_then_extension():
+    """Test that the spec format comes from the content type, then the URL path, then defaults to JSON."""
+    assert spec_format("https://x.test/spec.yaml", "application/json") == "json"
+    assert spec_format("https://x.test/spec", "application/x-yaml") == "yaml"
+    assert spec_format("https://x.test/spec.YML?v=1", "text/plain") == "yaml"
+    assert spec_format("https://x.test/spec", "") == "json"
+
+
+@pytest.mark.parametrize(
+    "url, body",
+    [("https://x.test/openapi.json", json.dumps(SPEC).encode()), ("https://x.test/openapi.yaml", SPEC_YAML)],
+)
+def test_streamed_spec_is_parsed_with_progress(url, body):
+    """Test that JSON and YAML specs are parsed from a chunked download, reporting progress."""
+    progress = []
+    with _client(ChunkedBody(body), headers={"Content-Length": str(len(body))}) as client:
+        spec = fetch_spec(url, http_client=client, on_progress=lambda *args: progress.append(args))
+
+    assert spec.info.title == "Streamed API"
+    assert progress[-1] == (len(body), len(body))
+    assert [received for received, _ in progress] == sorted(received for received, _ in progress)
+
+
+def test_oversized_spec_is_aborted_early():
+    """Test that a download over max_size stops as soon as it crosses the limit."""
+    body = ChunkedBody(SPEC_YAML * 100)
+    with _client(body) as client, pytest.raises(SpecInvalidError, match="larger than the maximum of 64 bytes"):
+        fetch_spec("https://x.test/openapi.yaml", http_client=client, max_size=64)
+
+    assert body.sent < len(body.chunks)
+
+
+def test_declared_length_over_max_size_is_refused_before_reading():
+    """Test that a Content-Length over max_size is refused without reading the body."""
+    body = ChunkedBody(SPEC_YAML)
+    with _client(body, headers={"Content-Length": str(len(SPEC_YAML))}) as client, pytest.raises(SpecInvalidError):
+        fetch_spec("https://x.test/openapi.yaml", http_client=client, max_size=10)
+
+    assert body.sent == 0
+
+
+def test_malformed_content_length_is_ignored():
+    """Test that an unparsable Content-Length falls back to checking the size of the chunks."""
+    with _client(ChunkedBody(SPEC_YAML), headers={"Content-Length": "lots"}) as client:
+        spec = fetch_spec("https://x.test/openapi.yaml", http_client=client, max_size=len(SPEC_YAML))
+    assert spec.info.title == "Streamed API"
+
+    body = ChunkedBody(SPEC_YAML * 100)
+    with _client(body, headers={"Content-Length": "lots"}) as client, pytest.raises(SpecInvalidError):
+        fetch_spec("https://x.test/openapi.yaml", http_client=client, max_size=64)
+    assert body.sent < len(body.chunks)
+
+
+async def test_async_fetch_streams_and_wraps_errors():
+    """Test that the async fetch parses a chunked body and wraps HTTP errors."""
+    body = ChunkedBody(json.dumps(SPEC).encode())
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, stream=body))
+    ) as client:
+        spec = await fetch_spec_async("https://x.test/openapi", http_client=client, max_size=1024)
+    assert spec.paths == {"/items": {}}
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(404))) as client:
+        with pytest.raises(SpecInvalidError, match="Failed to fetch OpenAPI spec"):
+            await fetch_spec_async("https://x.test/openapi", http_client=client)
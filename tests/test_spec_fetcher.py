@@ -0,0 +1,82 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from tadata_sdk import AsyncSpecFetcher, SpecFetcher
+from tadata_sdk.errors.exceptions import SpecInvalidError
+
+
+def _spec_body(title: str) -> bytes:
+    return json.dumps({"openapi": "3.0.0", "info": {"title": title, "version": "1.0"}, "paths": {}}).encode()
+
+
+class HostCounter:
+    """Records the most requests in flight at once, per host."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active: dict = {}
+        self.peak: dict = {}
+
+    def enter(self, host: str) -> None:
+        with self.lock:
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+
+    def leave(self, host: str) -> None:
+        with self.lock:
+            self.active[host] -= 1
+
+
+def test_fetch_many_limits_connections_per_host():
+    """Test that downloads run concurrently, but never more than the per-host limit against one host."""
+    counter = HostCounter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        counter.enter(request.url.host)
+        time.sleep(0.02)
+        counter.leave(request.url.host)
+        if request.url.path == "/missing.json":
+            return httpx.Response(404)
+        return httpx.Response(200, content=_spec_body(request.url.path.strip("/")))
+
+    urls = [f"https://{host}.test/svc{i}.json" for host in ("a", "b") for i in range(6)]
+    with SpecFetcher(max_connections=6, max_connections_per_host=2, transport=httpx.MockTransport(handler)) as fetcher:
+        results = list(fetcher.fetch_many([*urls, "https://a.test/missing.json"]))
+
+    assert counter.peak == {"a.test": 2, "b.test": 2}
+    assert len(results) == 13
+    titles = {result.spec.info.title for result in results if result.ok and result.spec is not None}
+    assert titles == {f"svc{i}.json" for i in range(6)}
+    (failed,) = [result for result in results if not result.ok]
+    assert failed.url == "https://a.test/missing.json"
+    assert isinstance(failed.error, SpecInvalidError)
+
+
+def test_fetcher_rejects_invalid_limits():
+    """Test that connection limits must be at least 1."""
+    with pytest.raises(ValueError):
+        SpecFetcher(max_connections_per_host=0)
+
+
+async def test_async_fetch_many_yields_as_downloads_finish():
+    """Test that the async fetcher yields specs in completion order and limits each host."""
+    counter = HostCounter()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        counter.enter(request.url.host)
+        await asyncio.sleep(0.05 if request.url.path == "/slow.json" else 0.01)
+        counter.leave(request.url.host)
+        return httpx.Response(200, content=_spec_body(request.url.path.strip("/")))
+
+    urls = ["https://a.test/slow.json", *(f"https://a.test/svc{i}.json" for i in range(4))]
+    async with AsyncSpecFetcher(max_connections_per_host=3, transport=httpx.MockTransport(handler)) as fetcher:
+        results = [result async for result in fetcher.fetch_many(urls)]
+
+    assert all(result.ok for result in results)
+    assert results[-1].url == "https://a.test/slow.json"
+    assert counter.peak == {"a.test": 3}
@@ -0,0 +1,97 @@
+import pytest
+
+from tadata_sdk import OpenAPISpec
+
+
+def _spec() -> OpenAPISpec:
+    return OpenAPISpec.from_dict(
+        {
+            "openapi": "3.0.0",
+            "info": {"title": "Pets", "version": "1.0"},
+            "paths": {
+                "/pets": {
+                    "get": {
+                        "operationId": "listPets",
+                        "tags": ["pets"],
+                        "responses": {
+                            "200": {
+                                "description": "OK",
+                                "content": {
+                                    "application/json": {
+                                        "schema": {"type": "array", "items": {"$ref": "#/components/schemas/Pet"}}
+                                    }
+                                },
+                            }
+                        },
+                    },
+                    "post": {"operationId": "createPet", "tags": ["pets", "admin"], "responses": {}},
+                    "parameters": [{"name": "trace", "in": "header", "required": False}],
+                },
+                "/pets/{id}": {
+                    "get": {
+                        "operationId": "getPet",
+                        "responses": {"200": {"$ref": "#/components/responses/Pet"}},
+                    }
+                },
+            },
+            "components": {
+                "schemas": {"Pet": {"type": "object", "nullable": None}, "a/b~c": {"type": "string"}},
+                "responses": {
+                    "Pet": {
+                        "description": "A pet",
+                        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Pet"}}},
+                    }
+                },
+            },
+        }
+    )
+
+
+def test_pointers_resolve_to_nodes():
+    """Test that containers, leaves, escaped keys, list items and internal refs all resolve."""
+    index = _spec().index
+    assert index.resolve("/paths/~1pets/get/operationId") == "listPets"
+    assert index.resolve("/paths/~1pets/parameters/0/required") is False
+    assert index.resolve("#/components/schemas/Pet") == {"type": "object", "nullable": None}
+    assert index.resolve("/components/schemas/Pet/nullable") is None
+    assert index.resolve("#/components/schemas/a~1b~0c") == {"type": "string"}
+    assert index.resolve("/info/title") == "Pets"
+    assert index.resolve("")["openapi"] == "3.0.0"
+    for missing in ("/paths/~1cats", "/paths/~1pets/parameters/7", "/paths/~1pets/parameters/x", "/nope/deeper"):
+        with pytest.raises(KeyError):
+            index.resolve(missing)
+
+
+def test_operations_tags_and_references():
+    """Test the operationId, tag and reverse-reference tables."""
+    index = _spec().index
+    assert index.operation("getPet") == ("/pets/{id}", "get")
+    assert set(index.operation_ids) == {"listPets", "createPet", "getPet"}
+    assert index.operations_with_tag("pets") == [("/pets", "get"), ("/pets", "post")]
+    assert index.operations_with_tag("missing") == []
+    assert sorted(index.tags) == ["admin", "pets"]
+    assert sorted(index.references_to("#/components/schemas/Pet")) == [
+        "/components/responses/Pet/content/application~1json/schema",
+        "/paths/~1pets/get/responses/200/content/application~1json/schema/items",
+    ]
+    assert index.references_to("/components/responses/Pet") == ["/paths/~1pets~1{id}/get/responses/200"]
+    assert sorted(index.referenced_pointers) == ["/components/responses/Pet", "/components/schemas/Pet"]
+    with pytest.raises(KeyError):
+        index.operation("deletePet")
+
+
+def test_index_is_built_once_and_invalidated_on_mutation():
+    """Test that the index is cached, and rebuilt after assignment or an explicit invalidation."""
+    spec = _spec()
+    index = spec.index
+    assert spec.index is index
+
+    spec.paths = {"/cats": {"get": {"operationId": "listCats", "responses": {}}}}
+    assert spec.index is not index
+    assert spec.index.operation("listCats") == ("/cats", "get")
+
+    index = spec.index
+    spec.paths["/dogs"] = {"get": {"operationId": "listDogs", "responses": {}}}
+    spec.invalidate_index()
+    assert spec.index is not index
+    assert spec.index.operation("listDogs") == ("/dogs", "get")